@@ -0,0 +1,85 @@
+"""
+ベンチマーク用の合成Pythonソースツリーを生成する。
+"""
+import random
+import textwrap
+from pathlib import Path
+
+MODULE_TEMPLATE = '''\
+"""
+{docstring}
+"""
+import os
+import sys
+from typing import List, Optional, Dict
+
+{imports}
+
+
+class {class_name}:
+    """{docstring}"""
+
+    def __init__(self, values: List[int]):
+        self.values = values
+
+{methods}
+'''
+
+METHOD_TEMPLATE = '''\
+    def method_{index}(self, value: Optional[int] = None) -> Dict[str, int]:
+        result = {{}}
+        for i, v in enumerate(self.values):
+            if value is not None and v > value:
+                result[f"key_{{i}}"] = v * {index}
+            else:
+                result[str(i)] = sum(self.values[:i])
+        return result
+'''
+
+
+def generate_corpus(
+    root: Path,
+    packages: int = 10,
+    modules_per_package: int = 100,
+    methods_per_module: int = 20,
+    seed: int = 0,
+) -> Path:
+    """
+    root 以下に packages 個のパッケージを持つソースツリーを生成し、root を返す。
+    """
+    rnd = random.Random(seed)
+    module_names = [
+        (f"pkg{p}", f"mod{m}")
+        for p in range(packages)
+        for m in range(modules_per_package)
+    ]
+
+    for p in range(packages):
+        package_dir = root.joinpath(f"pkg{p}")
+        package_dir.mkdir(parents=True, exist_ok=True)
+        package_dir.joinpath("__init__.py").write_text("")
+
+    for package, module in module_names:
+        imports = []
+        for dest_package, dest_module in rnd.sample(module_names, 8):
+            if dest_package == package:
+                imports.append(f"from .{dest_module} import Mod")
+            else:
+                imports.append(f"from {dest_package}.{dest_module} import Mod")
+        imports.append(f"import {rnd.choice(module_names)[0]}")
+
+        methods = "\n".join(
+            METHOD_TEMPLATE.format(index=i) for i in range(methods_per_module)
+        )
+        docstring = textwrap.fill(" ".join(["lorem ipsum"] * 40), 70)
+
+        root.joinpath(package, module + ".py").write_text(
+            MODULE_TEMPLATE.format(
+                docstring=docstring,
+                imports="\n".join(imports),
+                class_name="Mod",
+                methods=methods,
+            )
+        )
+
+    return root
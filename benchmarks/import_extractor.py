@@ -0,0 +1,119 @@
+"""
+ASTによる抽出(ast)とトークン列による抽出(token)で、import文とクラス定義の抽出時間を比較する。
+
+    $ python -m benchmarks.import_extractor [TARGET_PATH]
+
+TARGET_PATH には標準ライブラリのディレクトリなど、実際のソースツリーを指定する。
+TARGET_PATH がパッケージの場合は、相対インポートを解決できるように親ディレクトリを基準にする。
+省略した場合は合成したソースツリーを利用する。
+ファイルの読み込み時間を含めないよう、全ファイルを読み込んでから計測する。
+UTF-8 で読み込めないファイルは対象外とし、抽出に失敗したファイルの数は errors に出力する。
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from benchmarks.corpus import generate_corpus
+from jig.collector.domain.ast import ImportExtractor
+from jig.collector.domain.collect_error.collect_error import COLLECT_ERRORS
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+
+
+def load_files(target_path: Path) -> List[SourceFile]:
+    root_path = target_path
+    if target_path.joinpath("__init__.py").exists():
+        root_path = target_path.parent
+
+    files = []
+    for path in sorted(target_path.glob("**/*.py")):
+        source_file_path = SourceFilePath(root_path=root_path, file_path=path)
+        if not source_file_path.can_convert_to_module_path:
+            continue
+
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        files.append(
+            SourceFile(
+                source_file_path=source_file_path, size=len(content), content=content
+            )
+        )
+
+    return files
+
+
+def measure(files: List[SourceFile], extractor: ImportExtractor):
+    """:return: (秒数, import文のパスの数, 抽出に失敗したファイルの数)"""
+    import_paths = 0
+    errors = 0
+
+    start = time.perf_counter()
+    for file in files:
+        try:
+            source_code = SourceCode.build(file, extractor=extractor)
+        except COLLECT_ERRORS:
+            errors += 1
+            continue
+        import_paths += len(source_code.import_paths)
+
+    return time.perf_counter() - start, import_paths, errors
+
+
+def run(target_path: Path, largest: int) -> None:
+    files = load_files(target_path)
+    print(f"{len(files)} files, {sum(f.size for f in files) / 1024 / 1024:.1f} MiB")
+    print("extractor\tseconds\timport paths\terrors")
+
+    for extractor in ImportExtractor:
+        elapsed, import_paths, errors = measure(files, extractor)
+        print(f"{extractor.value}\t{elapsed:.3f}\t{import_paths}\t{errors}")
+
+    if largest <= 0:
+        return
+
+    # 大きなファイルごとの抽出時間。5回計測した最小値
+    print()
+    print("file\t" + "\t".join(extractor.value for extractor in ImportExtractor))
+    for file in sorted(files, key=lambda f: f.size, reverse=True)[:largest]:
+        seconds = [
+            min(measure([file], extractor)[0] for _ in range(5))
+            for extractor in ImportExtractor
+        ]
+        print(f"{file.filename}\t" + "\t".join(f"{s:.4f}" for s in seconds))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target_path", nargs="?")
+    parser.add_argument("--methods-per-module", type=int, default=100)
+    parser.add_argument(
+        "--largest",
+        type=int,
+        default=5,
+        help="ファイルごとに計測する大きなファイルの数",
+    )
+    args = parser.parse_args()
+
+    if args.target_path:
+        run(Path(args.target_path), largest=args.largest)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        target_path = generate_corpus(
+            Path(tmp_dir),
+            packages=2,
+            modules_per_package=100,
+            methods_per_module=args.methods_per_module,
+        )
+        run(target_path, largest=args.largest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+通常モードと省メモリモード(lean)で SourceCodeCollector.collect を実行し、
+収集結果を保持したままのピークRSSを比較する。
+
+    $ python -m benchmarks.lean_collection [TARGET_PATH]
+
+TARGET_PATH を省略した場合は合成したソースツリーを利用する。
+各モードは独立したプロセスで計測する。
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_corpus
+
+
+def run(mode: str, target_path: str) -> None:
+    from jig.collector.application import SourceCodeCollector
+
+    target = Path(target_path)
+    start = time.perf_counter()
+    collection = SourceCodeCollector(root_path=target, lean=mode == "lean").collect(
+        target
+    )
+    elapsed = time.perf_counter() - start
+
+    # Linux では KiB 単位
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{mode}\t{len(collection)}\t{elapsed:.2f}\t{max_rss / 1024:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target_path", nargs="?")
+    parser.add_argument("--run", choices=["default", "lean"])
+    args = parser.parse_args()
+
+    if args.run:
+        run(args.run, args.target_path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        target_path = args.target_path or str(generate_corpus(Path(tmp_dir)))
+
+        print("mode\tfiles\tseconds\tpeak RSS (MiB)")
+        for mode in ["default", "lean"]:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.lean_collection"]
+                + ["--run", mode, target_path],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+パーサー(ParserBackend)ごとに、モジュールの読み込み時間と構文解析のスループットを比較する。
+
+    $ python -m benchmarks.parser_backend [TARGET_PATH]
+
+TARGET_PATH を省略した場合は合成したソースツリーを利用する。
+読み込み時間は、パーサーのモジュールをまだ読み込んでいない新しいプロセスで計測する。
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_corpus
+from jig.collector.domain.ast import JigSourceCode
+from jig.collector.domain.ast.parser_backend import build_parser_backend
+
+BACKENDS = ["typed_ast", "ast"]
+
+IMPORT_TIME_SCRIPT = """\
+import time
+from jig.collector.domain.ast.parser_backend import build_parser_backend
+start = time.perf_counter()
+build_parser_backend({spec!r}).ast_module
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import_time(spec: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_TIME_SCRIPT.format(spec=spec)],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    return float(output)
+
+
+def run(target_path: Path) -> None:
+    sources = [(path.name, path.read_text()) for path in target_path.glob("**/*.py")]
+    total_size = sum(len(source) for _, source in sources) / 1024 / 1024
+    print(f"{len(sources)} files, {total_size:.1f} MiB")
+    print("parser\timport (ms)\tparse (s)\tMiB/s")
+
+    for spec in BACKENDS:
+        import_time = measure_import_time(spec)
+
+        backend = build_parser_backend(spec)
+        start = time.perf_counter()
+        for filename, source in sources:
+            JigSourceCode.build(source, filename=filename, backend=backend)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{spec}\t{import_time * 1000:.1f}\t{elapsed:.2f}"
+            f"\t{total_size / elapsed:.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target_path", nargs="?")
+    args = parser.parse_args()
+
+    if args.target_path:
+        run(Path(args.target_path))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run(generate_corpus(Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+インポートパスからモジュールパスへの解決(ImportDependencyCollection.build_module_dependencies)と、
+ModulePath / ImportPath の生成の時間を計測する。
+
+    $ python -m benchmarks.path_resolution
+
+構文解析の時間を含めないよう、依存情報は合成したものを利用する。
+変更の前後で同じコマンドを実行して比較する。
+"""
+import argparse
+import random
+import time
+
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.collector.domain.source_code.source_code_import_dependency import (
+    SourceCodeImportDependency,
+)
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.module_path import ModulePath
+
+
+def generate_module_names(packages: int, modules_per_package: int):
+    return [
+        f"project.package{p}.module{m}"
+        for p in range(packages)
+        for m in range(modules_per_package)
+    ]
+
+
+def generate_dependencies(module_names, imports_per_module: int, seed: int = 0):
+    rand = random.Random(seed)
+
+    dependencies = []
+    for module_name in module_names:
+        import_paths = []
+        for i in range(imports_per_module):
+            target = rand.choice(module_names)
+            kind = i % 3
+            if kind == 0:
+                # import project.package0.module1
+                name = target
+            elif kind == 1:
+                # from project.package0.module1 import Foo
+                name = f"{target}.Class{i}"
+            else:
+                # 解析の範囲外のモジュール
+                name = f"os.path{i % 10}"
+            import_paths.append(ImportPath.from_str(name))
+
+        dependencies.append(
+            SourceCodeImportDependency.build(
+                source_module_path=ModulePath.from_str(module_name),
+                import_paths=import_paths,
+            )
+        )
+
+    return dependencies
+
+
+def measure(label: str, func, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{label}\t{best:.3f}\t{result}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packages", type=int, default=50)
+    parser.add_argument("--modules-per-package", type=int, default=100)
+    parser.add_argument("--imports-per-module", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    module_names = generate_module_names(args.packages, args.modules_per_package)
+    dependencies = generate_dependencies(module_names, args.imports_per_module)
+    collection = ImportDependencyCollection.build(dependencies)
+    import_names = [
+        str(import_path) for dep in dependencies for import_path in dep.import_paths
+    ]
+
+    print(f"{len(module_names)} modules, {len(import_names)} import paths")
+    print("benchmark\tseconds\tresult")
+
+    measure(
+        "resolve",
+        lambda: len(collection.build_module_dependencies()),
+        repeat=args.repeat,
+    )
+    measure(
+        "from_str",
+        lambda: len([ModulePath.from_str(name) for name in import_names]),
+        repeat=args.repeat,
+    )
+    measure(
+        "parent+join",
+        lambda: len(
+            [
+                ModulePath.from_str(name).parent().join("sub").path_in_depth(2)
+                for name in import_names
+            ]
+        ),
+        repeat=args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
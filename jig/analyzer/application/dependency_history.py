@@ -0,0 +1,159 @@
+import dataclasses
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from jig.analyzer.application.dependency_tracker import (
+    DependencyChanges,
+    DependencyTracker,
+)
+from jig.collector.domain.ast import ImportExtractor, JigSourceCode
+from jig.collector.domain.ast.parser_backend import ParserBackend
+from jig.collector.domain.collect_error.collect_error import COLLECT_ERRORS
+from jig.collector.domain.source_code.source_code import SourceCode, parse_source
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+from jig.collector.domain.values.module_path import ModulePath
+from jig.collector.infrastructure.git_repository import (
+    GitBlob,
+    GitCatFile,
+    list_blobs,
+    list_commits,
+    show_prefix,
+)
+from jig.collector.infrastructure.source_decoder import decode_source
+
+
+@dataclasses.dataclass(frozen=True)
+class CommitDependencyChanges:
+    """
+    commit: コミットのオブジェクトID
+    changes: 直前のコミットからの依存関係の変化。最初のコミットでは全ての依存関係が追加として扱われる
+    """
+
+    commit: str
+    changes: DependencyChanges
+
+
+@dataclasses.dataclass
+class DependencyHistory:
+    """
+    git のコミット履歴をたどり、コミットごとのモジュール間の依存関係の変化を求める。
+
+    構文解析の結果はファイルの内容（blob）ごとにキャッシュし、同じ blob を含む全てのコミットで再利用する。
+    隣り合うコミットの間で変更されたファイルだけを依存情報に反映するので、
+    履歴全体のコストは最初のコミットの解析と、変更された blob の解析の合計程度になる。
+    root: リポジトリのトップレベルからの、モジュールパスの基準にするディレクトリ（"/" 区切り）。
+          Noneの場合は repo_path のディレクトリ
+    """
+
+    repo_path: Path
+    root: Optional[str] = None
+    extractor: ImportExtractor = ImportExtractor.AST
+    parser_backend: Optional[ParserBackend] = None
+    # True の場合、マージコミットでは最初の親だけをたどる
+    first_parent: bool = False
+    # blob のオブジェクトID -> 構文解析の結果（解析できない場合は None）
+    _parsed_blobs: Dict[str, Optional[JigSourceCode]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def iter_changes(self, rev_range: str) -> Iterator[CommitDependencyChanges]:
+        """
+        リビジョンの範囲のコミットを古い順にたどり、コミットごとの依存関係の変化を返します。
+        :param rev_range: "v1.0..main" のようなリビジョンの範囲
+        :return:
+        """
+        root = show_prefix(self.repo_path) if self.root is None else self.root
+        root = root.strip("/")
+
+        commits = list_commits(
+            self.repo_path, rev_range, first_parent=self.first_parent
+        )
+        if not commits:
+            return
+
+        tracker = DependencyTracker()
+        previous_blobs: Dict[str, GitBlob] = {}
+
+        with GitCatFile(self.repo_path) as cat_file:
+            for commit in commits:
+                blobs = self._list_source_blobs(commit, root)
+
+                removed: List[ModulePath] = [
+                    _module_path(root, path)
+                    for path in previous_blobs
+                    if path not in blobs
+                ]
+                updated: List[SourceCode] = []
+                for path, blob in blobs.items():
+                    previous_blob = previous_blobs.get(path)
+                    if previous_blob and previous_blob.oid == blob.oid:
+                        continue
+
+                    source_code = self._build_source_code(cat_file, root, blob)
+                    if source_code:
+                        updated.append(source_code)
+                    elif previous_blob:
+                        # 解析できないファイルは、そのコミットには存在しないものとして扱う
+                        removed.append(_module_path(root, path))
+
+                previous_blobs = blobs
+
+                yield CommitDependencyChanges(
+                    commit=commit, changes=tracker.update(updated, removed)
+                )
+
+    def _list_source_blobs(self, commit: str, root: str) -> Dict[str, GitBlob]:
+        blobs = {}
+        for blob in list_blobs(self.repo_path, commit, path=root):
+            if not blob.path.endswith(".py"):
+                continue
+
+            source_file_path = SourceFilePath(
+                root_path=Path(root), file_path=Path(blob.path)
+            )
+            if source_file_path.can_convert_to_module_path:
+                blobs[blob.path] = blob
+
+        return blobs
+
+    def _build_source_code(
+        self, cat_file: GitCatFile, root: str, blob: GitBlob
+    ) -> Optional[SourceCode]:
+        if blob.oid not in self._parsed_blobs:
+            self._parsed_blobs[blob.oid] = self._parse_blob(
+                cat_file.read(blob.oid), filename=Path(blob.path).name
+            )
+
+        jig_source_code = self._parsed_blobs[blob.oid]
+        if jig_source_code is None:
+            return None
+
+        # インポートパスは相対インポートの解決にファイルのパスを使うので、パスごとに組み立てる
+        source_file_path = SourceFilePath(
+            root_path=Path(root), file_path=Path(blob.path)
+        )
+        file = SourceFile(
+            source_file_path=source_file_path, size=blob.size, content=None
+        )
+
+        return SourceCode.build_with_jig_source_code(file, jig_source_code)
+
+    def _parse_blob(self, data: bytes, filename: str) -> Optional[JigSourceCode]:
+        try:
+            jig_source_code = parse_source(
+                source=decode_source(data),
+                filename=filename,
+                extractor=self.extractor,
+                backend=self.parser_backend,
+            )
+        except COLLECT_ERRORS:
+            # 解析できないファイルは、そのコミットでは存在しないものとして扱う
+            return None
+
+        # 履歴全体でキャッシュするので、ASTへの参照は残さない
+        return jig_source_code.without_ast()
+
+
+def _module_path(root: str, path: str) -> ModulePath:
+    return SourceFilePath(root_path=Path(root), file_path=Path(path)).module_path
@@ -0,0 +1,116 @@
+import collections
+import dataclasses
+from typing import Counter, Dict, Iterable, List, Set, Tuple
+
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.values.module_path import ModulePath
+
+
+@dataclasses.dataclass(frozen=True)
+class DependencyChanges:
+    added: List[ModuleDependency] = dataclasses.field(default_factory=list)
+    removed: List[ModuleDependency] = dataclasses.field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.added and not self.removed
+
+
+@dataclasses.dataclass
+class DependencyTracker:
+    """
+    モジュールの追加・変更・削除を受け取り、影響のあるモジュールの依存関係だけを再計算する。
+    """
+
+    import_dependencies: ImportDependencyCollection = dataclasses.field(
+        default_factory=lambda: ImportDependencyCollection(_dependencies={})
+    )
+    _module_dependencies: Dict[str, List[ModuleDependency]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    @property
+    def module_dependencies(self) -> List[ModuleDependency]:
+        dependencies = []
+        for module_dependencies in self._module_dependencies.values():
+            dependencies.extend(module_dependencies)
+
+        return dependencies
+
+    def update(
+        self,
+        updated: Iterable[SourceCode] = (),
+        removed: Iterable[ModulePath] = (),
+    ) -> DependencyChanges:
+        """
+        モジュールの変更を反映して依存情報を更新し、変化した依存関係を返します。
+        :param updated: 追加または変更されたモジュールのソースコード
+        :param removed: 削除されたモジュールのモジュールパス
+        :return:
+        """
+        changed_modules: Set[str] = set()
+        added_module_paths: List[ModulePath] = []
+        removed_module_paths: List[ModulePath] = []
+
+        for module_path in removed:
+            if self.import_dependencies.get_by_module_path(module_path) is None:
+                continue
+
+            self.import_dependencies.remove(module_path)
+            removed_module_paths.append(module_path)
+            changed_modules.add(str(module_path))
+
+        for source_code in updated:
+            module_path = source_code.module_path
+            if self.import_dependencies.get_by_module_path(module_path) is None:
+                added_module_paths.append(module_path)
+
+            self.import_dependencies.put(source_code.build_import_dependency())
+            changed_modules.add(str(module_path))
+
+        # モジュールが増減した場合、それをインポートしているモジュールの依存先の解決結果も変わりうる
+        module_set_changes = added_module_paths + removed_module_paths
+        if module_set_changes:
+            for module_path in self.import_dependencies.list_importing_module_paths(
+                module_set_changes
+            ):
+                changed_modules.add(str(module_path))
+
+        return self._update_module_dependencies(sorted(changed_modules))
+
+    def _update_module_dependencies(self, module_names: List[str]) -> DependencyChanges:
+        added: List[ModuleDependency] = []
+        removed: List[ModuleDependency] = []
+
+        for module_name in module_names:
+            old_dependencies = self._module_dependencies.pop(module_name, [])
+            new_dependencies = self.import_dependencies.build_module_dependencies_of(
+                ModulePath.from_str(module_name)
+            )
+            if new_dependencies:
+                self._module_dependencies[module_name] = new_dependencies
+
+            old_counter = self._count_dependencies(old_dependencies)
+            new_counter = self._count_dependencies(new_dependencies)
+            added.extend(
+                ModuleDependency.from_str(src, dest, count=count)
+                for (src, dest), count in (new_counter - old_counter).items()
+            )
+            removed.extend(
+                ModuleDependency.from_str(src, dest, count=count)
+                for (src, dest), count in (old_counter - new_counter).items()
+            )
+
+        return DependencyChanges(added=added, removed=removed)
+
+    @staticmethod
+    def _count_dependencies(
+        dependencies: List[ModuleDependency],
+    ) -> Counter[Tuple[str, str]]:
+        counter: Counter[Tuple[str, str]] = collections.Counter()
+        for d in dependencies:
+            counter[(str(d.src), str(d.dest))] += d.count
+
+        return counter
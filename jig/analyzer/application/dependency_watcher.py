@@ -0,0 +1,105 @@
+import dataclasses
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from jig.analyzer.application.dependency_tracker import (
+    DependencyChanges,
+    DependencyTracker,
+)
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.collector.application import SourceCodeCollector
+from jig.collector.domain.collect_error.collect_error import COLLECT_ERRORS
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.values.module_path import ModulePath
+
+FileStat = Tuple[int, int]
+
+
+@dataclasses.dataclass
+class DependencyWatcher:
+    """
+    ソースファイルの変更を stat の比較で検出し、変更のあったファイルだけを再解析して
+    依存情報を更新する。
+    """
+
+    collector: SourceCodeCollector
+    target_path: Path
+    tracker: DependencyTracker = dataclasses.field(default_factory=DependencyTracker)
+    _file_stats: Dict[str, FileStat] = dataclasses.field(default_factory=dict)
+    _file_modules: Dict[str, ModulePath] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def start(
+        cls, collector: SourceCodeCollector, target_path: Path
+    ) -> "DependencyWatcher":
+        watcher = cls(collector=collector, target_path=target_path)
+        watcher.poll()
+
+        return watcher
+
+    @property
+    def import_dependencies(self) -> ImportDependencyCollection:
+        return self.tracker.import_dependencies
+
+    @property
+    def module_dependencies(self) -> List[ModuleDependency]:
+        return self.tracker.module_dependencies
+
+    def poll(self) -> DependencyChanges:
+        """
+        前回の呼び出しからのファイルの変更を検出して依存情報を更新し、変化した依存関係を返します。
+        :return:
+        """
+        file_stats = self._scan()
+
+        deleted_files = [path for path in self._file_stats if path not in file_stats]
+        changed_files = [
+            path
+            for path, stat in file_stats.items()
+            if self._file_stats.get(path) != stat
+        ]
+        self._file_stats = file_stats
+
+        if not deleted_files and not changed_files:
+            return DependencyChanges()
+
+        removed_module_paths: List[ModulePath] = []
+        for path in deleted_files:
+            module_path = self._file_modules.pop(path, None)
+            if module_path:
+                removed_module_paths.append(module_path)
+
+        updated_source_codes: List[SourceCode] = []
+        for path in changed_files:
+            try:
+                source_code = self.collector.collect_file(Path(path))
+            except COLLECT_ERRORS:
+                # 編集途中のファイルなどは前回の解析結果のまま扱い、次の変更を待つ
+                continue
+            if not source_code:
+                continue
+
+            self._file_modules[path] = source_code.module_path
+            updated_source_codes.append(source_code)
+
+        return self.tracker.update(
+            updated=updated_source_codes, removed=removed_module_paths
+        )
+
+    def _scan(self) -> Dict[str, FileStat]:
+        if self.target_path.is_dir():
+            # ディレクトリの走査で取得した stat をそのまま利用する
+            return {
+                str(walked_file.path): (walked_file.mtime_ns, walked_file.size)
+                for walked_file in self.collector.walk_source_files(self.target_path)
+            }
+
+        try:
+            stat = os.stat(str(self.target_path))
+        except OSError:
+            # 削除されたファイルは削除として扱う
+            return {}
+
+        return {str(self.target_path): (stat.st_mtime_ns, stat.st_size)}
@@ -0,0 +1,40 @@
+from typing import List
+
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.infrastructure.partial_result import PartialResult, PartialResultError
+from jig.collector.domain.values.shard import Shard
+
+
+def merge_partial_results(results: List[PartialResult]) -> ImportDependencyCollection:
+    """
+    シャードごとに収集した部分結果を1つの依存情報にまとめます。
+    インポートパスはまとめた後の依存情報で解決されるので、シャードをまたぐ依存関係も解決されます。
+    同じ分割数の全てのシャードが1つずつそろっていない場合は PartialResultError を送出します。
+    :param results:
+    :return:
+    """
+    if not results:
+        raise PartialResultError("No partial results are specified.")
+
+    # シャードを指定せずに収集した結果は、1つに分割したうちの1番目として扱う
+    shards = [result.shard or Shard(index=1, count=1) for result in results]
+
+    counts = sorted({shard.count for shard in shards})
+    if len(counts) > 1:
+        raise PartialResultError(f"Shard counts do not match: {counts}")
+
+    indexes = [shard.index for shard in shards]
+    duplicated = sorted({index for index in indexes if indexes.count(index) > 1})
+    if duplicated:
+        raise PartialResultError(f"Shards are specified more than once: {duplicated}")
+
+    missing = sorted(set(range(1, counts[0] + 1)) - set(indexes))
+    if missing:
+        raise PartialResultError(f"Shards are missing: {missing}")
+
+    collection = ImportDependencyCollection(_dependencies={})
+    for result in results:
+        for dependency in result.dependencies:
+            collection.put(dependency)
+
+    return collection
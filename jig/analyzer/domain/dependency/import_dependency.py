@@ -1,7 +1,9 @@
 import dataclasses
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable
 
 from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.analyzer.domain.dependency.module_trie import ModuleTrie
+from jig.collector.domain.source_code.source_code import SourceCode
 from jig.collector.domain.source_code.source_code_collection import SourceCodeCollection
 from jig.collector.domain.source_code.source_code_import_dependency import (
     SourceCodeImportDependency,
@@ -13,6 +15,18 @@ from jig.collector.domain.values.module_path import ModulePath
 @dataclasses.dataclass(frozen=True)
 class ImportDependencyCollection:
     _dependencies: Dict[str, SourceCodeImportDependency]
+    # 解析の範囲外で、存在することだけがわかっているモジュール。インポート先としてだけ扱う
+    _external_modules: Dict[str, ModulePath] = dataclasses.field(default_factory=dict)
+    # 解析したモジュールと範囲外のモジュールの木。インポートパスの解決に利用する
+    _modules: ModuleTrie = dataclasses.field(
+        default_factory=ModuleTrie, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for dependency in self._dependencies.values():
+            self._modules.add(dependency.source_module_path)
+        for module_path in self._external_modules.values():
+            self._modules.add(module_path)
 
     @classmethod
     def build(
@@ -29,43 +43,133 @@ class ImportDependencyCollection:
     def build_from_source_code_collection(
         cls, source_code_collection: SourceCodeCollection
     ) -> "ImportDependencyCollection":
-        return cls.build(
-            dependencies=[
-                source_code.build_import_dependency()
-                for source_code in source_code_collection
-            ]
-        )
+        return cls.build_from_source_codes(source_code_collection)
+
+    @classmethod
+    def build_from_source_codes(
+        cls,
+        source_codes: Iterable[SourceCode],
+        external_module_paths: Iterable[ModulePath] = (),
+    ) -> "ImportDependencyCollection":
+        """
+        ソースコードを1つずつ受け取りながら依存情報を構築します。
+        SourceCodeCollector.iter_collect などのジェネレータを渡すと、ソースコードは依存情報を
+        取り出した後すぐに破棄されるので、ソースコード全体を保持せずに済みます。
+        :param source_codes:
+        :param external_module_paths: 解析の範囲外のモジュール。source_codes を全て受け取った後に追加する
+        :return:
+        """
+        collection = cls(_dependencies={})
+        for source_code in source_codes:
+            collection.put(source_code.build_import_dependency())
+
+        for module_path in external_module_paths:
+            collection.add_external_module(module_path)
+
+        return collection
 
     def get_by_module_path(
         self, module_path: ModulePath
     ) -> Optional[SourceCodeImportDependency]:
         return self._dependencies.get(str(module_path))
 
+    def put(self, dependency: SourceCodeImportDependency) -> None:
+        """
+        依存情報を追加します。同じモジュールの依存情報がすでにある場合は置き換えます。
+        :param dependency:
+        :return:
+        """
+        module_name = str(dependency.source_module_path)
+        if module_name not in self._dependencies:
+            self._modules.add(dependency.source_module_path)
+
+        self._dependencies[module_name] = dependency
+
+    def remove(self, module_path: ModulePath) -> None:
+        removed = self._dependencies.pop(str(module_path), None)
+        if removed is not None:
+            self._modules.remove(removed.source_module_path)
+
+    def add_external_module(self, module_path: ModulePath) -> None:
+        """
+        解析の範囲外のモジュールを追加します。
+        このモジュールからの依存関係は持ちませんが、インポート先としては解決されます。
+        :param module_path:
+        :return:
+        """
+        module_name = str(module_path)
+        if module_name not in self._external_modules:
+            self._modules.add(module_path)
+
+        self._external_modules[module_name] = module_path
+
+    def list_importing_module_paths(
+        self, module_paths: List[ModulePath]
+    ) -> List[ModulePath]:
+        """
+        指定されたモジュール（またはその配下）をインポートしているモジュールのリストを返します。
+        モジュールの追加・削除によって依存先の解決結果が変わりうるモジュールを探すのに利用します。
+        :param module_paths:
+        :return:
+        """
+        module_names = [str(module_path) for module_path in module_paths]
+
+        result = []
+        for dep in self._dependencies.values():
+            if any(
+                import_path.match_module_names(module_names)
+                for import_path in dep.import_paths
+            ):
+                result.append(dep.source_module_path)
+
+        return result
+
     def build_module_dependencies(self) -> List[ModuleDependency]:
         """
         selfで保持しているModulePathからImportPathへの依存情報を
-        ModulePathからModulePathへの依存情報に変換する
+        ModulePathからModulePathへの依存情報に変換する。
+        同じモジュール間の依存関係は、インポートの数(count)を持つ1つの依存関係にまとめる
         """
         dependencies = []
         for dep in self._dependencies.values():
-            src = dep.source_module_path
-            for dest_import_path in dep.import_paths:
-                dest_module_path = self.detect_module_path(import_path=dest_import_path)
-                if dest_module_path:
-                    dependencies.append(
-                        ModuleDependency(src=src, dest=dest_module_path)
-                    )
+            dependencies.extend(self._build_module_dependencies(dep))
 
         return dependencies
 
-    def detect_module_path(self, import_path: ImportPath) -> Optional[ModulePath]:
-        module_path = ModulePath.from_str(str(import_path))
-        if self.get_by_module_path(module_path):
-            return module_path
+    def build_module_dependencies_of(
+        self, module_path: ModulePath
+    ) -> List[ModuleDependency]:
+        """
+        指定されたモジュールからの依存情報だけを ModulePath から ModulePath への依存情報に変換する
+        """
+        dep = self.get_by_module_path(module_path)
+        if not dep:
+            return []
+
+        return self._build_module_dependencies(dep)
 
-        if module_path.depth > 1:
-            parent_path = module_path.parent()
-            if self.get_by_module_path(parent_path):
-                return parent_path
+    def _build_module_dependencies(
+        self, dep: SourceCodeImportDependency
+    ) -> List[ModuleDependency]:
+        # 同じモジュールへのインポートは、インポートの数を持つ1つの依存関係にまとめる
+        counts: Dict[ModulePath, int] = {}
+        for dest_import_path in dep.import_paths:
+            dest_module_path = self.detect_module_path(import_path=dest_import_path)
+            if dest_module_path:
+                counts[dest_module_path] = counts.get(dest_module_path, 0) + 1
 
-        return None
+        src = dep.source_module_path
+        return [
+            ModuleDependency(src=src, dest=dest_module_path, count=count)
+            for dest_module_path, count in counts.items()
+        ]
+
+    def detect_module_path(self, import_path: ImportPath) -> Optional[ModulePath]:
+        """
+        インポートパスの前置のうち、最も長い既知のモジュールを返します。
+        "from a.b import c" で c が a.b の属性の場合や、"import a.b.c.d" で途中のモジュールの
+        ファイルがない場合も、一致する最も長いモジュールに解決します。
+        :param import_path:
+        :return: 一致するモジュールがない場合は None
+        """
+        return self._modules.resolve(import_path)
@@ -5,13 +5,22 @@ from jig.collector.domain.values.module_path import ModulePath
 
 @dataclasses.dataclass(frozen=True)
 class ModuleDependency:
+    """
+    count: src から dest へのインポートの数。"from x import a, b, c" は3として数える
+    """
+
     src: ModulePath
     dest: ModulePath
+    count: int = 1
 
     @classmethod
-    def build(cls, src: ModulePath, dest: ModulePath) -> "ModuleDependency":
-        return cls(src, dest)
+    def build(
+        cls, src: ModulePath, dest: ModulePath, count: int = 1
+    ) -> "ModuleDependency":
+        return cls(src, dest, count)
 
     @classmethod
-    def from_str(cls, src: str, dest: str) -> "ModuleDependency":
-        return cls(src=ModulePath.from_str(src), dest=ModulePath.from_str(dest))
+    def from_str(cls, src: str, dest: str, count: int = 1) -> "ModuleDependency":
+        return cls(
+            src=ModulePath.from_str(src), dest=ModulePath.from_str(dest), count=count
+        )
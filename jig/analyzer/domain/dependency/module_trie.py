@@ -0,0 +1,98 @@
+import dataclasses
+from typing import Dict, List, Optional, Tuple
+
+from jig.collector.domain.values.dotted_path import DottedPath
+from jig.collector.domain.values.module_path import ModulePath
+
+
+@dataclasses.dataclass
+class _ModuleNode:
+    children: Dict[str, "_ModuleNode"] = dataclasses.field(default_factory=dict)
+    # このノードまでの名前がモジュールの場合、そのモジュールパス
+    module_path: Optional[ModulePath] = None
+    # このモジュールを登録した回数。解析したモジュールと範囲外のモジュールの両方で登録されることがある
+    count: int = 0
+
+
+@dataclasses.dataclass
+class ModuleTrie:
+    """
+    モジュールパスを名前ごとの木にまとめて保持し、インポートパスをモジュールに解決する。
+
+    インポートパスの名前を先頭から1回たどるだけで、前置として一致する最も長いモジュールを求められる。
+    """
+
+    _root: _ModuleNode = dataclasses.field(default_factory=_ModuleNode)
+
+    def add(self, module_path: ModulePath) -> None:
+        node = self._root
+        for name in module_path.names:
+            child = node.children.get(name)
+            if child is None:
+                child = _ModuleNode()
+                node.children[name] = child
+            node = child
+
+        node.count += 1
+        if node.module_path is None:
+            node.module_path = module_path
+
+    def remove(self, module_path: ModulePath) -> None:
+        """
+        add で登録したモジュールを1回分取り除きます。登録されていない場合は何もしません。
+        :param module_path:
+        :return:
+        """
+        # (親ノード, 名前) のリスト。モジュールがなくなった場合に、不要になったノードを末端から取り除く
+        visited: List[Tuple[_ModuleNode, str]] = []
+        node = self._root
+        for name in module_path.names:
+            child = node.children.get(name)
+            if child is None:
+                return
+            visited.append((node, name))
+            node = child
+
+        if node.count == 0:
+            return
+
+        node.count -= 1
+        if node.count > 0:
+            return
+
+        node.module_path = None
+        for parent, name in reversed(visited):
+            child = parent.children[name]
+            if child.children or child.count > 0:
+                break
+            del parent.children[name]
+
+    def __contains__(self, module_path: ModulePath) -> bool:
+        node: Optional[_ModuleNode] = self._root
+        for name in module_path.names:
+            assert node is not None
+            node = node.children.get(name)
+            if node is None:
+                return False
+
+        assert node is not None
+        return node.count > 0
+
+    def resolve(self, path: DottedPath) -> Optional[ModulePath]:
+        """
+        パスの前置のうち、登録されている最も長いモジュールのモジュールパスを返します。
+        "a.b.c.d" に対して "a.b" だけが登録されている場合は "a.b" を返します。
+        :param path: インポートパスなど
+        :return: 一致するモジュールがない場合は None
+        """
+        result = None
+        node = self._root
+        for name in path.names:
+            child = node.children.get(name)
+            if child is None:
+                break
+            node = child
+            if node.module_path is not None:
+                result = node.module_path
+
+        return result
@@ -0,0 +1,102 @@
+"""
+分割して収集した依存情報（部分結果）をファイルに保存・読み込みする。
+
+部分結果にはインポートパスを解決する前の依存情報を保存する。
+インポートパスからモジュールへの解決には全体のモジュールの集合が必要なので、
+全ての部分結果をまとめた後で行う。
+"""
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from jig.collector.domain.source_code.source_code_import_dependency import (
+    SourceCodeImportDependency,
+)
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.module_path import ModulePath
+from jig.collector.domain.values.shard import Shard
+
+# 保存形式を変更した場合はこの値を上げる
+PARTIAL_RESULT_FORMAT_VERSION = 1
+
+
+class PartialResultError(Exception):
+    """部分結果を読み込めない、またはまとめられない場合の例外"""
+
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class PartialResult:
+    """
+    shard: 収集したシャード。Noneの場合は全てのファイルを収集した結果
+    """
+
+    shard: Optional[Shard]
+    dependencies: List[SourceCodeImportDependency]
+
+
+def save_partial_result(
+    path: Path,
+    dependencies: Iterable[SourceCodeImportDependency],
+    shard: Optional[Shard] = None,
+) -> None:
+    """
+    部分結果をJSONで保存します。
+    :param path:
+    :param dependencies: インポートパスを解決する前の依存情報
+    :param shard:
+    :return:
+    """
+    entry = {
+        "version": PARTIAL_RESULT_FORMAT_VERSION,
+        "shard": str(shard) if shard else None,
+        "dependencies": [
+            {
+                "module": str(dependency.source_module_path),
+                "import_paths": [
+                    import_path.names for import_path in dependency.import_paths
+                ],
+            }
+            for dependency in dependencies
+        ],
+    }
+
+    with open(str(path), "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False)
+
+
+def load_partial_result(path: Path) -> PartialResult:
+    """
+    保存した部分結果を読み込みます。
+    :param path:
+    :return:
+    """
+    try:
+        with open(str(path), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError) as e:
+        raise PartialResultError(f"Cannot read the partial result {path}: {e}") from e
+
+    if not isinstance(entry, dict):
+        raise PartialResultError(f"Invalid partial result {path}")
+    if entry.get("version") != PARTIAL_RESULT_FORMAT_VERSION:
+        raise PartialResultError(f"Unsupported partial result format: {path}")
+
+    try:
+        shard = Shard.from_str(entry["shard"]) if entry["shard"] else None
+        dependencies = [
+            SourceCodeImportDependency.build(
+                source_module_path=ModulePath.from_str(dependency["module"]),
+                import_paths=[
+                    ImportPath.from_names(names) for names in dependency["import_paths"]
+                ],
+            )
+            for dependency in entry["dependencies"]
+        ]
+    except (KeyError, TypeError, ValueError) as e:
+        raise PartialResultError(f"Invalid partial result {path}: {e}") from e
+
+    return PartialResult(shard=shard, dependencies=dependencies)
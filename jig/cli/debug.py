@@ -20,8 +20,9 @@ class Main:
         :param root_path: 解析対象Pythonコードのルートディレクトリパス
         :return:
         """
+        # モジュール名だけを表示するので、ファイルの読み込みと構文解析は行わない
         source_codes = self._collect_source_codes(
-            target_path=target_path, root_path=root_path
+            target_path=target_path, root_path=root_path, lazy=True
         )
         for source_code in source_codes:
             print(str(source_code.module_path))
@@ -70,13 +71,13 @@ class Main:
         print(source_codes)
 
     def _collect_source_codes(
-        self, target_path: str, root_path: Optional[str]
+        self, target_path: str, root_path: Optional[str], lazy: bool = False
     ) -> List[SourceCode]:
         if not root_path:
             root_path = os.getcwd()
 
         return list(
-            SourceCodeCollector(root_path=Path(root_path)).collect(
+            SourceCodeCollector(root_path=Path(root_path), lazy=lazy).collect(
                 target_path=Path(target_path)
             )
         )
@@ -1,29 +1,81 @@
 import dataclasses
+from pathlib import Path
+from typing import Optional, List
 
-from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
-from jig.cli.main import _collect_source_codes
+from graphviz import Digraph
+
+from jig.analyzer.application.dependency_watcher import DependencyWatcher
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.cli.main import _build_import_dependencies, _build_collector
 from jig.visualizer.module_dependency.domain.model.graph import Graph
-from jig.visualizer.module_dependency.domain.model.master_graph import MasterGraph
+from jig.visualizer.application.master_graph_builder import MasterGraphBuilder
+from jig.visualizer.module_dependency.domain.value.module_edge import ModuleEdge
 from jig.visualizer.module_dependency.presentation.controller.graph_controller import (
     GraphController,
 )
 
 
+def _to_edges(dependencies: List[ModuleDependency]) -> List[ModuleEdge]:
+    return MasterGraphBuilder().to_edges(dependencies)
+
+
+@dataclasses.dataclass(frozen=True)
+class WatchingGraphController(GraphController):
+    """
+    描画のたびにソースコードの変更を確認し、変更があればグラフに反映するGraphController。
+    """
+
+    watcher: DependencyWatcher
+
+    def refresh(self) -> "WatchingGraphController":
+        changes = self.watcher.poll()
+        if not changes.is_empty:
+            self.graph.apply_master_graph_changes(
+                added_edges=_to_edges(changes.added),
+                removed_edges=_to_edges(changes.removed),
+            )
+        return self
+
+    def render(self) -> Digraph:
+        self.refresh()
+        return super().render()
+
+
 @dataclasses.dataclass
 class Jig:
     @classmethod
-    def analyze_module_dependency(cls, project_root_path: str) -> GraphController:
-        source_codes = _collect_source_codes(project_root_path=project_root_path)
-
-        collection = ImportDependencyCollection.build_from_source_code_collection(
-            source_codes
+    def analyze_module_dependency(
+        cls,
+        project_root_path: str,
+        workers: int = 1,
+        cache_dir: Optional[str] = None,
+    ) -> GraphController:
+        collection = _build_import_dependencies(
+            project_root_path=project_root_path, workers=workers, cache_dir=cache_dir
         )
-        dependencies = collection.build_module_dependencies()
-        dependency_tuples = []
-        for dependency in dependencies:
-            dependency_tuples.append((str(dependency.src), str(dependency.dest)))
-
-        master_graph = MasterGraph.from_tuple_list(dependency_tuples)
+        master_graph = MasterGraphBuilder.build_from_import_dependencies(collection)
         graph = Graph(master_graph=master_graph)
 
         return GraphController(graph=graph)
+
+    @classmethod
+    def watch(
+        cls, project_root_path: str, cache_dir: Optional[str] = None
+    ) -> WatchingGraphController:
+        """
+        指定されたディレクトリ以下を解析し、ファイルの変更を反映し続けるGraphControllerを返します。
+        グラフを描画するたびに変更のあったファイルだけを再解析し、変化した依存関係だけをグラフに反映します。
+        :param project_root_path: 解析対象プロジェクトのプロジェクトルートパス
+        :param cache_dir: 構文解析結果のキャッシュディレクトリ
+        :return:
+        """
+        watcher = DependencyWatcher.start(
+            collector=_build_collector(project_root_path, cache_dir=cache_dir),
+            target_path=Path(project_root_path),
+        )
+
+        builder = MasterGraphBuilder()
+        builder.add_dependencies(watcher.module_dependencies)
+        graph = Graph(master_graph=builder.build())
+
+        return WatchingGraphController(graph=graph, watcher=watcher)
@@ -1,43 +1,482 @@
+import json
+import sys
+import time
 from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union, Sequence
 
 import fire
 
+from jig.analyzer.application.dependency_history import DependencyHistory
+from jig.analyzer.application.dependency_watcher import DependencyWatcher
+from jig.analyzer.application.partial_result_merger import merge_partial_results
 from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.analyzer.infrastructure.partial_result import (
+    load_partial_result,
+    save_partial_result,
+)
 from jig.collector.application import SourceCodeCollector
-from jig.collector.domain.source_code.source_code_collection import SourceCodeCollection
+from jig.collector.application.archive_source_code_collector import (
+    ArchiveSourceCodeCollector,
+)
+from jig.collector.application.git_revision_source_code_collector import (
+    GitRevisionSourceCodeCollector,
+)
+from jig.collector.domain.ast.parser_backend import AUTO, build_parser_backend
+from jig.collector.domain.collect_error.collect_error_report import (
+    CollectErrorReport,
+)
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.values.module_path import ModulePath
+from jig.collector.domain.values.module_scope import ModuleScope
+from jig.collector.domain.values.shard import Shard
+from jig.collector.infrastructure.archive import is_archive
+from jig.collector.infrastructure.manifest import load_manifest
+from jig.collector.infrastructure.parse_cache import ParseCache
+from jig.collector.infrastructure.source_file_walker import DEFAULT_EXCLUDES
 from jig.visualizer.application import ModuleDependencyVisualizer
 
+ExcludeOption = Union[None, str, Sequence[str]]
 
-def _collect_source_codes(project_root_path: str) -> SourceCodeCollection:
-    return SourceCodeCollector(root_path=Path(project_root_path)).collect(
-        target_path=Path(project_root_path)
+
+def _build_excludes(exclude: ExcludeOption) -> Tuple[str, ...]:
+    return DEFAULT_EXCLUDES + tuple(_split_option(exclude))
+
+
+def _split_option(value: ExcludeOption) -> List[str]:
+    # fire からはカンマ区切りの文字列、またはリストで渡される
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+
+    return [item.strip() for item in value if item.strip()]
+
+
+def _build_scope(
+    include_modules: ExcludeOption, exclude_modules: ExcludeOption
+) -> Optional[ModuleScope]:
+    includes = _split_option(include_modules)
+    excludes = _split_option(exclude_modules)
+    if not includes and not excludes:
+        return None
+
+    return ModuleScope.build(includes=includes, excludes=excludes)
+
+
+def _build_collector(
+    project_root_path: str,
+    cache_dir: Optional[str] = None,
+    parser: str = AUTO,
+    exclude: ExcludeOption = None,
+    read_concurrency: int = 1,
+    shard: Optional[Shard] = None,
+    scope: Optional[ModuleScope] = None,
+    deduplicate: bool = False,
+) -> SourceCodeCollector:
+    parse_cache = ParseCache(cache_dir=Path(cache_dir)) if cache_dir else None
+    return SourceCodeCollector(
+        root_path=Path(project_root_path),
+        parse_cache=parse_cache,
+        parser_backend=build_parser_backend(parser),
+        excludes=_build_excludes(exclude),
+        read_concurrency=read_concurrency,
+        shard=shard,
+        scope=scope,
+        deduplicate=deduplicate,
     )
 
 
-def output_dependency_images(project_root_path, output_dir="output"):
+def _build_import_dependencies(
+    project_root_path: str,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    parser: str = AUTO,
+    exclude: ExcludeOption = None,
+    manifest: Optional[str] = None,
+    revision: Optional[str] = None,
+    errors: Optional[CollectErrorReport] = None,
+    read_concurrency: int = 1,
+    scope: Optional[ModuleScope] = None,
+    deduplicate: bool = False,
+) -> ImportDependencyCollection:
+    external_modules: List[ModulePath] = []
+    return ImportDependencyCollection.build_from_source_codes(
+        _iter_source_codes(
+            project_root_path=project_root_path,
+            workers=workers,
+            cache_dir=cache_dir,
+            parser=parser,
+            exclude=exclude,
+            manifest=manifest,
+            revision=revision,
+            errors=errors,
+            read_concurrency=read_concurrency,
+            scope=scope,
+            external_modules=external_modules,
+            deduplicate=deduplicate,
+        ),
+        external_module_paths=external_modules,
+    )
+
+
+def _iter_source_codes(
+    project_root_path: str,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    parser: str = AUTO,
+    exclude: ExcludeOption = None,
+    manifest: Optional[str] = None,
+    revision: Optional[str] = None,
+    errors: Optional[CollectErrorReport] = None,
+    read_concurrency: int = 1,
+    shard: Optional[Shard] = None,
+    scope: Optional[ModuleScope] = None,
+    external_modules: Optional[List[ModulePath]] = None,
+    deduplicate: bool = False,
+) -> Iterator[SourceCode]:
+    if shard and (revision or is_archive(Path(project_root_path))):
+        raise ValueError("Sharding is supported only for directories and manifests.")
+    if scope and (revision or is_archive(Path(project_root_path))):
+        raise ValueError(
+            "Module scope is supported only for directories and manifests."
+        )
+
+    if revision:
+        revision_collector = GitRevisionSourceCodeCollector(
+            repo_path=Path(project_root_path),
+            # fire は "1.0" のようなタグ名を数値に変換するので文字列に戻す
+            revision=str(revision),
+            parser_backend=build_parser_backend(parser),
+        )
+        return revision_collector.iter_collect(errors=errors)
+
+    if is_archive(Path(project_root_path)):
+        archive_collector = ArchiveSourceCodeCollector(
+            archive_path=Path(project_root_path),
+            parser_backend=build_parser_backend(parser),
+        )
+        return archive_collector.iter_collect(errors=errors)
+
+    collector = _build_collector(
+        project_root_path,
+        cache_dir=cache_dir,
+        parser=parser,
+        exclude=exclude,
+        read_concurrency=read_concurrency,
+        shard=shard,
+        scope=scope,
+        deduplicate=deduplicate,
+    )
+
+    if manifest:
+        return collector.iter_collect_files(
+            load_manifest(manifest, base_path=Path(project_root_path)),
+            workers=workers,
+            errors=errors,
+            external_modules=external_modules,
+        )
+
+    return collector.iter_collect(
+        target_path=Path(project_root_path),
+        workers=workers,
+        errors=errors,
+        external_modules=external_modules,
+    )
+
+
+def _report_errors(errors: CollectErrorReport, error_report: Optional[str]) -> None:
+    for error in errors:
+        print(f"{error.path}: {error.phase.value}: {error.message}", file=sys.stderr)
+
+    if error_report:
+        records = [
+            {"path": error.path, "phase": error.phase.value, "message": error.message}
+            for error in errors
+        ]
+        with open(error_report, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+
+
+def _output_images(dependencies: List[ModuleDependency], output_dir: str) -> None:
+    visualizer = ModuleDependencyVisualizer(dependencies=dependencies)
+    for depth in range(1, 8):
+        visualizer.visualize(depth=depth, output_dir=output_dir)
+        visualizer.render_dot_text(depth=depth, output_dir=output_dir)
+
+
+def output_dependency_images(
+    project_root_path,
+    output_dir="output",
+    workers=1,
+    cache_dir=None,
+    parser=AUTO,
+    exclude=None,
+    manifest=None,
+    revision=None,
+    tolerant=False,
+    error_report=None,
+    read_concurrency=1,
+    include_modules=None,
+    exclude_modules=None,
+    deduplicate=False,
+):
     """
     指定されたディレクトリ以下を解析し、その結果を出力ディレクトリに出力します。
     :param project_root_path: 解析対象プロジェクトのプロジェクトルートパスを指定します。
+                              zip, wheel, tar.gz などのアーカイブを指定した場合は、展開せずに解析します。
     :param output_dir: 解析結果の出力ディレクトリを指定します（デフォルト: output）
+    :param workers: ソースコードの解析に使うプロセス数を指定します（デフォルト: 1）
+    :param cache_dir: 構文解析結果のキャッシュディレクトリを指定します（デフォルト: キャッシュしない）
+    :param parser: 構文解析に利用するパーサーを指定します。
+                   auto, typed_ast, ast, ast:3.7 のように指定します（デフォルト: auto）
+    :param exclude: 解析の対象から除外するパスを .gitignore 形式のパターンで指定します。
+                    複数指定する場合はカンマで区切ります。.git や __pycache__、
+                    プロジェクトルート直下の venv, build, dist などと、.gitignore に一致するパスは常に除外されます。
+    :param manifest: 解析対象のファイルの一覧を指定します。ディレクトリを走査せずに一覧のファイルだけを解析します。
+                     一覧のファイルのパス、標準入力から読む場合は -、
+                     git ls-files '*.py' の結果を使う場合は git を指定します（デフォルト: ディレクトリを走査する）
+    :param revision: 解析する git のリビジョン（ブランチ名、タグ名など）を指定します。
+                     チェックアウトせずにリビジョンのファイルを解析します（デフォルト: 作業ツリーを解析する）
+    :param tolerant: 構文エラーなどで解析できないファイルがあっても中断せず、残りのファイルを解析します。
+                     解析できなかったファイルは標準エラー出力に出力します（デフォルト: False）
+    :param error_report: 解析できなかったファイルの一覧（パス、処理、メッセージ）を JSON で出力するファイルを指定します。
+                         指定した場合は tolerant を指定しなくても寛容モードで解析します（デフォルト: 出力しない）
+    :param read_concurrency: ファイルの読み込みを同時に実行する数を指定します。
+                             NFS などの読み込みが遅いファイルシステムでは、大きくすると速くなります（デフォルト: 1）
+    :param include_modules: 解析するモジュールを jig.collector のようにモジュールパスの前置で指定します。
+                            複数指定する場合はカンマで区切ります。範囲外のモジュールのファイルは読み込まず、
+                            インポート先としてだけ出力します（デフォルト: 全てのモジュール）
+    :param exclude_modules: 解析しないモジュールをモジュールパスの前置で指定します。
+                            include_modules と重なる場合は、より長い前置の指定に従います（デフォルト: なし）
+    :param deduplicate: 内容が同じファイルを1回だけ構文解析します。
+                        同じライブラリのコピーを多く含む場合に速くなります（デフォルト: False）
     :return:
     """
+    errors = CollectErrorReport() if tolerant or error_report else None
+    collection = _build_import_dependencies(
+        project_root_path=project_root_path,
+        workers=workers,
+        cache_dir=cache_dir,
+        parser=parser,
+        exclude=exclude,
+        manifest=manifest,
+        revision=revision,
+        errors=errors,
+        read_concurrency=read_concurrency,
+        scope=_build_scope(include_modules, exclude_modules),
+        deduplicate=deduplicate,
+    )
+    if errors is not None:
+        _report_errors(errors, error_report=error_report)
 
-    for depth in range(1, 8):
-        source_codes = _collect_source_codes(project_root_path=project_root_path)
+    _output_images(collection.build_module_dependencies(), output_dir=output_dir)
 
-        collection = ImportDependencyCollection.build_from_source_code_collection(
-            source_codes
-        )
-        dependencies = collection.build_module_dependencies()
 
-        visualizer = ModuleDependencyVisualizer(dependencies=dependencies)
+def collect(
+    project_root_path,
+    output="partial.json",
+    shard=None,
+    workers=1,
+    cache_dir=None,
+    parser=AUTO,
+    exclude=None,
+    manifest=None,
+    tolerant=False,
+    error_report=None,
+    read_concurrency=1,
+    deduplicate=False,
+):
+    """
+    指定されたディレクトリ以下を解析し、インポートパスを解決する前の依存情報（部分結果）をファイルに出力します。
+    --shard で解析を複数のプロセスやマシンに分割し、merge でまとめて解析結果を出力します。
+    :param project_root_path: 解析対象プロジェクトのプロジェクトルートパスを指定します。
+    :param output: 部分結果の出力ファイルを指定します（デフォルト: partial.json）
+    :param shard: 解析するシャードを 1/4 のように指定します。
+                  ファイルはプロジェクトルートからの相対パスのハッシュ値で分割されます（デフォルト: 全てのファイル）
+    :param workers: ソースコードの解析に使うプロセス数を指定します（デフォルト: 1）
+    :param cache_dir: 構文解析結果のキャッシュディレクトリを指定します（デフォルト: キャッシュしない）
+    :param parser: 構文解析に利用するパーサーを指定します。
+                   auto, typed_ast, ast, ast:3.7 のように指定します（デフォルト: auto）
+    :param exclude: 解析の対象から除外するパスを .gitignore 形式のパターンで指定します。
+                    複数指定する場合はカンマで区切ります。.git や __pycache__、
+                    プロジェクトルート直下の venv, build, dist などと、.gitignore に一致するパスは常に除外されます。
+    :param manifest: 解析対象のファイルの一覧を指定します。ディレクトリを走査せずに一覧のファイルだけを解析します。
+                     一覧のファイルのパス、標準入力から読む場合は -、
+                     git ls-files '*.py' の結果を使う場合は git を指定します（デフォルト: ディレクトリを走査する）
+    :param tolerant: 構文エラーなどで解析できないファイルがあっても中断せず、残りのファイルを解析します。
+                     解析できなかったファイルは標準エラー出力に出力します（デフォルト: False）
+    :param error_report: 解析できなかったファイルの一覧（パス、処理、メッセージ）を JSON で出力するファイルを指定します。
+                         指定した場合は tolerant を指定しなくても寛容モードで解析します（デフォルト: 出力しない）
+    :param read_concurrency: ファイルの読み込みを同時に実行する数を指定します。
+                             NFS などの読み込みが遅いファイルシステムでは、大きくすると速くなります（デフォルト: 1）
+    :param deduplicate: 内容が同じファイルを1回だけ構文解析します。
+                        同じライブラリのコピーを多く含む場合に速くなります（デフォルト: False）
+    :return:
+    """
+    target_shard = Shard.from_str(str(shard)) if shard else None
+    errors = CollectErrorReport() if tolerant or error_report else None
+
+    source_codes = _iter_source_codes(
+        project_root_path=project_root_path,
+        workers=workers,
+        cache_dir=cache_dir,
+        parser=parser,
+        exclude=exclude,
+        manifest=manifest,
+        errors=errors,
+        read_concurrency=read_concurrency,
+        shard=target_shard,
+        deduplicate=deduplicate,
+    )
+    save_partial_result(
+        Path(output),
+        dependencies=(
+            source_code.build_import_dependency() for source_code in source_codes
+        ),
+        shard=target_shard,
+    )
+    if errors is not None:
+        _report_errors(errors, error_report=error_report)
+
+
+def merge(*partial_results, output_dir="output"):
+    """
+    collect で出力した部分結果をまとめて解析し、その結果を出力ディレクトリに出力します。
+    インポートパスはまとめた後の全てのモジュールを使って解決します。
+    :param partial_results: 部分結果のファイルを指定します。同じ分割数の全てのシャードが必要です。
+    :param output_dir: 解析結果の出力ディレクトリを指定します（デフォルト: output）
+    :return:
+    """
+    collection = merge_partial_results(
+        [load_partial_result(Path(path)) for path in partial_results]
+    )
+    _output_images(collection.build_module_dependencies(), output_dir=output_dir)
+
+
+def watch(
+    project_root_path,
+    output_dir="output",
+    interval=1.0,
+    cache_dir=None,
+    parser=AUTO,
+    exclude=None,
+):
+    """
+    指定されたディレクトリ以下を監視し、ファイルが変更されるたびに解析結果を更新して出力します。
+    変更のあったファイルだけを再解析し、依存関係が変化した深さの出力だけを更新します。
+    :param project_root_path: 解析対象プロジェクトのプロジェクトルートパスを指定します。
+    :param output_dir: 解析結果の出力ディレクトリを指定します（デフォルト: output）
+    :param interval: ファイルの変更を確認する間隔（秒）を指定します（デフォルト: 1.0）
+    :param cache_dir: 構文解析結果のキャッシュディレクトリを指定します（デフォルト: キャッシュしない）
+    :param parser: 構文解析に利用するパーサーを指定します。
+                   auto, typed_ast, ast, ast:3.7 のように指定します（デフォルト: auto）
+    :param exclude: 解析の対象から除外するパスを .gitignore 形式のパターンで指定します。
+                    複数指定する場合はカンマで区切ります。.git や __pycache__、
+                    プロジェクトルート直下の venv, build, dist などと、.gitignore に一致するパスは常に除外されます。
+    :return:
+    """
+    watcher = DependencyWatcher.start(
+        collector=_build_collector(
+            project_root_path, cache_dir=cache_dir, parser=parser, exclude=exclude
+        ),
+        target_path=Path(project_root_path),
+    )
+
+    visualizer = ModuleDependencyVisualizer(dependencies=watcher.module_dependencies)
+    for depth in range(1, 8):
         visualizer.visualize(depth=depth, output_dir=output_dir)
         visualizer.render_dot_text(depth=depth, output_dir=output_dir)
 
+    try:
+        while True:
+            time.sleep(interval)
+
+            changes = watcher.poll()
+            if changes.is_empty:
+                continue
+
+            for dep in changes.added:
+                print(f"+ {dep.src} -> {dep.dest}")
+            for dep in changes.removed:
+                print(f"- {dep.src} -> {dep.dest}")
+
+            depths = visualizer.update(added=changes.added, removed=changes.removed)
+            for depth in depths:
+                visualizer.visualize(depth=depth, output_dir=output_dir)
+                visualizer.render_dot_text(depth=depth, output_dir=output_dir)
+    except KeyboardInterrupt:
+        pass
+
+
+def history(
+    rev_range,
+    project_root_path=".",
+    parser=AUTO,
+    first_parent=False,
+    output_format="text",
+):
+    """
+    git のコミット履歴をたどり、コミットごとのモジュール間の依存関係の追加・削除を出力します。
+    同じ内容のファイルは履歴全体で1回だけ解析し、コミット間で変更されたファイルだけを反映します。
+    :param rev_range: 対象のコミットの範囲を v1.0..main のように指定します。
+    :param project_root_path: 解析対象プロジェクトのプロジェクトルートパスを指定します（デフォルト: .）
+    :param parser: 構文解析に利用するパーサーを指定します。
+                   auto, typed_ast, ast, ast:3.7 のように指定します（デフォルト: auto）
+    :param first_parent: マージコミットでは最初の親だけをたどります（デフォルト: False）
+    :param output_format: 出力形式を text または json（1行に1コミット）で指定します（デフォルト: text）
+    :return:
+    """
+    dependency_history = DependencyHistory(
+        repo_path=Path(project_root_path),
+        parser_backend=build_parser_backend(parser),
+        first_parent=first_parent,
+    )
+
+    # fire は "1.0" のようなタグ名を数値に変換するので文字列に戻す
+    for commit_changes in dependency_history.iter_changes(str(rev_range)):
+        changes = commit_changes.changes
+        if changes.is_empty:
+            continue
+
+        if output_format == "json":
+            record = {
+                "commit": commit_changes.commit,
+                "added": [[str(dep.src), str(dep.dest)] for dep in changes.added],
+                "removed": [[str(dep.src), str(dep.dest)] for dep in changes.removed],
+            }
+            print(json.dumps(record))
+            continue
+
+        print(f"commit {commit_changes.commit}")
+        for dep in changes.added:
+            print(f"+ {dep.src} -> {dep.dest}")
+        for dep in changes.removed:
+            print(f"- {dep.src} -> {dep.dest}")
+
+
+COMMANDS = {
+    "watch": watch,
+    "history": history,
+    "collect": collect,
+    "merge": merge,
+}
+
 
 def main():
+    """
+    jig-py: 依存関係の画像を出力します。
+    最初の引数は常に解析対象のパスとして扱うので、サブコマンドと同じ名前のディレクトリも指定できます。
+    """
     fire.Fire(output_dependency_images)
 
 
+def tools():
+    """
+    jig-py-tools: watch, history, collect, merge のサブコマンドを実行します。
+    """
+    fire.Fire(COMMANDS)
+
+
 if __name__ == "__main__":
     main()
@@ -1,57 +1,660 @@
 import dataclasses
 import os
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Iterator, Tuple
 
+from jig.collector.domain.ast import ImportExtractor, NodeExtractorFactory
+from jig.collector.domain.collect_error.collect_error import (
+    COLLECT_ERRORS,
+    CollectError,
+    CollectPhase,
+)
+from jig.collector.domain.collect_error.collect_error_report import (
+    CollectErrorReport,
+)
+from jig.collector.domain.ast.parser_backend import ParserBackend
 from jig.collector.domain.source_code.source_code_collection import SourceCodeCollection
 from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.source_code.lazy_source_code import LazySourceCode
+from jig.collector.domain.source_code.parsed_source_cache import ParsedSourceCache
+from jig.collector.domain.source_code.source_code_facts import SourceCodeFacts
+from jig.collector.domain.source_file.lazy_source_file import LazySourceFile
 from jig.collector.domain.source_file.source_file import SourceFile
 from jig.collector.domain.source_file.source_file_path import SourceFilePath
+from jig.collector.domain.values.module_path import ModulePath
+from jig.collector.domain.values.module_scope import ModuleScope
+from jig.collector.domain.values.shard import Shard
+from jig.collector.infrastructure.parse_cache import ParseCache
+from jig.collector.infrastructure.prefetch import prefetch
+from jig.collector.infrastructure.source_decoder import decode_source
+from jig.collector.infrastructure.source_file_walker import (
+    DEFAULT_EXCLUDES,
+    SourceFileWalker,
+    WalkedFile,
+)
+
+# 1チャンクあたりのファイル数の上限。
+# 小さすぎるとプロセス間通信のオーバーヘッドが、大きすぎると負荷の偏りが目立つ。
+MAX_CHUNK_SIZE = 64
+
+# 読み込んだファイル (内容, ファイルサイズ, mtime_ns)
+FileData = Tuple[bytes, int, int]
+
+# ワーカープロセスから返す解析結果 (ファイルサイズ, 抽出結果)
+ParsedFile = Tuple[int, SourceCodeFacts]
 
 
 @dataclasses.dataclass(frozen=True)
 class SourceCodeCollector:
     root_path: Path
+    parse_cache: Optional[ParseCache] = None
+    # True の場合、抽出した情報だけを残してASTとソースコード本文を破棄する（省メモリモード）
+    lean: bool = False
+    extractor: ImportExtractor = ImportExtractor.AST
+    # 構文解析に利用するパーサー。Noneの場合は実行中のPythonに合わせて選択する
+    parser_backend: Optional[ParserBackend] = None
+    # ディレクトリを収集するときに除外するパス（.gitignore 形式、収集対象のディレクトリが基準）
+    excludes: Tuple[str, ...] = DEFAULT_EXCLUDES
+    # True の場合、ディレクトリ内の .gitignore に一致するパスも除外する。
+    # os.walk で全てのファイルを走査していたときと結果を同じにする場合は False を指定する
+    use_gitignore: bool = True
+    # True の場合、1回の収集の中で内容が同じファイルの構文解析を1回にまとめる。
+    # 収集を終えるまで全てのファイルの抽出結果を保持するので、同じ内容のファイルが少ない場合は
+    # 保持するオブジェクトが増える分だけ遅くなる
+    deduplicate: bool = False
+    # 2以上の場合、ファイルの読み込みをこの数のスレッドで先行して実行し、
+    # 読み込みを待つ間に読み込み済みのファイルを構文解析する（ネットワークファイルシステム向け）。
+    # プロセスプールで並列に処理する場合は、各プロセスが順に読み込む
+    read_concurrency: int = 1
+    # 指定した場合、ディレクトリやファイルの一覧のうち、このシャードが担当するファイルだけを収集する
+    shard: Optional[Shard] = None
+    # 指定した場合、範囲内のモジュールのファイルだけを読み込んで収集する
+    scope: Optional[ModuleScope] = None
+    # True の場合、ファイルを読み込まずにソースコードを返し、インポートなどに最初にアクセスしたときに
+    # 読み込みと構文解析を行う。モジュールパスだけが必要な場合は走査だけで済む。
+    # 読み込みや構文解析の失敗はアクセスしたときに例外として送出されるので、errors には記録されない。
+    # 並列処理と先行読み込みは行わない
+    lazy: bool = False
+    # 追加で情報を抽出する抽出器を作成する関数（NodeExtractor のサブクラスなど）。
+    # 抽出結果は SourceCode.extras に格納される。指定した場合は extractor によらずASTを構築し、
+    # 抽出結果を保存できないので parse_cache は利用しない。
+    # プロセスプールで並列に処理する場合、関数と抽出結果は pickle できる必要がある
+    extractors: Tuple[NodeExtractorFactory, ...] = ()
+
+    def collect(
+        self,
+        target_path: Path,
+        workers: int = 1,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> SourceCodeCollection:
+        """
+        指定されたパスのソースコードを収集します。
+        :param target_path: 収集対象のソースファイルまたはディレクトリへのパス
+        :param workers: 読み込みと構文解析に使うプロセス数。2以上の場合はプロセスプールで並列に処理する
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :param external_modules: 指定した場合、scope の範囲外のためにファイルを読み込まなかったモジュールを追加する
+        :return:
+        """
+        return SourceCodeCollection(
+            list(
+                self.iter_collect(
+                    target_path=target_path,
+                    workers=workers,
+                    errors=errors,
+                    external_modules=external_modules,
+                )
+            )
+        )
+
+    def collect_with_errors(
+        self, target_path: Path, workers: int = 1
+    ) -> Tuple[SourceCodeCollection, CollectErrorReport]:
+        """
+        指定されたパスのソースコードを寛容モードで収集します。
+        構文エラーや読み込めないファイルがあっても中断せず、収集できたソースコードと
+        収集できなかったファイルの一覧を返します。
+        :param target_path: 収集対象のソースファイルまたはディレクトリへのパス
+        :param workers: 読み込みと構文解析に使うプロセス数。2以上の場合はプロセスプールで並列に処理する
+        :return:
+        """
+        errors = CollectErrorReport()
+        collection = self.collect(target_path, workers=workers, errors=errors)
+
+        return collection, errors
+
+    def iter_collect(
+        self,
+        target_path: Path,
+        workers: int = 1,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> Iterator[SourceCode]:
+        """
+        指定されたパスのソースコードを1つずつ収集して返します。
+        全てのソースコードを保持しないので、順に処理して捨てる場合はメモリ使用量を抑えられます。
+        :param target_path: 収集対象のソースファイルまたはディレクトリへのパス
+        :param workers: 読み込みと構文解析に使うプロセス数。2以上の場合はプロセスプールで並列に処理する
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :param external_modules: 指定した場合、scope の範囲外のためにファイルを読み込まなかったモジュールを追加する
+        :return:
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive: {workers}")
 
-    def collect(self, target_path: Path) -> SourceCodeCollection:
-        source_codes = []
         if target_path.is_dir():
-            source_codes.extend(self.collect_directory(target_path))
+            if workers > 1 and not self.lazy:
+                yield from self.iter_collect_files_in_parallel(
+                    list(self.walk_directory(target_path)),
+                    workers=workers,
+                    errors=errors,
+                    external_modules=external_modules,
+                )
+            else:
+                yield from self.iter_collect_directory(
+                    target_path, errors=errors, external_modules=external_modules
+                )
         else:
-            source_code = self.collect_file(target_path)
+            source_code = self.collect_file(target_path, errors=errors)
             if source_code:
-                source_codes.append(source_code)
+                yield source_code
+
+        if self.parse_cache:
+            self.parse_cache.prune()
+
+    def collect_files(
+        self,
+        target_paths: Iterable[Path],
+        workers: int = 1,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> SourceCodeCollection:
+        """
+        マニフェストなどで指定されたソースファイルを、ディレクトリを走査せずに収集します。
+        :param target_paths: 収集対象のソースファイルのパス
+        :param workers: 読み込みと構文解析に使うプロセス数。2以上の場合はプロセスプールで並列に処理する
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :param external_modules: 指定した場合、scope の範囲外のためにファイルを読み込まなかったモジュールを追加する
+        :return:
+        """
+        return SourceCodeCollection(
+            list(
+                self.iter_collect_files(
+                    target_paths=target_paths,
+                    workers=workers,
+                    errors=errors,
+                    external_modules=external_modules,
+                )
+            )
+        )
 
-        return SourceCodeCollection(source_codes)
+    def iter_collect_files(
+        self,
+        target_paths: Iterable[Path],
+        workers: int = 1,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> Iterator[SourceCode]:
+        """
+        指定されたソースファイルを1つずつ収集して返します。
+        除外パターン(excludes, .gitignore)は適用しません。
+        :param target_paths: 収集対象のソースファイルのパス
+        :param workers: 読み込みと構文解析に使うプロセス数。2以上の場合はプロセスプールで並列に処理する
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :param external_modules: 指定した場合、scope の範囲外のためにファイルを読み込まなかったモジュールを追加する
+        :return:
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive: {workers}")
 
-    def collect_file(self, target_path: Path) -> Optional[SourceCode]:
+        if workers > 1 and not self.lazy:
+            yield from self.iter_collect_files_in_parallel(
+                list(target_paths),
+                workers=workers,
+                errors=errors,
+                external_modules=external_modules,
+            )
+        else:
+            yield from self._iter_collect_source_files(
+                ((target_path, None) for target_path in target_paths),
+                errors=errors,
+                external_modules=external_modules,
+            )
+
+        if self.parse_cache:
+            self.parse_cache.prune()
+
+    def collect_file(
+        self,
+        target_path: Path,
+        walked_file: Optional[WalkedFile] = None,
+        errors: Optional[CollectErrorReport] = None,
+        parsed_sources: Optional[ParsedSourceCache] = None,
+    ) -> Optional[SourceCode]:
+        """
+        指定されたソースファイルを収集します。
+        :param target_path:
+        :param walked_file: ディレクトリの走査で取得済みの stat を再利用する場合に指定する
+        :param errors: 指定した場合、収集できなかったときに例外を送出せずにここに記録して None を返す
+        :param parsed_sources: 指定した場合、内容が同じファイルの構文解析の結果を共有する
+        :return:
+        """
         source_file_path = SourceFilePath(
             root_path=self.root_path, file_path=target_path
         )
         if not source_file_path.can_convert_to_module_path:
             return None
 
-        source = target_path.read_text()
+        if self.lazy:
+            return self._lazy_source_code(
+                source_file_path, walked_file, parsed_sources=parsed_sources
+            )
+
+        return self._collect_source_file(
+            source_file_path,
+            read=functools.partial(_read_source_file, source_file_path, walked_file),
+            errors=errors,
+            parsed_sources=parsed_sources,
+        )
+
+    def collect_directory(
+        self,
+        target_path: Path,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> List[SourceCode]:
+        return list(
+            self.iter_collect_directory(
+                target_path, errors=errors, external_modules=external_modules
+            )
+        )
 
-        return SourceCode.build(
-            file=SourceFile(
-                source_file_path=source_file_path,
-                content=source,
-                size=os.path.getsize(str(target_path)),
+    def iter_collect_directory(
+        self,
+        target_path: Path,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> Iterator[SourceCode]:
+        yield from self._iter_collect_source_files(
+            (
+                (walked_file.path, walked_file)
+                for walked_file in self.walk_source_files(target_path)
             ),
+            errors=errors,
+            external_modules=external_modules,
+        )
+
+    def _iter_collect_source_files(
+        self,
+        targets: Iterable[Tuple[Path, Optional[WalkedFile]]],
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> Iterator[SourceCode]:
+        """
+        ソースファイルを順に収集します。
+        read_concurrency が2以上の場合は、読み込みをスレッドプールで先行して実行します。
+        :param targets: ソースファイルのパスと、走査で取得済みの stat の組
+        :param errors:
+        :param external_modules:
+        :return:
+        """
+        parsed_sources = self._new_parsed_source_cache()
+
+        source_files = self._iter_source_file_paths(
+            targets, external_modules=external_modules
+        )
+
+        if self.lazy:
+            for source_file_path, walked_file in source_files:
+                yield self._lazy_source_code(
+                    source_file_path, walked_file, parsed_sources=parsed_sources
+                )
+            return
+
+        if self.read_concurrency > 1:
+            prefetched = prefetch(
+                source_files,
+                fetch=lambda source_file: _read_source_file(*source_file),
+                concurrency=self.read_concurrency,
+            )
+            reads = (
+                (source_file_path, future.result)
+                for (source_file_path, _), future in prefetched
+            )
+        else:
+            reads = (
+                (
+                    source_file_path,
+                    functools.partial(_read_source_file, source_file_path, walked_file),
+                )
+                for source_file_path, walked_file in source_files
+            )
+
+        for source_file_path, read in reads:
+            source_code = self._collect_source_file(
+                source_file_path,
+                read=read,
+                errors=errors,
+                parsed_sources=parsed_sources,
+            )
+            if source_code:
+                yield source_code
+
+    def _iter_source_file_paths(
+        self,
+        targets: Iterable[Tuple[Path, Optional[WalkedFile]]],
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> Iterator[Tuple[SourceFilePath, Optional[WalkedFile]]]:
+        """
+        収集対象のソースファイルを返します。
+        モジュールパスとして扱えないファイル、scope の範囲外のファイル、他のシャードのファイルは除きます。
+        """
+        for target_path, walked_file in targets:
+            source_file_path = SourceFilePath(
+                root_path=self.root_path, file_path=target_path
+            )
+            if not source_file_path.can_convert_to_module_path:
+                continue
+            # 範囲外のファイルは読み込まず、モジュールが存在することだけを記録する
+            if self.scope and not self.scope.contains(source_file_path.module_path):
+                if external_modules is not None:
+                    external_modules.append(source_file_path.module_path)
+                continue
+            if self.shard and not self.shard.contains(
+                source_file_path.relative_path_from_root.as_posix()
+            ):
+                continue
+
+            yield source_file_path, walked_file
+
+    def _collect_source_file(
+        self,
+        source_file_path: SourceFilePath,
+        read: Callable[[], FileData],
+        errors: Optional[CollectErrorReport] = None,
+        parsed_sources: Optional[ParsedSourceCache] = None,
+    ) -> Optional[SourceCode]:
+        source_code = _collect_source_file(
+            self,
+            source_file_path,
+            read=read,
+            errors=errors,
+            parsed_sources=parsed_sources,
+        )
+        if source_code is None:
+            return None
+
+        if self.lean:
+            return source_code.without_ast_and_content()
+
+        return source_code
+
+    def _lazy_source_code(
+        self,
+        source_file_path: SourceFilePath,
+        walked_file: Optional[WalkedFile] = None,
+        parsed_sources: Optional[ParsedSourceCache] = None,
+    ) -> LazySourceCode:
+        return LazySourceCode(
+            source_file_path,
+            load=functools.partial(
+                self._load_source_code,
+                source_file_path,
+                walked_file,
+                parsed_sources=parsed_sources,
+            ),
+        )
+
+    def _load_source_code(
+        self,
+        source_file_path: SourceFilePath,
+        walked_file: Optional[WalkedFile] = None,
+        parsed_sources: Optional[ParsedSourceCache] = None,
+    ) -> SourceCode:
+        source_code = self._collect_source_file(
+            source_file_path,
+            read=functools.partial(_read_source_file, source_file_path, walked_file),
+            parsed_sources=parsed_sources,
+        )
+        # errors を指定しない場合、収集できなければ例外を送出するので None にはならない
+        assert source_code is not None
+
+        return source_code
+
+    def collect_files_in_parallel(
+        self,
+        target_paths: List[Path],
+        workers: int,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> List[SourceCode]:
+        return list(
+            self.iter_collect_files_in_parallel(
+                target_paths,
+                workers=workers,
+                errors=errors,
+                external_modules=external_modules,
+            )
         )
 
-    def collect_directory(self, target_path: Path) -> List[SourceCode]:
-        result = []
-        for cur_dir, dirs, files in os.walk(str(target_path)):
-            for file in files:
-                if not file.endswith(".py"):
-                    continue
+    def iter_collect_files_in_parallel(
+        self,
+        target_paths: List[Path],
+        workers: int,
+        errors: Optional[CollectErrorReport] = None,
+        external_modules: Optional[List[ModulePath]] = None,
+    ) -> Iterator[SourceCode]:
+        """
+        ファイルの読み込みと構文解析をプロセスプールで並列に実行します。
+        結果の順序は target_paths の順序と一致します。
+        :param target_paths: 収集対象のソースファイルのパスのリスト
+        :param workers: 利用するプロセス数
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :param external_modules: 指定した場合、scope の範囲外のためにファイルを読み込まなかったモジュールを追加する
+        :return:
+        """
+        source_file_paths = [
+            source_file_path
+            for source_file_path, _ in self._iter_source_file_paths(
+                ((target_path, None) for target_path in target_paths),
+                external_modules=external_modules,
+            )
+        ]
 
-                path = Path(cur_dir).joinpath(file)
+        if not source_file_paths:
+            return
+
+        chunks = _split_into_chunks(source_file_paths, workers=workers)
+
+        parse_chunk = functools.partial(_parse_chunk, self, tolerant=errors is not None)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Executor.map は入力の順序で結果を返すので、出力順は逐次処理と変わらない
+            for chunk, (parsed_chunk, chunk_errors) in zip(
+                chunks, executor.map(parse_chunk, chunks)
+            ):
+                if errors is not None:
+                    errors.extend(chunk_errors)
+
+                for source_file_path, parsed in zip(chunk, parsed_chunk):
+                    if parsed is None:
+                        continue
+
+                    size, facts = parsed
+                    yield SourceCode.build_with_facts(
+                        self._parsed_source_file(source_file_path, size), facts
+                    )
+
+    def _parsed_source_file(
+        self, source_file_path: SourceFilePath, size: int
+    ) -> SourceFile:
+        """
+        ワーカープロセスで解析したファイルを返します。
+        ソースコード本文はプロセス間で受け渡さずに、必要になったときにこのプロセスで読み込みます。
+        """
+        if self.lean:
+            return SourceFile(
+                source_file_path=source_file_path, size=size, content=None
+            )
+
+        return LazySourceFile(
+            source_file_path,
+            size=size,
+            load_content=functools.partial(_read_source_content, source_file_path),
+        )
+
+    def _new_parsed_source_cache(self) -> Optional[ParsedSourceCache]:
+        if not self.deduplicate:
+            return None
+
+        return ParsedSourceCache(
+            extractor=self.extractor,
+            backend=self.parser_backend,
+            extractors=self.extractors,
+        )
+
+    def _build_source_code(
+        self,
+        file: SourceFile,
+        mtime_ns: int,
+        parsed_sources: Optional[ParsedSourceCache] = None,
+    ) -> SourceCode:
+        parse_cache = None if self.extractors else self.parse_cache
+        if parse_cache:
+            facts = parse_cache.load(file, mtime_ns=mtime_ns)
+            if facts:
+                return SourceCode.build_with_facts(file, facts)
+
+        if parsed_sources is not None:
+            source_code = parsed_sources.build(file)
+        else:
+            source_code = SourceCode.build(
+                file=file,
+                extractor=self.extractor,
+                backend=self.parser_backend,
+                extractors=self.extractors,
+            )
+
+        if parse_cache:
+            parse_cache.store(file, mtime_ns=mtime_ns, facts=source_code.facts())
+
+        return source_code
+
+    def walk_directory(self, target_path: Path) -> Iterator[Path]:
+        """
+        指定されたディレクトリ以下のPythonファイルのパスを返します。
+        :param target_path:
+        :return:
+        """
+        for walked_file in self.walk_source_files(target_path):
+            yield walked_file.path
+
+    def walk_source_files(self, target_path: Path) -> Iterator[WalkedFile]:
+        """
+        指定されたディレクトリ以下のPythonファイルを、走査時に取得した stat とともに返します。
+        除外対象のディレクトリには降りません。
+        :param target_path:
+        :return:
+        """
+        walker = SourceFileWalker(
+            excludes=self.excludes, use_gitignore=self.use_gitignore
+        )
+        return walker.walk(target_path)
+
+
+def _split_into_chunks(
+    source_file_paths: List[SourceFilePath], workers: int
+) -> List[List[SourceFilePath]]:
+    # 各ワーカーに複数のチャンクが行き渡るようにして、ファイルサイズの偏りをならす
+    chunk_size = max(1, min(MAX_CHUNK_SIZE, len(source_file_paths) // (workers * 4)))
+
+    chunks = []
+    for start in range(0, len(source_file_paths), chunk_size):
+        end = start + chunk_size
+        chunks.append(source_file_paths[start:end])
+
+    return chunks
+
+
+def _read_source_file(
+    source_file_path: SourceFilePath, walked_file: Optional[WalkedFile] = None
+) -> FileData:
+    file_path = source_file_path.file_path
+    data = file_path.read_bytes()
+
+    if walked_file:
+        return data, walked_file.size, walked_file.mtime_ns
+
+    stat = os.stat(str(file_path))
+    return data, stat.st_size, stat.st_mtime_ns
+
+
+def _read_source_content(source_file_path: SourceFilePath) -> str:
+    data, _, _ = _read_source_file(source_file_path)
+    return decode_source(data)
+
+
+def _collect_source_file(
+    collector: SourceCodeCollector,
+    source_file_path: SourceFilePath,
+    read: Callable[[], FileData],
+    errors: Optional[CollectErrorReport] = None,
+    parsed_sources: Optional[ParsedSourceCache] = None,
+) -> Optional[SourceCode]:
+    """
+    ソースファイルを読み込んで構文解析します。
+    errors を指定した場合、失敗したときは失敗した処理とともに記録して None を返します。
+    :param read: ファイルの内容とサイズ、mtime を返す関数
+    """
+    phase = CollectPhase.READ
+    try:
+        data, size, mtime_ns = read()
+
+        phase = CollectPhase.DECODE
+        content = decode_source(data)
+
+        phase = CollectPhase.PARSE
+        file = SourceFile(source_file_path=source_file_path, size=size, content=content)
+        return collector._build_source_code(
+            file, mtime_ns=mtime_ns, parsed_sources=parsed_sources
+        )
+    except COLLECT_ERRORS as e:
+        if errors is None:
+            raise
+
+        errors.add(CollectError.build(source_file_path.file_path, phase=phase, error=e))
+        return None
+
+
+def _parse_chunk(
+    collector: SourceCodeCollector,
+    source_file_paths: List[SourceFilePath],
+    tolerant: bool = False,
+) -> Tuple[List[Optional[ParsedFile]], List[CollectError]]:
+    """
+    ワーカープロセスで実行される処理。
+    ASTを含むSourceCodeやソースコード本文を返すと転送コストが大きいので、ファイルサイズと抽出結果だけを返す。
+    tolerant が True の場合、収集できなかったファイルの結果は None にして、失敗の情報を別に返す。
+    内容が同じファイルの構文解析の結果は、チャンクの中で共有する。
+    """
+    errors = CollectErrorReport() if tolerant else None
+    parsed_sources = collector._new_parsed_source_cache()
+
+    result: List[Optional[ParsedFile]] = []
+    for source_file_path in source_file_paths:
+        source_code = _collect_source_file(
+            collector,
+            source_file_path,
+            read=functools.partial(_read_source_file, source_file_path),
+            errors=errors,
+            parsed_sources=parsed_sources,
+        )
+        if source_code is None:
+            result.append(None)
+            continue
 
-                source_code = self.collect_file(target_path=path)
-                if source_code:
-                    result.append(source_code)
+        result.append((source_code.file.size, source_code.facts()))
 
-        return result
+    return result, errors.errors if errors else []
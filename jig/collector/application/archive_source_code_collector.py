@@ -0,0 +1,150 @@
+import dataclasses
+from pathlib import Path
+from typing import Iterator, Optional
+
+from jig.collector.domain.ast import ImportExtractor
+from jig.collector.domain.ast.parser_backend import ParserBackend
+from jig.collector.domain.collect_error.collect_error import (
+    COLLECT_ERRORS,
+    CollectError,
+    CollectPhase,
+)
+from jig.collector.domain.collect_error.collect_error_report import (
+    CollectErrorReport,
+)
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.source_code.source_code_collection import SourceCodeCollection
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+from jig.collector.infrastructure.archive import ArchiveMember, iter_archive_members
+
+# パッケージのメタデータのディレクトリ。アーカイブのルートの判定では無視する
+METADATA_DIR_SUFFIXES = (".dist-info", ".egg-info", ".data")
+
+
+@dataclasses.dataclass(frozen=True)
+class ArchiveSourceCodeCollector:
+    """
+    zip / wheel / tar.gz などのアーカイブから、ディスクに展開せずにソースコードを収集する。
+
+    root: アーカイブ内でモジュールパスの基準にするディレクトリ（"/" 区切り）。
+          Noneの場合、アーカイブの先頭のエントリが "jig-py-0.1.1/" のように
+          モジュール名として扱えないディレクトリの中にあれば、そのディレクトリをルートとする（sdist など）。
+    """
+
+    archive_path: Path
+    root: Optional[str] = None
+    extractor: ImportExtractor = ImportExtractor.AST
+    parser_backend: Optional[ParserBackend] = None
+    # True の場合、抽出した情報だけを残してASTとソースコード本文を破棄する（省メモリモード）
+    lean: bool = False
+
+    def collect(
+        self, target: str = "", errors: Optional[CollectErrorReport] = None
+    ) -> SourceCodeCollection:
+        """
+        アーカイブ内のソースコードを収集します。
+        :param target: 収集対象のルートからの相対パス（"/" 区切り）。空文字の場合はルート以下の全て
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :return:
+        """
+        return SourceCodeCollection(
+            list(self.iter_collect(target=target, errors=errors))
+        )
+
+    def iter_collect(
+        self, target: str = "", errors: Optional[CollectErrorReport] = None
+    ) -> Iterator[SourceCode]:
+        """
+        アーカイブ内のソースコードを、アーカイブ内の順序で1つずつ収集して返します。
+        :param target: 収集対象のルートからの相対パス（"/" 区切り）。空文字の場合はルート以下の全て
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :return:
+        """
+        root = None if self.root is None else self.root.strip("/")
+        target = target.strip("/")
+
+        def predicate(name: str) -> bool:
+            nonlocal root
+            name = _normalize(name)
+            if root is None:
+                root = self._detect_root(name)
+
+            relative_path = _relative_path(name, root)
+            if relative_path is None or not relative_path.endswith(".py"):
+                return False
+
+            return _relative_path(relative_path, target) is not None
+
+        for member in iter_archive_members(self.archive_path, predicate=predicate):
+            assert root is not None
+
+            source_code = self._build_source_code(member, root, errors=errors)
+            if source_code:
+                yield source_code
+
+    def _build_source_code(
+        self,
+        member: ArchiveMember,
+        root: str,
+        errors: Optional[CollectErrorReport] = None,
+    ) -> Optional[SourceCode]:
+        # パスの計算だけに使うので、実在するパスである必要はない
+        source_file_path = SourceFilePath(
+            root_path=Path(root), file_path=Path(_normalize(member.name))
+        )
+        if not source_file_path.can_convert_to_module_path:
+            return None
+
+        phase = CollectPhase.DECODE
+        try:
+            file = SourceFile(
+                source_file_path=source_file_path,
+                size=member.size,
+                content=member.decode(),
+            )
+
+            phase = CollectPhase.PARSE
+            source_code = SourceCode.build(
+                file=file, extractor=self.extractor, backend=self.parser_backend
+            )
+        except COLLECT_ERRORS as e:
+            if errors is None:
+                raise
+
+            errors.add(CollectError.build(Path(member.name), phase=phase, error=e))
+            return None
+
+        if self.lean:
+            return source_code.without_ast_and_content()
+
+        return source_code
+
+    def _detect_root(self, first_name: str) -> str:
+        if self.archive_path.name.lower().endswith(".whl"):
+            return ""
+
+        top, _, rest = first_name.partition("/")
+        if not rest or top.endswith(METADATA_DIR_SUFFIXES) or top.isidentifier():
+            return ""
+
+        return top
+
+
+def _normalize(name: str) -> str:
+    while name.startswith("./"):
+        name = name[2:]
+    return name
+
+
+def _relative_path(name: str, base: str) -> Optional[str]:
+    """base 以下のパスであれば base からの相対パスを、そうでなければ None を返す"""
+    if not base:
+        return name
+    if name.startswith(base + "/"):
+        start = len(base) + 1
+        return name[start:]
+    if name == base:
+        return ""
+
+    return None
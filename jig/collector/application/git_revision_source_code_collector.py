@@ -0,0 +1,124 @@
+import dataclasses
+from pathlib import Path
+from typing import Iterator, Optional
+
+from jig.collector.domain.ast import ImportExtractor
+from jig.collector.domain.ast.parser_backend import ParserBackend
+from jig.collector.domain.collect_error.collect_error import (
+    COLLECT_ERRORS,
+    CollectError,
+    CollectPhase,
+)
+from jig.collector.domain.collect_error.collect_error_report import (
+    CollectErrorReport,
+)
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.source_code.source_code_collection import SourceCodeCollection
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+from jig.collector.infrastructure.git_repository import (
+    GitBlob,
+    GitCatFile,
+    list_blobs,
+    show_prefix,
+)
+from jig.collector.infrastructure.source_decoder import decode_source
+
+
+@dataclasses.dataclass(frozen=True)
+class GitRevisionSourceCodeCollector:
+    """
+    git リポジトリの任意のリビジョンから、チェックアウトせずにソースコードを収集する。
+
+    ファイルの一覧は `git ls-tree` で取得し、内容は1つの `git cat-file --batch` プロセスで読み込む。
+    root: リポジトリのトップレベルからの、モジュールパスの基準にするディレクトリ（"/" 区切り）。
+          Noneの場合は repo_path のディレクトリ
+    """
+
+    repo_path: Path
+    revision: str
+    root: Optional[str] = None
+    extractor: ImportExtractor = ImportExtractor.AST
+    parser_backend: Optional[ParserBackend] = None
+    # True の場合、抽出した情報だけを残してASTとソースコード本文を破棄する（省メモリモード）
+    lean: bool = False
+
+    def collect(
+        self, target: str = "", errors: Optional[CollectErrorReport] = None
+    ) -> SourceCodeCollection:
+        """
+        リビジョンのソースコードを収集します。
+        :param target: 収集対象のルートからの相対パス（"/" 区切り）。空文字の場合はルート以下の全て
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :return:
+        """
+        return SourceCodeCollection(
+            list(self.iter_collect(target=target, errors=errors))
+        )
+
+    def iter_collect(
+        self, target: str = "", errors: Optional[CollectErrorReport] = None
+    ) -> Iterator[SourceCode]:
+        """
+        リビジョンのソースコードを、パスの順に1つずつ収集して返します。
+        :param target: 収集対象のルートからの相対パス（"/" 区切り）。空文字の場合はルート以下の全て
+        :param errors: 指定した場合、収集できなかったファイルをここに記録して残りのファイルの収集を続ける
+        :return:
+        """
+        root = show_prefix(self.repo_path) if self.root is None else self.root
+        root = root.strip("/")
+        path = "/".join(p for p in [root, target.strip("/")] if p)
+
+        blobs = [
+            blob
+            for blob in list_blobs(self.repo_path, self.revision, path=path)
+            if blob.path.endswith(".py")
+        ]
+        if not blobs:
+            return
+
+        with GitCatFile(self.repo_path) as cat_file:
+            for blob in blobs:
+                source_file_path = SourceFilePath(
+                    root_path=Path(root), file_path=Path(blob.path)
+                )
+                if not source_file_path.can_convert_to_module_path:
+                    continue
+
+                data = cat_file.read(blob.oid)
+                source_code = self._build_source_code(
+                    source_file_path, blob, data, errors=errors
+                )
+                if source_code is None:
+                    continue
+
+                if self.lean:
+                    yield source_code.without_ast_and_content()
+                else:
+                    yield source_code
+
+    def _build_source_code(
+        self,
+        source_file_path: SourceFilePath,
+        blob: GitBlob,
+        data: bytes,
+        errors: Optional[CollectErrorReport] = None,
+    ) -> Optional[SourceCode]:
+        phase = CollectPhase.DECODE
+        try:
+            file = SourceFile(
+                source_file_path=source_file_path,
+                size=blob.size,
+                content=decode_source(data),
+            )
+
+            phase = CollectPhase.PARSE
+            return SourceCode.build(
+                file=file, extractor=self.extractor, backend=self.parser_backend
+            )
+        except COLLECT_ERRORS as e:
+            if errors is None:
+                raise
+
+            errors.add(CollectError.build(Path(blob.path), phase=phase, error=e))
+            return None
@@ -1,13 +1,38 @@
 import dataclasses
-from typing import Optional, List
+import enum
+from typing import Any, Callable, Dict, Optional, List, Sequence, Tuple
 
-from typed_ast import ast3 as ast
+from jig.collector.domain.ast.parser_backend import (
+    ParserBackend,
+    default_parser_backend,
+)
+
+# ASTのノードの型は選択したパーサー(ParserBackend)によって異なるので、Any として扱う
+ASTNode = Any
+
+
+class ImportExtractor(enum.Enum):
+    """
+    ソースコードからimport文を抽出する方法。
+    AST: ASTを構築して抽出する
+    TOKEN: ASTを構築せずに、import文とクラス定義の行だけを解析して抽出する。
+           確実に解析できない場合はASTにフォールバックする。
+           それ以外の行は解析しないので、ASTでは構文エラーになるファイルからも抽出する。
+           選択したパーサーは、フォールバックする場合にだけ利用する
+    """
+
+    AST = "ast"
+    TOKEN = "token"
 
 
 @dataclasses.dataclass(frozen=True)
 class ClassDef:
     name: str
-    _ast: ast.ClassDef = dataclasses.field(repr=False, compare=False)
+    _ast: Optional[ASTNode] = dataclasses.field(default=None, repr=False, compare=False)
+    lineno: Optional[int] = dataclasses.field(default=None, compare=False)
+
+    def without_ast(self) -> "ClassDef":
+        return ClassDef(name=self.name, lineno=self.lineno)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -19,16 +44,20 @@ class Alias:
 @dataclasses.dataclass(frozen=True)
 class Import:
     names: List[Alias]
-    _ast: ast.Import = dataclasses.field(repr=False, compare=False)
+    _ast: Optional[ASTNode] = dataclasses.field(default=None, repr=False, compare=False)
+    lineno: Optional[int] = dataclasses.field(default=None, compare=False)
 
     @classmethod
-    def from_ast(cls, import_ast: ast.Import) -> "Import":
+    def from_ast(cls, import_ast: ASTNode) -> "Import":
         names = [
             Alias(name=name_alias.name, asname=name_alias.asname)
             for name_alias in import_ast.names
         ]
 
-        return cls(names=names, _ast=import_ast)
+        return cls(names=names, _ast=import_ast, lineno=import_ast.lineno)
+
+    def without_ast(self) -> "Import":
+        return Import(names=self.names, lineno=self.lineno)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -43,10 +72,11 @@ class ImportFrom:
     module: Optional[str]
     names: List[Alias]
     level: Optional[int]
-    _ast: ast.ImportFrom = dataclasses.field(repr=False, compare=False)
+    _ast: Optional[ASTNode] = dataclasses.field(default=None, repr=False, compare=False)
+    lineno: Optional[int] = dataclasses.field(default=None, compare=False)
 
     @classmethod
-    def from_ast(cls, import_from: ast.ImportFrom) -> "ImportFrom":
+    def from_ast(cls, import_from: ASTNode) -> "ImportFrom":
         names = [
             Alias(name=alias.name, asname=alias.asname) for alias in import_from.names
         ]
@@ -56,88 +86,215 @@ class ImportFrom:
             names=names,
             level=import_from.level,
             _ast=import_from,
+            lineno=import_from.lineno,
         )
 
+    def without_ast(self) -> "ImportFrom":
+        return ImportFrom(
+            module=self.module, names=self.names, level=self.level, lineno=self.lineno
+        )
 
-@dataclasses.dataclass(frozen=True)
-class JigAST:
-    _ast: ast.AST
 
-    @classmethod
-    def parse(cls, source: str, filename: str = "<unknown>") -> "JigAST":
-        tree = ast.parse(source=source, filename=filename)
-        return cls(tree)
+class NodeExtractor:
+    """
+    ASTの1回の走査の中で、特定の種類のノードから情報を抽出する処理の基底クラス。
 
-    def imports(self) -> List[Import]:
-        visitor = ImportVisitor()
-        visitor.visit(self._ast)
+    node_types に含まれるクラス名（"ClassDef" など）のノードが見つかるたびに visit が呼ばれる。
+    クラス名で指定するので、どのパーサー(ParserBackend)を利用しても同じ抽出器を使える。
+    ancestors にはルートから親ノードまでが順に格納されている。
+    走査が終わると result の戻り値が name をキーにして JigSourceCode.extras に格納される。
+    抽出結果を内部に保持するので、インスタンスは1回の走査ごとに作成すること。
+    """
 
-        return visitor.imports
+    name: str = ""
+    node_types: Tuple[str, ...] = ()
 
-    def import_froms(self) -> List[ImportFrom]:
-        visitor = ImportFromVisitor()
-        visitor.visit(self._ast)
+    def visit(self, node: ASTNode, ancestors: Sequence[ASTNode]) -> None:
+        raise NotImplementedError
 
-        return visitor.import_froms
+    def result(self) -> Any:
+        raise NotImplementedError
 
-    def class_defs(self) -> List[ClassDef]:
-        visitor = ClassDefVisitor()
-        visitor.visit(self._ast)
 
-        return visitor.class_defs
+# ファイルごとに新しい抽出器を作成する関数。引数のない NodeExtractor のサブクラスをそのまま指定できる
+NodeExtractorFactory = Callable[[], NodeExtractor]
 
 
-@dataclasses.dataclass(frozen=True)
-class JigSourceCode:
-    imports: List[Import]
-    import_froms: List[ImportFrom]
-    class_defs: List[ClassDef]
+@dataclasses.dataclass
+class ClassDefNodeExtractor(NodeExtractor):
+    """クラス定義を抽出する。クラス定義の中で定義されたクラスは対象外"""
 
-    @classmethod
-    def build(cls, source: str, filename: str) -> "JigSourceCode":
-        jig_ast = JigAST.parse(source=source, filename=filename)
+    name = "class_defs"
+    node_types = ("ClassDef",)
 
-        return cls(
-            imports=jig_ast.imports(),
-            import_froms=jig_ast.import_froms(),
-            class_defs=jig_ast.class_defs(),
-        )
+    class_defs: List[ClassDef] = dataclasses.field(default_factory=list)
 
+    def visit(self, node: ASTNode, ancestors: Sequence[ASTNode]) -> None:
+        if any(type(ancestor).__name__ == "ClassDef" for ancestor in ancestors):
+            return
 
-@dataclasses.dataclass
-class ClassDefVisitor(ast.NodeVisitor):
-    class_defs: List[ClassDef] = dataclasses.field(default_factory=list)
+        # デコレータ付きのクラスの行番号は、パーサーによらず最初のデコレータの行とする
+        lineno = node.lineno
+        if node.decorator_list:
+            lineno = min(lineno, node.decorator_list[0].lineno)
 
-    def visit_ClassDef(self, node):
         self.class_defs.append(
             ClassDef(
                 name=node.name,
                 _ast=node,
+                lineno=lineno,
             )
         )
 
+    def result(self) -> List[ClassDef]:
+        return self.class_defs
+
 
 @dataclasses.dataclass
-class ImportVisitor(ast.NodeVisitor):
+class ImportNodeExtractor(NodeExtractor):
+    name = "imports"
+    node_types = ("Import",)
+
     imports: List[Import] = dataclasses.field(default_factory=list)
 
-    def visit_Import(self, node):
+    def visit(self, node: ASTNode, ancestors: Sequence[ASTNode]) -> None:
         self.imports.append(Import.from_ast(node))
 
+    def result(self) -> List[Import]:
+        return self.imports
+
 
 @dataclasses.dataclass
-class ImportFromVisitor(ast.NodeVisitor):
+class ImportFromNodeExtractor(NodeExtractor):
+    name = "import_froms"
+    node_types = ("ImportFrom",)
+
     import_froms: List[ImportFrom] = dataclasses.field(default_factory=list)
 
-    def visit_ImportFrom(self, node):
-        self.import_froms.append(
-            ImportFrom(
-                module=node.module,
-                names=[
-                    Alias(name=name_alias.name, asname=name_alias.asname)
-                    for name_alias in node.names
-                ],
-                level=node.level,
-                _ast=node,
-            )
+    def visit(self, node: ASTNode, ancestors: Sequence[ASTNode]) -> None:
+        self.import_froms.append(ImportFrom.from_ast(node))
+
+    def result(self) -> List[ImportFrom]:
+        return self.import_froms
+
+
+@dataclasses.dataclass(frozen=True)
+class JigAST:
+    _ast: ASTNode
+    _backend: ParserBackend
+
+    @classmethod
+    def parse(
+        cls,
+        source: str,
+        filename: str = "<unknown>",
+        backend: Optional[ParserBackend] = None,
+    ) -> "JigAST":
+        """
+        ソースコードを構文解析します。
+        :param source:
+        :param filename:
+        :param backend: 構文解析に利用するパーサー。Noneの場合は実行中のPythonに合わせて選択する
+        :return:
+        """
+        backend = backend or default_parser_backend()
+        tree = backend.parse(source=source, filename=filename)
+        return cls(tree, backend)
+
+    def imports(self) -> List[Import]:
+        return self.extract([ImportNodeExtractor()])["imports"]
+
+    def import_froms(self) -> List[ImportFrom]:
+        return self.extract([ImportFromNodeExtractor()])["import_froms"]
+
+    def class_defs(self) -> List[ClassDef]:
+        return self.extract([ClassDefNodeExtractor()])["class_defs"]
+
+    def extract(self, extractors: Sequence[NodeExtractor]) -> Dict[str, Any]:
+        """
+        ASTを1回だけ走査して、全ての extractors で情報を抽出します。
+        :param extractors:
+        :return: 抽出器の name をキーにした抽出結果
+        """
+        names = [extractor.name for extractor in extractors]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Extractor names must be unique: {names}")
+
+        # ノードの型ごとに呼び出す抽出器を引けるようにしておく
+        dispatch: Dict[str, List[NodeExtractor]] = {}
+        for extractor in extractors:
+            for node_type in extractor.node_types:
+                dispatch.setdefault(node_type, []).append(extractor)
+
+        iter_child_nodes = self._backend.ast_module.iter_child_nodes
+        ancestors: List[ASTNode] = []
+
+        def walk(node: ASTNode) -> None:
+            for extractor in dispatch.get(type(node).__name__, []):
+                extractor.visit(node, ancestors)
+
+            ancestors.append(node)
+            for child in iter_child_nodes(node):
+                walk(child)
+            ancestors.pop()
+
+        walk(self._ast)
+
+        return {extractor.name: extractor.result() for extractor in extractors}
+
+
+@dataclasses.dataclass(frozen=True)
+class JigSourceCode:
+    """
+    extras: JigSourceCode.build に渡した抽出器の name をキーにした抽出結果
+    """
+
+    imports: List[Import]
+    import_froms: List[ImportFrom]
+    class_defs: List[ClassDef]
+    extras: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        source: str,
+        filename: str,
+        extractors: Sequence[NodeExtractor] = (),
+        backend: Optional[ParserBackend] = None,
+    ) -> "JigSourceCode":
+        """
+        ソースコードを構文解析し、import文とクラス定義を抽出します。
+        :param source:
+        :param filename:
+        :param extractors: 追加で情報を抽出する抽出器。import文などと同じ1回の走査で抽出する
+        :param backend: 構文解析に利用するパーサー。Noneの場合は実行中のPythonに合わせて選択する
+        :return:
+        """
+        jig_ast = JigAST.parse(source=source, filename=filename, backend=backend)
+
+        default_extractors: List[NodeExtractor] = [
+            ImportNodeExtractor(),
+            ImportFromNodeExtractor(),
+            ClassDefNodeExtractor(),
+        ]
+        results = jig_ast.extract(default_extractors + list(extractors))
+
+        return cls(
+            imports=results.pop("imports"),
+            import_froms=results.pop("import_froms"),
+            class_defs=results.pop("class_defs"),
+            extras=results,
+        )
+
+    def without_ast(self) -> "JigSourceCode":
+        """
+        ASTノードへの参照を取り除いたコピーを返します。
+        プロセス間での受け渡しなど、抽出結果だけが必要な場合に利用します。
+        extras は抽出器が返した値をそのまま引き継ぎます。
+        """
+        return JigSourceCode(
+            imports=[i.without_ast() for i in self.imports],
+            import_froms=[i.without_ast() for i in self.import_froms],
+            class_defs=[c.without_ast() for c in self.class_defs],
+            extras=self.extras,
         )
@@ -0,0 +1,394 @@
+"""
+ASTを構築せずに、import文とクラス定義を抽出する。
+
+文字列リテラルとコメントを読み飛ばしながら、import / from / class などのキーワードを正規表現で探し、
+見つけた import文だけをトークン化して解析する。それ以外の文はトークン化も構文解析もしないので、
+ASTを構築して全てのノードを走査するよりも速い。
+
+JigAST と同じ Import / ImportFrom / ClassDef を返すが、想定外のソースコードを検出した場合は
+解析を諦めて None を返すので、呼び出し側はASTによる解析にフォールバックすること。
+
+import文とクラス定義の行以外は解析しないので、それ以外の部分の構文エラーは検出しない。
+そのため、ASTによる抽出では構文エラーになるファイルからも import文を抽出する。
+import文とクラス定義の文法は Python 3 の各バージョンで共通なので、
+選択したパーサー(ParserBackend)の文法のバージョンによらず、同じ結果になる。
+"""
+
+import re
+import tokenize
+from typing import Iterator, List, Optional, Tuple
+
+from jig.collector.domain.ast import Alias, ClassDef, Import, ImportFrom, JigSourceCode
+from jig.collector.domain.ast.parser_backend import ParserBackend
+
+# 解析に影響しないトークン
+_IGNORED_TYPES = {tokenize.COMMENT, tokenize.NL}
+
+# 文字列リテラル。一重引用符の文字列は、三重引用符の先頭の2文字に一致しないようにする
+_STRING_PATTERNS = (
+    r'"""[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""',
+    r"'''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''",
+    r'"(?!"")[^"\\\n]*(?:\\.[^"\\\n]*)*"',
+    r"'(?!'')[^'\\\n]*(?:\\.[^'\\\n]*)*'",
+)
+
+# 空白やカンマで区切られて続く同じ種類の文字列リテラルは、1回でまとめて読み飛ばす。
+# 読み飛ばした行はどれも空白か文字列リテラルで始まるので、_PATTERN の行頭の判定には影響しない
+_STRING_RUN_PATTERN = "|".join(
+    rf"{string}(?:[ \t\r\n\f,:]*{string})*" for string in _STRING_PATTERNS
+)
+
+# 読み飛ばす文字列リテラルとコメント、または抽出に必要なキーワードと行頭に一致する。
+# どの選択肢も固定の文字で始まるようにして、正規表現エンジンがその文字まで読み飛ばせるようにしている。
+# そのためグループは使わず、一致した文字列の先頭の文字で種類を判別する。
+# キーワードの前の単語境界も、同じ理由で一致した後に確認する。
+_PATTERN = re.compile(
+    _STRING_RUN_PATTERN + r"""
+    # 閉じていない文字列リテラル
+    |["']
+    |\#[^\n]*
+    # import が続く from
+    |from\b(?=(?:[ \t.\w]|\\\r?\n)*?\bimport\b)
+    |import\b
+    |class\b
+    # デコレータと関数定義の行頭
+    |\n[ \t]*@
+    |\n[ \t]*(?:async[ \t]+)?def\b
+    # インデントされていない行の行頭（閉じ括弧と文字列で始まる行は括弧の中の行とみなす）
+    |\n(?=[^ \t\r\n\f\#\\)\]}'"])
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+_CLASS_NAME_PATTERN = re.compile(r"class(?:[ \t]|\\\r?\n)+(\w+)")
+
+
+class UnsupportedSourceError(Exception):
+    """import文とクラス定義を確実に解析できないソースコードの場合の例外"""
+
+    pass
+
+
+def build_jig_source_code(
+    source: str, filename: str, backend: Optional[ParserBackend] = None
+) -> JigSourceCode:
+    """
+    ASTを構築せずにimport文とクラス定義を抽出します。
+    確実に解析できない場合はASTを構築して解析します。
+    :param source:
+    :param filename:
+    :param backend: ASTを構築する場合に利用するパーサー
+    :return:
+    """
+    jig_source_code = scan(source)
+    if jig_source_code is None:
+        return JigSourceCode.build(source=source, filename=filename, backend=backend)
+
+    return jig_source_code
+
+
+def scan(source: str) -> Optional[JigSourceCode]:
+    """
+    ソースコードからimport文とクラス定義を抽出します。
+    確実に解析できない場合は None を返します。
+    import文とクラス定義の行以外の構文エラーは検出しません。
+    :param source:
+    :return:
+    """
+    try:
+        return _SourceScanner(source).scan()
+    except (UnsupportedSourceError, tokenize.TokenError, SyntaxError):
+        return None
+
+
+class _SourceScanner:
+    def __init__(self, source: str):
+        # 先頭の行も他の行と同じように、改行の直後の行頭として扱う
+        self._source = "\n" + source
+        self._imports: List[Import] = []
+        self._import_froms: List[ImportFrom] = []
+        self._class_defs: List[ClassDef] = []
+
+        # 行番号を数え終えた位置と、その位置の行番号
+        self._counted_pos = 0
+        self._lineno = 0
+        # 定義の途中かもしれないクラスのインデント幅。外側のクラスから順に積む
+        self._class_indents: List[int] = []
+        # 次のクラス定義または関数定義に付いている、最初のデコレータの (行番号, インデント幅)
+        self._decorator: Optional[Tuple[int, int]] = None
+
+    def scan(self) -> JigSourceCode:
+        source = self._source
+        pos = 0
+        while True:
+            match = _PATTERN.search(source, pos)
+            if match is None:
+                break
+
+            start, pos = match.span()
+            char = source[start]
+            if char in "\"'":
+                if pos - start == 1:
+                    raise UnsupportedSourceError(f"unterminated string at {start}")
+            elif char == "#":
+                pass
+            elif char == "\n":
+                self._scan_line_start(start, match.group())
+            elif _is_identifier_char(source[start - 1]):
+                # subclass などの識別子の一部
+                pass
+            elif char == "c":
+                self._scan_class_def(start)
+            else:
+                pos = self._scan_import(start)
+
+        return JigSourceCode(
+            imports=self._imports,
+            import_froms=self._import_froms,
+            class_defs=self._class_defs,
+        )
+
+    def _scan_line_start(self, start: int, text: str) -> None:
+        if text == "\n":
+            # バックスラッシュで継続している行は、インデントされていなくても文の先頭ではない
+            end = start - 1 if self._source[start - 1] == "\r" else start
+            if not self._source.endswith("\\", 0, end):
+                self._class_indents.clear()
+            return
+
+        line = text[1:]
+        indent = _indent_width(line[: len(line) - len(line.lstrip(" \t"))])
+        if indent == 0:
+            self._class_indents.clear()
+
+        if text.endswith("@"):
+            if self._decorator is None:
+                # 改行の直後の行がデコレータの行
+                self._decorator = (self._lineno_at(start) + 1, indent)
+        else:
+            self._decorator = None
+
+    def _scan_class_def(self, start: int) -> None:
+        line_start = self._source.rfind("\n", 0, start) + 1
+        indentation = self._source[line_start:start]
+        if indentation.strip(" \t\f"):
+            raise UnsupportedSourceError(f"class is not at the start of line {start}")
+
+        name = _CLASS_NAME_PATTERN.match(self._source, start)
+        if name is None:
+            raise UnsupportedSourceError(f"class without name at {start}")
+
+        indent = _indent_width(indentation)
+        while self._class_indents and self._class_indents[-1] >= indent:
+            self._class_indents.pop()
+        if self._class_indents and self._class_indents[0] != 0:
+            # インデントされたクラスの定義が終わっているかどうかは、途中の行を見ないと分からない
+            raise UnsupportedSourceError(f"class in an indented class at {start}")
+
+        # クラス定義の中のクラス定義は対象外（JigAST と同じ）
+        if not self._class_indents:
+            lineno = self._lineno_at(start)
+            if self._decorator is not None and self._decorator[1] == indent:
+                lineno = self._decorator[0]
+            self._class_defs.append(ClassDef(name=name.group(1), lineno=lineno))
+
+        self._class_indents.append(indent)
+        self._decorator = None
+
+    def _scan_import(self, start: int) -> int:
+        """import文を解析して、文の終わりの位置を返す"""
+        line_start = self._source.rfind("\n", 0, start) + 1
+        preceding = self._source[line_start:start].rstrip()
+        if preceding and preceding[-1] not in ";:":
+            raise UnsupportedSourceError(
+                f"import is not at the start of statement {start}"
+            )
+
+        lineno = self._lineno_at(start)
+        reader = _LineReader(self._source, start)
+        parser = _ImportStatementParser(_significant_tokens(reader.readline))
+        if self._source.startswith("import", start):
+            self._imports.append(parser.parse_import(lineno))
+        else:
+            self._import_froms.append(parser.parse_import_from(lineno))
+
+        return reader.position(*parser.end_of_statement())
+
+    def _lineno_at(self, pos: int) -> int:
+        self._lineno += self._source.count("\n", self._counted_pos, pos)
+        self._counted_pos = pos
+        return self._lineno
+
+
+def _is_identifier_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _indent_width(indentation: str) -> int:
+    return len(indentation.expandtabs(8))
+
+
+class _LineReader:
+    """ソースコードの指定した位置から1行ずつ返し、返した行の先頭の位置を覚えておく"""
+
+    def __init__(self, source: str, start: int):
+        self._source = source
+        self._next = start
+        self._line_starts: List[int] = []
+
+    def readline(self) -> str:
+        start = self._next
+        if start >= len(self._source):
+            return ""
+
+        end = self._source.find("\n", start) + 1 or len(self._source)
+        self._next = end
+        self._line_starts.append(start)
+        return self._source[start:end]
+
+    def position(self, row: int, col: int) -> int:
+        """トークンの (行, 列) をソースコード全体の位置に変換する"""
+        return self._line_starts[row - 1] + col
+
+
+def _significant_tokens(readline) -> Iterator[tokenize.TokenInfo]:
+    for token in tokenize.generate_tokens(readline):
+        if token.type == tokenize.ERRORTOKEN:
+            raise UnsupportedSourceError(f"error token at {token.start}")
+        if token.type in _IGNORED_TYPES:
+            continue
+        yield token
+
+
+class _ImportStatementParser:
+    """1つのimport文のトークン列を解析する"""
+
+    def __init__(self, tokens: Iterator[tokenize.TokenInfo]):
+        self._tokens = tokens
+        self._current: Optional[tokenize.TokenInfo] = None
+
+    def parse_import(self, lineno: int) -> Import:
+        self._expect_name("import")
+        names = [self._dotted_as_name()]
+        while self._peek_op(","):
+            self._next()
+            names.append(self._dotted_as_name())
+
+        return Import(names=names, lineno=lineno)
+
+    def parse_import_from(self, lineno: int) -> ImportFrom:
+        self._expect_name("from")
+        level = 0
+        token = self._next_required()
+        while token.type == tokenize.OP and token.string in (".", "..."):
+            level += len(token.string)
+            token = self._next_required()
+
+        module: Optional[str] = None
+        if token.type == tokenize.NAME and token.string != "import":
+            module = self._dotted_name(token)
+            token = self._next_required()
+
+        if token.type != tokenize.NAME or token.string != "import":
+            raise UnsupportedSourceError(f"unexpected token {token.string!r}")
+        if module is None and level == 0:
+            raise UnsupportedSourceError("from import without module")
+
+        names: List[Alias] = []
+        if self._peek_op("*"):
+            self._next()
+            names.append(Alias(name="*", asname=None))
+        elif self._peek_op("("):
+            self._next()
+            names.append(self._as_name(self._next_required()))
+            while self._peek_op(","):
+                self._next()
+                if self._peek_op(")"):
+                    # 末尾のカンマ
+                    break
+                names.append(self._as_name(self._next_required()))
+            self._expect_op(")")
+        else:
+            names.append(self._as_name(self._next_required()))
+            while self._peek_op(","):
+                self._next()
+                names.append(self._as_name(self._next_required()))
+
+        return ImportFrom(module=module, names=names, level=level, lineno=lineno)
+
+    def end_of_statement(self) -> Tuple[int, int]:
+        """
+        import文の直後のトークンを読み、次の文を探し始める (行, 列) を返す。
+        改行で終わる場合は、次の行の行頭を探せるように改行の位置を返す
+        """
+        token = self._next_required()
+        if token.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+            return token.start
+        if token.type == tokenize.OP and token.string == ";":
+            return token.end
+
+        raise UnsupportedSourceError(f"unexpected token {token.string!r}")
+
+    def _dotted_as_name(self) -> Alias:
+        name = self._dotted_name(self._next_required())
+        return Alias(name=name, asname=self._optional_as_name())
+
+    def _as_name(self, token: tokenize.TokenInfo) -> Alias:
+        if token.type != tokenize.NAME:
+            raise UnsupportedSourceError(f"unexpected token {token.string!r}")
+        return Alias(name=token.string, asname=self._optional_as_name())
+
+    def _optional_as_name(self) -> Optional[str]:
+        token = self._peek()
+        if token is None or token.type != tokenize.NAME or token.string != "as":
+            return None
+
+        self._next()
+        asname = self._next_required()
+        if asname.type != tokenize.NAME:
+            raise UnsupportedSourceError(f"unexpected token {asname.string!r}")
+        return asname.string
+
+    def _dotted_name(self, token: tokenize.TokenInfo) -> str:
+        if token.type != tokenize.NAME:
+            raise UnsupportedSourceError(f"unexpected token {token.string!r}")
+
+        names = [token.string]
+        while self._peek_op("."):
+            self._next()
+            token = self._next_required()
+            if token.type != tokenize.NAME:
+                raise UnsupportedSourceError(f"unexpected token {token.string!r}")
+            names.append(token.string)
+
+        return ".".join(names)
+
+    def _peek_op(self, op: str) -> bool:
+        token = self._peek()
+        return token is not None and token.type == tokenize.OP and token.string == op
+
+    def _expect_op(self, op: str) -> None:
+        token = self._next_required()
+        if token.type != tokenize.OP or token.string != op:
+            raise UnsupportedSourceError(f"expected {op!r} but {token.string!r}")
+
+    def _expect_name(self, name: str) -> None:
+        token = self._next_required()
+        if token.type != tokenize.NAME or token.string != name:
+            raise UnsupportedSourceError(f"expected {name!r} but {token.string!r}")
+
+    def _peek(self) -> Optional[tokenize.TokenInfo]:
+        if self._current is None:
+            self._current = next(self._tokens, None)
+        return self._current
+
+    def _next(self) -> Optional[tokenize.TokenInfo]:
+        token = self._peek()
+        self._current = None
+        return token
+
+    def _next_required(self) -> tokenize.TokenInfo:
+        token = self._next()
+        if token is None:
+            raise UnsupportedSourceError("unexpected end of source")
+        return token
@@ -0,0 +1,126 @@
+"""
+ソースコードを構文解析してASTを構築するパーサーの実装を切り替える。
+
+typed_ast: typed_ast.ast3 で構文解析する。Python 3.7 までの文法に対応する
+ast: 標準ライブラリの ast で構文解析する。feature_version で解析する文法のバージョンを指定できる
+auto: Python 3.8 以降では ast、それより前では typed_ast（インストールされていない場合は ast）
+"""
+
+import dataclasses
+import functools
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Optional, Tuple
+
+AUTO = "auto"
+TYPED_AST = "typed_ast"
+STDLIB_AST = "ast"
+
+
+class ParserBackend:
+    name: str = ""
+
+    @property
+    def ast_module(self) -> ModuleType:
+        """ASTのノード型と iter_child_nodes などの関数を提供するモジュール"""
+        raise NotImplementedError
+
+    def parse(self, source: str, filename: str) -> Any:
+        raise NotImplementedError
+
+
+@dataclasses.dataclass(frozen=True)
+class TypedAstParserBackend(ParserBackend):
+    name = TYPED_AST
+
+    @property
+    def ast_module(self) -> ModuleType:
+        return _import_typed_ast()
+
+    def parse(self, source: str, filename: str) -> Any:
+        return self.ast_module.parse(source=source, filename=filename)
+
+
+@dataclasses.dataclass(frozen=True)
+class StdlibAstParserBackend(ParserBackend):
+    """
+    feature_version: 解析する文法のバージョン。例: (3, 7)。Noneの場合は実行中のPythonの文法
+    """
+
+    name = STDLIB_AST
+
+    feature_version: Optional[Tuple[int, int]] = None
+
+    def __post_init__(self):
+        if self.feature_version and sys.version_info < (3, 8):
+            raise ValueError("feature_version requires Python 3.8 or later.")
+
+    @property
+    def ast_module(self) -> ModuleType:
+        return importlib.import_module("ast")
+
+    def parse(self, source: str, filename: str) -> Any:
+        if self.feature_version:
+            return self.ast_module.parse(
+                source, filename=filename, feature_version=self.feature_version
+            )
+
+        return self.ast_module.parse(source, filename=filename)
+
+
+def build_parser_backend(spec: str = AUTO) -> ParserBackend:
+    """
+    文字列の指定からパーサーを作成します。
+    :param spec: "auto", "typed_ast", "ast", または "ast:3.7" のように feature_version を付けた "ast"
+    :return:
+    """
+    name, _, version = spec.partition(":")
+
+    if name == STDLIB_AST:
+        return StdlibAstParserBackend(
+            feature_version=_parse_feature_version(version) if version else None
+        )
+
+    if version:
+        raise ValueError(f"feature_version is only supported by '{STDLIB_AST}': {spec}")
+
+    if name == TYPED_AST:
+        return TypedAstParserBackend()
+
+    if name == AUTO:
+        return default_parser_backend()
+
+    raise ValueError(f"Unknown parser backend: {spec}")
+
+
+@functools.lru_cache(maxsize=None)
+def default_parser_backend() -> ParserBackend:
+    """
+    実行中のPythonに合わせてパーサーを選択します。
+    Python 3.8 以降の標準ライブラリの ast は typed_ast より高速で、新しい文法にも対応しています。
+    """
+    if sys.version_info >= (3, 8):
+        return StdlibAstParserBackend()
+
+    try:
+        _import_typed_ast()
+    except ImportError:
+        return StdlibAstParserBackend()
+
+    return TypedAstParserBackend()
+
+
+def _parse_feature_version(version: str) -> Tuple[int, int]:
+    try:
+        major, minor = (int(v) for v in version.split("."))
+    except ValueError:
+        raise ValueError(f"Invalid feature_version: {version}") from None
+
+    return major, minor
+
+
+@functools.lru_cache(maxsize=None)
+def _import_typed_ast() -> ModuleType:
+    # typed_ast は読み込みに時間がかかるので、利用するときに初めて読み込む
+    return importlib.import_module("typed_ast.ast3")
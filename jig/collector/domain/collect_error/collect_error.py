@@ -0,0 +1,38 @@
+import dataclasses
+import enum
+from pathlib import Path
+
+# 収集できなかったファイルとして記録し、残りのファイルの収集を続ける例外
+# 深くネストした式の構文解析では RecursionError が発生する
+COLLECT_ERRORS = (OSError, SyntaxError, ValueError, RecursionError)
+
+
+class CollectPhase(enum.Enum):
+    """ソースコードの収集に失敗した処理"""
+
+    # ファイルの読み込み
+    READ = "read"
+    # エンコーディングの判定とデコード
+    DECODE = "decode"
+    # 構文解析と情報の抽出
+    PARSE = "parse"
+
+
+@dataclasses.dataclass(frozen=True)
+class CollectError:
+    """
+    収集できなかったソースファイルの情報。
+    path: ソースファイルのパス
+    phase: 失敗した処理
+    message: 例外の種類とメッセージ
+    """
+
+    path: str
+    phase: CollectPhase
+    message: str
+
+    @classmethod
+    def build(cls, path: Path, phase: CollectPhase, error: Exception) -> "CollectError":
+        return cls(
+            path=str(path), phase=phase, message=f"{type(error).__name__}: {error}"
+        )
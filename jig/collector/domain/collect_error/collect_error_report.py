@@ -0,0 +1,30 @@
+import dataclasses
+from typing import Iterable, List
+
+from jig.collector.domain.collect_error.collect_error import CollectError
+
+
+@dataclasses.dataclass
+class CollectErrorReport:
+    """
+    収集できなかったソースファイルの一覧。
+    収集処理に渡すと、失敗したファイルを記録して残りのファイルの収集を続ける。
+    """
+
+    errors: List[CollectError] = dataclasses.field(default_factory=list)
+
+    def __iter__(self):
+        return self.errors.__iter__()
+
+    def __len__(self):
+        return self.errors.__len__()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.errors
+
+    def add(self, error: CollectError) -> None:
+        self.errors.append(error)
+
+    def extend(self, errors: Iterable[CollectError]) -> None:
+        self.errors.extend(errors)
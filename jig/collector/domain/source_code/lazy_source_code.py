@@ -0,0 +1,69 @@
+import dataclasses
+from typing import Any, Callable, Optional
+
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+from jig.collector.domain.values.module_path import ModulePath
+
+# 最初にアクセスされたときに読み込む属性
+LAZY_FIELDS = tuple(field.name for field in dataclasses.fields(SourceCode))
+
+
+class LazySourceCode(SourceCode):
+    """
+    file, import_paths, class_defs に最初にアクセスしたときに、ファイルの読み込みと構文解析を行う SourceCode。
+    読み込んだ結果は保持して、2回目以降のアクセスでは再利用する。
+
+    module_path と source_file_path はファイルを読み込まずに返すので、モジュールの一覧や
+    パスでの絞り込みだけであれば、ディレクトリの走査以上のコストはかからない。
+    読み込みや構文解析に失敗した場合は、最初にアクセスしたときに例外を送出する。
+    """
+
+    _source_file_path: SourceFilePath
+    _load: Optional[Callable[[], SourceCode]]
+
+    def __init__(
+        self, source_file_path: SourceFilePath, load: Callable[[], SourceCode]
+    ):
+        """
+        :param source_file_path:
+        :param load: ファイルを読み込んで構文解析したソースコードを返す関数
+        """
+        object.__setattr__(self, "_source_file_path", source_file_path)
+        object.__setattr__(self, "_load", load)
+
+    @property
+    def source_file_path(self) -> SourceFilePath:
+        return self._source_file_path
+
+    @property
+    def module_path(self) -> ModulePath:
+        return self._source_file_path.module_path
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._load is None
+
+    def load(self) -> SourceCode:
+        """
+        ファイルを読み込んで構文解析し、結果を保持します。読み込み済みの場合は何もしません。
+        :return: 読み込んだ属性を持つ、このオブジェクト自身
+        """
+        load: Optional[Callable[[], SourceCode]] = self._load
+        if load is None:
+            return self
+
+        source_code = load()
+        for name in LAZY_FIELDS:
+            object.__setattr__(self, name, getattr(source_code, name))
+        # 読み込みに必要だった参照は、読み込み後は不要なので手放す
+        object.__setattr__(self, "_load", None)
+
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        # インスタンスの属性として設定されていない場合にだけ呼ばれる
+        if name not in LAZY_FIELDS:
+            raise AttributeError(name)
+
+        return object.__getattribute__(self.load(), name)
@@ -0,0 +1,54 @@
+import dataclasses
+import hashlib
+from typing import Dict, Optional, Sequence
+
+from jig.collector.domain.ast import (
+    ImportExtractor,
+    JigSourceCode,
+    NodeExtractorFactory,
+)
+from jig.collector.domain.ast.parser_backend import ParserBackend
+from jig.collector.domain.source_code.source_code import SourceCode, parse_source
+from jig.collector.domain.source_file.source_file import SourceFile
+
+
+@dataclasses.dataclass
+class ParsedSourceCache:
+    """
+    1回の収集の中で、内容が同じソースファイルの構文解析の結果を共有する。
+
+    構文解析の結果はファイルのパスに依存しないので、内容のハッシュ値をキーにして再利用し、
+    相対インポートの解決だけをファイルごとに行う。
+    収集を終えるまで全てのファイルの結果を保持するので、ASTへの参照は取り除いて抽出結果だけを保持する。
+    そのため、最初に構文解析したファイル以外のクラス定義はASTを参照しない。
+    """
+
+    extractor: ImportExtractor = ImportExtractor.AST
+    backend: Optional[ParserBackend] = None
+    extractors: Sequence[NodeExtractorFactory] = ()
+    # 内容のハッシュ値 -> ASTへの参照を取り除いた抽出結果
+    _parsed: Dict[bytes, JigSourceCode] = dataclasses.field(default_factory=dict)
+
+    def build(self, file: SourceFile) -> SourceCode:
+        """
+        ソースコードを構築します。同じ内容のファイルを構文解析済みであれば、その結果を再利用します。
+        :param file:
+        :return:
+        """
+        if file.content is None:
+            raise ValueError(f"The content of {file.filename} has been discarded.")
+
+        key = hashlib.sha256(file.content.encode("utf-8", "surrogateescape")).digest()
+
+        jig_source_code = self._parsed.get(key)
+        if jig_source_code is None:
+            jig_source_code = parse_source(
+                source=file.content,
+                filename=file.filename,
+                extractor=self.extractor,
+                backend=self.backend,
+                extractors=self.extractors,
+            )
+            self._parsed[key] = jig_source_code.without_ast()
+
+        return SourceCode.build_with_jig_source_code(file, jig_source_code)
@@ -1,54 +1,160 @@
 import dataclasses
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
-from jig.collector.domain.ast import ClassDef, JigSourceCode
+from jig.collector.domain.ast import (
+    ClassDef,
+    JigSourceCode,
+    ImportExtractor,
+    NodeExtractorFactory,
+)
+from jig.collector.domain.ast.import_scanner import build_jig_source_code
+from jig.collector.domain.ast.parser_backend import ParserBackend
+from jig.collector.domain.source_code.source_code_facts import SourceCodeFacts
 from jig.collector.domain.source_code.source_code_import_dependency import (
     SourceCodeImportDependency,
 )
-from jig.collector.domain.values.import_path_collection import ImportPathCollection
+from jig.collector.domain.values.import_path_collection import (
+    ImportPathCollection,
+    ImportPathCollectionBuilder,
+)
 from jig.collector.domain.values.module_path import ModulePath
 from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
 
 
 @dataclasses.dataclass(frozen=True)
 class SourceCode:
+    """
+    extras: 追加の抽出器(NodeExtractor)の name をキーにした抽出結果
+    """
+
     file: SourceFile
     import_paths: ImportPathCollection
     class_defs: List[ClassDef]
+    extras: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def source_file_path(self) -> SourceFilePath:
+        return self.file.source_file_path
 
     @property
     def module_path(self) -> ModulePath:
         return self.file.module_path
 
     @classmethod
-    def build(cls, file: SourceFile) -> "SourceCode":
-        jig_source_code = JigSourceCode.build(
-            source=file.content, filename=file.filename
+    def build(
+        cls,
+        file: SourceFile,
+        extractor: ImportExtractor = ImportExtractor.AST,
+        backend: Optional[ParserBackend] = None,
+        extractors: Sequence[NodeExtractorFactory] = (),
+    ) -> "SourceCode":
+        """
+        ソースコードを構文解析して構築します。
+        :param file:
+        :param extractor:
+        :param backend:
+        :param extractors: 追加で情報を抽出する抽出器を作成する関数。結果は extras に格納される
+        :return:
+        """
+        if file.content is None:
+            raise ValueError(f"The content of {file.filename} has been discarded.")
+
+        jig_source_code = parse_source(
+            source=file.content,
+            filename=file.filename,
+            extractor=extractor,
+            backend=backend,
+            extractors=extractors,
         )
 
+        return cls.build_with_jig_source_code(file, jig_source_code)
+
+    @classmethod
+    def build_with_jig_source_code(
+        cls, file: SourceFile, jig_source_code: JigSourceCode
+    ) -> "SourceCode":
         return SourceCode(
             file=file,
             import_paths=cls._build_import_paths(file, jig_source_code),
             class_defs=jig_source_code.class_defs,
+            extras=jig_source_code.extras,
+        )
+
+    @classmethod
+    def build_with_facts(cls, file: SourceFile, facts: SourceCodeFacts) -> "SourceCode":
+        return SourceCode(
+            file=file,
+            import_paths=facts.import_paths,
+            class_defs=[ClassDef(name=name) for name in facts.class_names],
+            extras=facts.extras,
+        )
+
+    def without_ast_and_content(self) -> "SourceCode":
+        """
+        ASTノードとソースコード本文への参照を取り除いたコピーを返します。
+        抽出済みの情報（インポートパス、クラス名、行番号、extras）は保持されます。
+        """
+        return SourceCode(
+            file=self.file.without_content(),
+            import_paths=self.import_paths,
+            class_defs=[class_def.without_ast() for class_def in self.class_defs],
+            extras=self.extras,
+        )
+
+    def facts(self) -> SourceCodeFacts:
+        return SourceCodeFacts(
+            import_paths=self.import_paths,
+            class_names=[class_def.name for class_def in self.class_defs],
+            extras=self.extras,
         )
 
     @classmethod
     def _build_import_paths(
         cls, file: SourceFile, jig_source_code: JigSourceCode
     ) -> ImportPathCollection:
-        import_paths = ImportPathCollection()
+        builder = ImportPathCollectionBuilder()
 
         for import_ast in jig_source_code.imports:
-            import_paths += ImportPathCollection.build_by_import_ast(import_ast)
+            builder.extend(ImportPathCollection.build_by_import_ast(import_ast))
 
         for import_from_ast in jig_source_code.import_froms:
-            import_paths += ImportPathCollection.build_by_import_from_ast(
-                file_path=file.source_file_path, import_from=import_from_ast
+            builder.extend(
+                file.source_file_path.import_from_to_import_paths(import_from_ast)
             )
 
-        return import_paths
+        return builder.build()
 
     def build_import_dependency(self) -> SourceCodeImportDependency:
         return SourceCodeImportDependency.build(
             source_module_path=self.file.module_path, import_paths=self.import_paths
         )
+
+
+def parse_source(
+    source: str,
+    filename: str,
+    extractor: ImportExtractor = ImportExtractor.AST,
+    backend: Optional[ParserBackend] = None,
+    extractors: Sequence[NodeExtractorFactory] = (),
+) -> JigSourceCode:
+    """
+    ソースコードを構文解析して、インポートとクラス定義を抽出します。
+    結果はファイルのパスに依存しないので、内容が同じファイルの間で共有できます。
+    :param source:
+    :param filename: エラーメッセージに使うファイル名
+    :param extractor:
+    :param backend:
+    :param extractors: 追加で情報を抽出する抽出器を作成する関数。
+                       指定した場合は、追加の抽出器がASTを必要とするので extractor によらずASTを構築する
+    :return:
+    """
+    if extractor == ImportExtractor.TOKEN and not extractors:
+        return build_jig_source_code(source=source, filename=filename, backend=backend)
+
+    return JigSourceCode.build(
+        source=source,
+        filename=filename,
+        extractors=[create() for create in extractors],
+        backend=backend,
+    )
@@ -1,12 +1,54 @@
 import dataclasses
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.values.module_path import ModulePath
 
 
 @dataclasses.dataclass(frozen=True)
 class SourceCodeCollection:
+    """
+    ソースコードの一覧。
+
+    相対パス、モジュールパス、パッケージのそれぞれをキーにした索引を生成時に1回だけ作るので、
+    検索はファイル数によらず一定の時間で済む。
+    同じキーを持つソースコードが複数ある場合（"foo.py" と "foo/__init__.py" など）、
+    相対パスとモジュールパスの検索は一覧の中で最初のものを返す。
+    """
+
     collection: List[SourceCode]
+    _by_relative_path: Dict[str, SourceCode] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _by_module_path: Dict[str, SourceCode] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    # パッケージのモジュールパス -> パッケージ自身とその配下のソースコード（一覧の順）
+    _by_package: Dict[str, List[SourceCode]] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        by_relative_path: Dict[str, SourceCode] = {}
+        by_module_path: Dict[str, SourceCode] = {}
+        by_package: Dict[str, List[SourceCode]] = {}
+
+        for source_code in self.collection:
+            # 遅延読み込みのソースコードを読み込まないように、file を経由せずにパスを参照する
+            relative_path = source_code.source_file_path.relative_path_from_root
+            by_relative_path.setdefault(str(relative_path), source_code)
+
+            module_path = source_code.module_path
+            by_module_path.setdefault(str(module_path), source_code)
+
+            prefix = ""
+            for name in module_path.names:
+                prefix = prefix + "." + name if prefix else name
+                by_package.setdefault(prefix, []).append(source_code)
+
+        object.__setattr__(self, "_by_relative_path", by_relative_path)
+        object.__setattr__(self, "_by_module_path", by_module_path)
+        object.__setattr__(self, "_by_package", by_package)
 
     def __iter__(self):
         return self.collection.__iter__()
@@ -18,8 +60,37 @@ class SourceCodeCollection:
         return self.collection.__getitem__(item)
 
     def get_by_relative_path(self, relative_path: str) -> Optional[SourceCode]:
-        for source_code in self.collection:
-            source_file_path = source_code.file.source_file_path
-            if str(source_file_path.relative_path_from_root) == relative_path:
-                return source_code
-        return None
+        return self._by_relative_path.get(relative_path)
+
+    def get_by_relative_paths(
+        self, relative_paths: Iterable[str]
+    ) -> List[Optional[SourceCode]]:
+        """
+        複数の相対パスのソースコードをまとめて検索します。
+        :param relative_paths: ルートからの相対パス
+        :return: relative_paths と同じ順序の検索結果。見つからないパスは None
+        """
+        by_relative_path = self._by_relative_path
+        return [by_relative_path.get(path) for path in relative_paths]
+
+    def get_by_module_path(self, module_path: ModulePath) -> Optional[SourceCode]:
+        return self._by_module_path.get(str(module_path))
+
+    def get_by_module_paths(
+        self, module_paths: Iterable[ModulePath]
+    ) -> List[Optional[SourceCode]]:
+        """
+        複数のモジュールパスのソースコードをまとめて検索します。
+        :param module_paths:
+        :return: module_paths と同じ順序の検索結果。見つからないモジュールは None
+        """
+        by_module_path = self._by_module_path
+        return [by_module_path.get(str(path)) for path in module_paths]
+
+    def filter_by_package(self, package: ModulePath) -> List[SourceCode]:
+        """
+        パッケージ自身と、その配下のモジュールのソースコードを一覧の順に返します。
+        :param package: "jig.collector" のようなパッケージのモジュールパス
+        :return:
+        """
+        return list(self._by_package.get(str(package), []))
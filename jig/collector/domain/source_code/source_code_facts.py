@@ -0,0 +1,17 @@
+import dataclasses
+from typing import Any, Dict, List
+
+from jig.collector.domain.values.import_path_collection import ImportPathCollection
+
+
+@dataclasses.dataclass(frozen=True)
+class SourceCodeFacts:
+    """
+    ソースコードの構文解析結果のうち、依存関係の分析に必要な情報だけを保持する。
+    ASTやソースコード本文を含まないので、プロセス間での受け渡しや永続化に利用できる。
+    extras: 追加の抽出器(NodeExtractor)の抽出結果。永続化はしない
+    """
+
+    import_paths: ImportPathCollection
+    class_names: List[str]
+    extras: Dict[str, Any] = dataclasses.field(default_factory=dict)
@@ -0,0 +1,48 @@
+from typing import Any, Callable, Optional
+
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+
+
+class LazySourceFile(SourceFile):
+    """
+    content に最初にアクセスしたときに、ファイルを読み込む SourceFile。
+    読み込んだ内容は保持して、2回目以降のアクセスでは再利用する。
+
+    抽出結果だけを受け取った場合など、ソースコード本文が必要になるまで読み込みを遅らせるために利用する。
+    読み込みに失敗した場合は、最初にアクセスしたときに例外を送出する。
+    """
+
+    _load_content: Optional[Callable[[], str]]
+
+    def __init__(
+        self,
+        source_file_path: SourceFilePath,
+        size: int,
+        load_content: Callable[[], str],
+    ):
+        """
+        :param source_file_path:
+        :param size:
+        :param load_content: ファイルを読み込んでソースコード本文を返す関数
+        """
+        object.__setattr__(self, "source_file_path", source_file_path)
+        object.__setattr__(self, "size", size)
+        object.__setattr__(self, "_load_content", load_content)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._load_content is None
+
+    def __getattr__(self, name: str) -> Any:
+        # インスタンスの属性として設定されていない場合にだけ呼ばれる
+        if name != "content":
+            raise AttributeError(name)
+
+        load_content = object.__getattribute__(self, "_load_content")
+        content = load_content()
+        object.__setattr__(self, "content", content)
+        # 読み込みに必要だった参照は、読み込み後は不要なので手放す
+        object.__setattr__(self, "_load_content", None)
+
+        return content
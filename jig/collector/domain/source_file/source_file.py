@@ -1,4 +1,5 @@
 import dataclasses
+from typing import Optional
 
 from jig.collector.domain.values.module_path import ModulePath
 from jig.collector.domain.source_file.source_file_path import SourceFilePath
@@ -8,7 +9,13 @@ from jig.collector.domain.source_file.source_file_path import SourceFilePath
 class SourceFile:
     source_file_path: SourceFilePath
     size: int
-    content: str = dataclasses.field(repr=False)
+    # 省メモリモードで収集した場合は None になる
+    content: Optional[str] = dataclasses.field(repr=False)
+
+    def without_content(self) -> "SourceFile":
+        return SourceFile(
+            source_file_path=self.source_file_path, size=self.size, content=None
+        )
 
     @property
     def filename(self):
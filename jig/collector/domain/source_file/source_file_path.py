@@ -20,7 +20,7 @@ class SourceFilePath:
         # root直下のファイルの場合、ファイル名がそのままモジュール名
         # そこからparentを辿ろうとするとパス表現が壊れる（"."になる）ため、root直下の場合は別で処理する
         if str(relative_path) == relative_path.name:
-            return ModulePath(names=[relative_path.stem])
+            return ModulePath.from_names([relative_path.stem])
 
         # ディレクトリ配下の場合はパッケージファイル（__init__.py）の可能性もあるのでそれを考慮する
         dirname = relative_path.parent
@@ -29,7 +29,7 @@ class SourceFilePath:
         if relative_path.stem != "__init__":
             names.append(relative_path.stem)
 
-        return ModulePath(names=names)
+        return ModulePath.from_names(names)
 
     @property
     def filename(self) -> str:
@@ -47,7 +47,7 @@ class SourceFilePath:
 
         names = str(parent).split(os.sep)
 
-        return ModulePath(names=names)
+        return ModulePath.from_names(names)
 
     def import_from_to_import_paths(self, import_from: ImportFrom) -> List[ImportPath]:
         """
@@ -0,0 +1,153 @@
+import dataclasses
+import weakref
+from typing import ClassVar, Iterable, List, Tuple, Type, TypeVar
+
+P = TypeVar("P", bound="DottedPath")
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class DottedPath:
+    """
+    "jig.collector.domain" のように名前を "." でつないだパスの基底クラス。
+
+    names は変更できないタプルで保持し、文字列表現とハッシュ値は生成時に1回だけ計算する。
+    from_str, join, parent などで得られるパスは、文字列表現をキーにクラスごとに共有（インターン）するので、
+    大量のパスを生成する解析でも大半は辞書の検索で済み、検証やリストの生成を繰り返さない。
+    共有は弱参照で行うので、どこからも参照されなくなったパスは解放される。
+    watch や history のように長く実行し続けても、これまでに現れた全てのパスを保持し続けることはない。
+    """
+
+    names: Tuple[str, ...]
+    _str: str = dataclasses.field(init=False, repr=False, compare=False)
+    _hash: int = dataclasses.field(init=False, repr=False, compare=False)
+
+    # 文字列表現 -> 共有しているパス（弱参照）。サブクラスごとに定義する
+    _interned: ClassVar["weakref.WeakValueDictionary[str, DottedPath]"]
+
+    def __post_init__(self):
+        names = tuple(self.names)
+        if any("." in name for name in names):
+            raise ValueError(f"An invalid name specified in `{list(names)}`")
+
+        self._set_names(names, ".".join(names))
+
+    def _set_names(self, names: Tuple[str, ...], path: str) -> None:
+        object.__setattr__(self, "names", names)
+        object.__setattr__(self, "_str", path)
+        object.__setattr__(self, "_hash", hash(names))
+
+    @classmethod
+    def _intern(cls: Type[P], names: Tuple[str, ...], path: str) -> P:
+        """
+        検証済みの names と、その文字列表現 path から、共有しているパスを返します。
+        "." を含まない名前を1つ以上つないだ文字列は names と1対1に対応するので、path だけで検索する。
+        :param names: "." を含まない名前の、空でないタプル
+        :param path: ".".join(names) と等しい文字列
+        :return:
+        """
+        interned = cls._interned.get(path)
+        if interned is not None:
+            return interned  # type: ignore
+
+        # 検証済みなので __post_init__ を経由せずに生成する
+        new_path = cls.__new__(cls)
+        new_path._set_names(names, path)
+        cls._interned[path] = new_path
+
+        return new_path
+
+    @classmethod
+    def from_str(cls: Type[P], path: str) -> P:
+        interned = cls._interned.get(path)
+        if interned is not None:
+            return interned  # type: ignore
+
+        return cls._intern(tuple(path.split(".")), path)
+
+    @classmethod
+    def from_names(cls: Type[P], names: Iterable[str]) -> P:
+        """
+        名前のリストから、共有しているパスを返します。
+        :param names:
+        :return:
+        """
+        names = tuple(names)
+        if not names:
+            # 空のパスは共有しない。ModulePath の場合は __post_init__ で例外を送出する
+            return cls(names=names)
+        if any("." in name for name in names):
+            raise ValueError(f"An invalid name specified in `{list(names)}`")
+
+        return cls._intern(names, ".".join(names))
+
+    def __add__(self: P, other: P) -> P:
+        return self.from_names(self.names + other.names)
+
+    def join(self: P, name: str) -> P:
+        """
+        パスを追加します
+        :param name:
+        :return:
+        """
+        if "." in name:
+            raise ValueError(
+                f"An invalid name specified in `{list(self.names) + [name]}`"
+            )
+
+        path = self._str + "." + name if self.names else name
+        return self._intern(self.names + (name,), path)
+
+    @property
+    def depth(self) -> int:
+        return len(self.names)
+
+    def path_in_depth(self: P, depth: int) -> P:
+        """
+        このパスを指定されたdepthだけ辿ったパスを新たに返します
+        :param depth:
+        :return:
+        """
+        assert depth > 0
+        if depth >= len(self.names):
+            return self
+
+        names = self.names[:depth]
+        return self._intern(names, ".".join(names))
+
+    def belongs_to(self, other: "DottedPath") -> bool:
+        """
+        パスがotherに含まれているかどうかを返します。
+        :param other:
+        :return:
+        """
+        if self.depth < other.depth:
+            return False
+
+        return self.names[: other.depth] == other.names
+
+    def __str__(self) -> str:
+        return self._str
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self._hash == other._hash and self.names == other.names
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # ハッシュ値はプロセスごとに異なりうるので、names だけを渡して再計算させる
+        return self.__class__, (self.names,)
+
+    def match_module_names(self, module_names: List[str]) -> bool:
+        return any(
+            [self.match_module_name(module_name) for module_name in module_names]
+        )
+
+    def match_module_name(self, module_name: str) -> bool:
+        path_str = self._str
+        return path_str == module_name or path_str.startswith(module_name + ".")
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import List
+from typing import FrozenSet, Iterable, List, Optional, Set
 
 from jig.collector.domain.ast import ImportFrom, Import
 from jig.collector.domain.values.import_path import ImportPath
@@ -9,12 +9,21 @@ from jig.collector.domain.source_file.source_file_path import SourceFilePath
 @dataclasses.dataclass(frozen=True)
 class ImportPathCollection:
     _paths: List[ImportPath] = dataclasses.field(default_factory=list)
+    # __contains__ で利用するインポートパスの集合。最初に必要になったときに作る
+    _members: Optional[FrozenSet[ImportPath]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __len__(self) -> int:
         return len(self._paths)
 
     def __contains__(self, item: ImportPath):
-        return item in self._paths
+        members = self._members
+        if members is None:
+            members = frozenset(self._paths)
+            object.__setattr__(self, "_members", members)
+
+        return item in members
 
     def __add__(self, other: "ImportPathCollection") -> "ImportPathCollection":
         return ImportPathCollection(self._paths + other._paths)
@@ -35,3 +44,51 @@ class ImportPathCollection:
 
         imports = file_path.import_from_to_import_paths(import_from)
         return cls(_paths=imports)
+
+
+class ImportPathCollectionBuilder:
+    """
+    インポートパスを1つずつ追加して ImportPathCollection を作る。
+
+    ImportPathCollection の + は毎回リスト全体をコピーするので、インポート文の数に対して
+    2乗の時間がかかるが、このクラスはリストに直接追加するので全体で線形の時間で済む。
+
+        builder = ImportPathCollectionBuilder(deduplicate=True)
+        builder.extend(import_paths)
+        collection = builder.build()
+
+    deduplicate: True の場合、追加済みのパスは追加せず、最初に追加した順序を保つ
+    """
+
+    def __init__(self, deduplicate: bool = False):
+        self.deduplicate = deduplicate
+        self._paths: List[ImportPath] = []
+        self._members: Set[ImportPath] = set()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, item: ImportPath) -> bool:
+        return item in self._members
+
+    def add(self, import_path: ImportPath) -> None:
+        if self.deduplicate and import_path in self._members:
+            return
+
+        self._paths.append(import_path)
+        self._members.add(import_path)
+
+    def extend(self, import_paths: Iterable[ImportPath]) -> None:
+        for import_path in import_paths:
+            self.add(import_path)
+
+    def build(self) -> "ImportPathCollection":
+        """
+        追加したインポートパスの ImportPathCollection を返します。
+        返した後も続けてパスを追加できます。追加したパスは返したコレクションには含まれません。
+        :return:
+        """
+        collection = ImportPathCollection(list(self._paths))
+        object.__setattr__(collection, "_members", frozenset(self._members))
+
+        return collection
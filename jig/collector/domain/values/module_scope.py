@@ -0,0 +1,79 @@
+import dataclasses
+from typing import Dict, Iterable, Optional, Tuple
+
+from jig.collector.domain.values.module_path import ModulePath
+
+
+@dataclasses.dataclass
+class _PrefixNode:
+    children: Dict[str, "_PrefixNode"] = dataclasses.field(default_factory=dict)
+    # このノードまでのモジュールパスを前置とする指定。True: 対象にする、False: 除外する
+    included: Optional[bool] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ModuleScope:
+    """
+    解析の対象にするモジュールの範囲。
+
+    include / exclude にはモジュールパスの前置（"jig.collector" など）を指定し、前置の木にまとめて保持する。
+    モジュールパスに一致する指定のうち最も長い前置のものに従い、どれにも一致しない場合は
+    include が1つも指定されていなければ対象とする。
+    値として比較・ハッシュするのは includes と excludes だけで、前置の木はそこから作る。
+    """
+
+    includes: Tuple[str, ...] = ()
+    excludes: Tuple[str, ...] = ()
+    _root: _PrefixNode = dataclasses.field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self):
+        root = _PrefixNode()
+        for prefix in self.includes:
+            self._insert(root, prefix, included=True)
+        for prefix in self.excludes:
+            self._insert(root, prefix, included=False)
+
+        object.__setattr__(self, "_root", root)
+
+    @classmethod
+    def build(
+        cls, includes: Iterable[str] = (), excludes: Iterable[str] = ()
+    ) -> "ModuleScope":
+        """
+        :param includes: 対象にするモジュールパスの前置
+        :param excludes: 除外するモジュールパスの前置。include と同じ前置の場合は除外を優先する
+        :return:
+        """
+        # 指定の順序や重複によらず、同じ範囲は等しい値になるようにする
+        return cls(
+            includes=tuple(sorted(set(includes))), excludes=tuple(sorted(set(excludes)))
+        )
+
+    @staticmethod
+    def _insert(root: _PrefixNode, prefix: str, included: bool) -> None:
+        node = root
+        for name in ModulePath.from_str(prefix).names:
+            node = node.children.setdefault(name, _PrefixNode())
+        node.included = included
+
+    def contains(self, module_path: ModulePath) -> bool:
+        """
+        モジュールが解析の対象かどうかを返します。
+        :param module_path:
+        :return:
+        """
+        included = not self.includes
+
+        node = self._root
+        for name in module_path.names:
+            child = node.children.get(name)
+            if child is None:
+                break
+
+            node = child
+            if node.included is not None:
+                included = node.included
+
+        return included
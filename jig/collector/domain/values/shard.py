@@ -0,0 +1,42 @@
+import dataclasses
+import hashlib
+
+
+@dataclasses.dataclass(frozen=True)
+class Shard:
+    """
+    収集対象のファイルを count 個に分割したうちの index 番目（1始まり）。
+    ファイルはルートからの相対パスのハッシュ値で分割するので、どのマシンで実行しても同じ分け方になる。
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self):
+        if self.count < 1 or not 1 <= self.index <= self.count:
+            raise ValueError(f"An invalid shard specified: {self.index}/{self.count}")
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+    @classmethod
+    def from_str(cls, value: str) -> "Shard":
+        """
+        "1/4" のような文字列から生成します。
+        :param value:
+        :return:
+        """
+        index, sep, count = value.partition("/")
+        try:
+            return cls(index=int(index), count=int(count))
+        except ValueError:
+            raise ValueError(f"An invalid shard specified: {value}") from None
+
+    def contains(self, relative_path: str) -> bool:
+        """
+        ファイルがこのシャードの担当かどうかを返します。
+        :param relative_path: ルートからの相対パス（"/" 区切り）
+        :return:
+        """
+        digest = hashlib.sha1(relative_path.encode("utf-8", "surrogateescape")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
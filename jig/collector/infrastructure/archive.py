@@ -0,0 +1,86 @@
+"""
+zip / wheel / tar.gz などのアーカイブから、ディスクに展開せずにファイルを読み込む。
+"""
+
+import dataclasses
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Iterator
+
+from jig.collector.infrastructure.source_decoder import decode_source
+
+ZIP_SUFFIXES = (".zip", ".whl", ".egg")
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+@dataclasses.dataclass(frozen=True)
+class ArchiveMember:
+    """
+    name: アーカイブ内のパス（"/" 区切り）
+    size: 展開後のサイズ
+    """
+
+    name: str
+    size: int
+    data: bytes = dataclasses.field(repr=False)
+
+    def decode(self) -> str:
+        """
+        PEP 263 のエンコーディング宣言に従ってデコードし、改行コードを "\\n" に揃えて返します。
+        """
+        return decode_source(self.data)
+
+
+def is_archive(path: Path) -> bool:
+    name = path.name.lower()
+    return name.endswith(ZIP_SUFFIXES) or name.endswith(TAR_SUFFIXES)
+
+
+def iter_archive_members(
+    archive_path: Path, predicate: Callable[[str], bool]
+) -> Iterator[ArchiveMember]:
+    """
+    アーカイブ内の通常ファイルのうち、名前が predicate を満たすものをアーカイブ内の順序で返します。
+    predicate を満たさないファイルの内容は読み込みません。
+    tar 形式は先頭から順に読むので、圧縮されていても全体を2回展開することはありません。
+    :param archive_path:
+    :param predicate: アーカイブ内のパスを受け取り、読み込む場合に True を返す関数
+    :return:
+    """
+    name = archive_path.name.lower()
+    if name.endswith(ZIP_SUFFIXES):
+        yield from _iter_zip_members(archive_path, predicate)
+    elif name.endswith(TAR_SUFFIXES):
+        yield from _iter_tar_members(archive_path, predicate)
+    else:
+        raise ValueError(f"Unsupported archive format: {archive_path}")
+
+
+def _iter_zip_members(
+    archive_path: Path, predicate: Callable[[str], bool]
+) -> Iterator[ArchiveMember]:
+    with zipfile.ZipFile(str(archive_path)) as zip_file:
+        for info in zip_file.infolist():
+            if info.is_dir() or not predicate(info.filename):
+                continue
+
+            yield ArchiveMember(
+                name=info.filename, size=info.file_size, data=zip_file.read(info)
+            )
+
+
+def _iter_tar_members(
+    archive_path: Path, predicate: Callable[[str], bool]
+) -> Iterator[ArchiveMember]:
+    # "r|*" はストリームとして先頭から順に読むモード
+    with tarfile.open(str(archive_path), mode="r|*") as tar_file:
+        for info in tar_file:
+            if not info.isfile() or not predicate(info.name):
+                continue
+
+            f = tar_file.extractfile(info)
+            if f is None:
+                continue
+
+            yield ArchiveMember(name=info.name, size=info.size, data=f.read())
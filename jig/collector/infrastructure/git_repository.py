@@ -0,0 +1,161 @@
+"""
+git のプラミングコマンドで、チェックアウトせずに任意のリビジョンのファイルを読み込む。
+"""
+
+import dataclasses
+import subprocess
+from pathlib import Path
+from typing import IO, List, Optional
+
+# 通常のファイルとして扱うモード。シンボリックリンク(120000)とサブモジュール(160000)は対象外
+REGULAR_FILE_MODES = ("100644", "100755")
+
+
+class GitError(Exception):
+    """git コマンドが失敗した場合の例外"""
+
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class GitBlob:
+    """
+    path: リポジトリのトップレベルからのパス（"/" 区切り）
+    """
+
+    path: str
+    oid: str
+    size: int
+
+
+def run_git(repo_path: Path, args: List[str]) -> bytes:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path)] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, "stderr", None) or b""
+        message = stderr.decode("utf-8", "replace").strip() or str(e)
+        raise GitError(f"git {args[0]} failed: {message}") from e
+
+    return result.stdout
+
+
+def show_prefix(repo_path: Path) -> str:
+    """
+    repo_path のリポジトリのトップレベルからの相対パスを返します。トップレベルの場合は空文字を返します。
+    """
+    prefix = run_git(repo_path, ["rev-parse", "--show-prefix"]).decode()
+    return prefix.strip().rstrip("/")
+
+
+def list_commits(
+    repo_path: Path, rev_range: str, first_parent: bool = False
+) -> List[str]:
+    """
+    リビジョンの範囲に含まれるコミットを `git rev-list` で古い順に列挙します。
+    :param repo_path:
+    :param rev_range: "v1.0..main" のようなリビジョンの範囲。単一のリビジョンの場合はその祖先すべて
+    :param first_parent: True の場合、マージコミットでは最初の親だけをたどる
+    :return: コミットのオブジェクトIDのリスト
+    """
+    args = ["rev-list", "--reverse", "--topo-order"]
+    if first_parent:
+        args.append("--first-parent")
+    args += [rev_range, "--"]
+
+    return run_git(repo_path, args).decode().split()
+
+
+def list_blobs(repo_path: Path, revision: str, path: str = "") -> List[GitBlob]:
+    """
+    リビジョンのツリーに含まれる通常のファイルを `git ls-tree` で列挙します。
+    :param repo_path:
+    :param revision:
+    :param path: 列挙するディレクトリ（リポジトリのトップレベルからのパス）。空文字の場合は全体
+    :return:
+    """
+    args = ["ls-tree", "-r", "-z", "-l", "--full-tree", revision]
+    if path:
+        args += ["--", path]
+
+    output = run_git(repo_path, args).decode("utf-8", "surrogateescape")
+
+    blobs = []
+    for entry in output.split("\0"):
+        if not entry:
+            continue
+
+        # "<mode> SP <type> SP <object> SP+ <size> TAB <path>"
+        meta, _, blob_path = entry.partition("\t")
+        mode, object_type, oid, size = meta.split()
+        if object_type != "blob" or mode not in REGULAR_FILE_MODES:
+            continue
+
+        blobs.append(GitBlob(path=blob_path, oid=oid, size=int(size)))
+
+    return blobs
+
+
+class GitCatFile:
+    """
+    1つの `git cat-file --batch` プロセスでオブジェクトを順に読み込む。
+    ファイルごとにプロセスを起動しないので、多数のファイルを読み込む場合でも速い。
+
+        with GitCatFile(repo_path) as cat_file:
+            data = cat_file.read(oid)
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "GitCatFile":
+        try:
+            self._process = subprocess.Popen(
+                ["git", "-C", str(self.repo_path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except OSError as e:
+            raise GitError(f"git cat-file failed: {e}") from e
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        if process.stdin:
+            process.stdin.close()
+        if process.stdout:
+            process.stdout.close()
+        process.wait()
+
+    def read(self, oid: str) -> bytes:
+        if self._process is None:
+            raise GitError("git cat-file is not running.")
+
+        stdin: IO[bytes] = self._process.stdin  # type: ignore
+        stdout: IO[bytes] = self._process.stdout  # type: ignore
+
+        stdin.write(oid.encode() + b"\n")
+        stdin.flush()
+
+        # "<oid> SP <type> SP <size> LF <contents> LF" または "<object> SP missing LF"
+        header = stdout.readline().decode().split()
+        if len(header) != 3:
+            raise GitError(f"git cat-file cannot read {oid}: {' '.join(header)}")
+
+        size = int(header[2])
+        data = stdout.read(size)
+        stdout.read(1)
+
+        return data
@@ -0,0 +1,172 @@
+import dataclasses
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple, Pattern
+
+
+@dataclasses.dataclass(frozen=True)
+class IgnorePattern:
+    """
+    .gitignore 形式の1行分のパターン。
+
+    negated: "!" で始まるパターン。一致したパスを除外の対象から外す
+    dir_only: "/" で終わるパターン。ディレクトリにだけ一致する
+    """
+
+    regex: Pattern[str]
+    negated: bool = False
+    dir_only: bool = False
+
+    @classmethod
+    def parse(cls, line: str) -> Optional["IgnorePattern"]:
+        """
+        .gitignore の1行をパースします。空行とコメント行の場合は None を返します。
+        :param line:
+        :return:
+        """
+        line = line.rstrip("\n").rstrip()
+        if not line or line.startswith("#"):
+            return None
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\"):
+            # "\#" や "\!" で始まるパターン
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        # 途中に "/" を含むパターンは .gitignore のあるディレクトリからの相対パスとして扱い、
+        # 含まないパターンはどの階層の名前にも一致させる
+        anchored = "/" in line
+        line = line.lstrip("/")
+
+        regex = _translate(line)
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+
+        return cls(regex=re.compile(regex), negated=negated, dir_only=dir_only)
+
+    def match(self, relative_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+
+        return self.regex.fullmatch(relative_path) is not None
+
+
+@dataclasses.dataclass(frozen=True)
+class IgnoreRules:
+    """
+    除外パターンの集合。
+
+    パターンはそれぞれ基準となるディレクトリ（.gitignore のあるディレクトリ）を持ち、
+    パスはその基準ディレクトリからの相対パスで照合する。
+    .gitignore と同様に、後から追加したパターンほど優先される。
+    """
+
+    _rules: Tuple[Tuple[str, Tuple[IgnorePattern, ...]], ...] = ()
+
+    @classmethod
+    def build(cls, lines: List[str], base_dir: str = "") -> "IgnoreRules":
+        return cls().extend(lines, base_dir=base_dir)
+
+    def extend(self, lines: List[str], base_dir: str = "") -> "IgnoreRules":
+        """
+        パターンを追加した IgnoreRules を返します。
+        :param lines: .gitignore 形式のパターン
+        :param base_dir: パターンの基準ディレクトリ。走査のルートからの "/" 区切りの相対パス
+        :return:
+        """
+        patterns = []
+        for line in lines:
+            pattern = IgnorePattern.parse(line)
+            if pattern:
+                patterns.append(pattern)
+
+        if not patterns:
+            return self
+
+        return IgnoreRules(self._rules + ((base_dir, tuple(patterns)),))
+
+    def extend_by_file(self, path: Path, base_dir: str = "") -> "IgnoreRules":
+        """
+        .gitignore ファイルのパターンを追加した IgnoreRules を返します。
+        ファイルが読めない場合はそのまま返します。
+        """
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return self
+
+        return self.extend(lines, base_dir=base_dir)
+
+    def is_ignored(self, relative_path: str, is_dir: bool) -> bool:
+        """
+        パスが除外対象かどうかを返します。
+        :param relative_path: 走査のルートからの "/" 区切りの相対パス
+        :param is_dir:
+        :return:
+        """
+        ignored = False
+        for base_dir, patterns in self._rules:
+            if base_dir:
+                if not relative_path.startswith(base_dir + "/"):
+                    continue
+                start = len(base_dir) + 1
+                path = relative_path[start:]
+            else:
+                path = relative_path
+
+            for pattern in patterns:
+                if pattern.negated == ignored and pattern.match(path, is_dir):
+                    ignored = not pattern.negated
+
+        return ignored
+
+
+def _translate(pattern: str) -> str:
+    """gitignore のワイルドカードを正規表現に変換する"""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex += "/.*"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif c == "*":
+            regex += "[^/]*"
+            i += 1
+        elif c == "?":
+            regex += "[^/]"
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end < 0:
+                regex += re.escape(c)
+                i += 1
+                continue
+
+            start = i + 1
+            body = pattern[start:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            regex += "[" + body.replace("\\", "\\\\") + "]"
+            i = end + 1
+        elif c == "\\" and i + 1 < len(pattern):
+            regex += re.escape(pattern[i + 1])
+            i += 2
+        else:
+            regex += re.escape(c)
+            i += 1
+
+    return regex
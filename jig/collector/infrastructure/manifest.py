@@ -0,0 +1,91 @@
+"""
+収集対象のソースファイルの一覧（マニフェスト）を読み込む。
+
+マニフェストは1行に1ファイルのパスを書いたテキストで、相対パスはプロジェクトルートを基準にする。
+空行と "#" で始まる行は無視する。
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, TextIO
+
+# マニフェストの指定方法
+STDIN = "-"
+GIT = "git"
+
+
+class ManifestError(Exception):
+    """マニフェストを読み込めない場合の例外"""
+
+    pass
+
+
+def read_manifest(lines: Iterable[str], base_path: Path) -> List[Path]:
+    """
+    マニフェストの各行をパスに変換します。Pythonファイル以外のパスは無視します。
+    :param lines:
+    :param base_path: 相対パスの基準ディレクトリ
+    :return:
+    """
+    paths = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        path = Path(line)
+        if path.suffix != ".py":
+            continue
+
+        paths.append(path if path.is_absolute() else base_path.joinpath(path))
+
+    return paths
+
+
+def load_manifest(
+    manifest: str, base_path: Path, stdin: Optional[TextIO] = None
+) -> List[Path]:
+    """
+    マニフェストを読み込みます。
+    :param manifest: マニフェストファイルのパス、標準入力から読む場合は "-"、
+                     git で管理されているファイルを対象にする場合は "git"
+    :param base_path: 相対パスの基準ディレクトリ（プロジェクトルート）
+    :param stdin: 標準入力の代わりに読み込むストリーム
+    :return:
+    """
+    if manifest == STDIN:
+        return read_manifest(stdin or sys.stdin, base_path=base_path)
+
+    if manifest == GIT:
+        return git_ls_files(base_path)
+
+    try:
+        with open(manifest, encoding="utf-8") as f:
+            return read_manifest(f, base_path=base_path)
+    except OSError as e:
+        raise ManifestError(f"Cannot read the manifest {manifest}: {e}") from e
+
+
+def git_ls_files(repo_path: Path) -> List[Path]:
+    """
+    `git ls-files '*.py'` の結果をマニフェストとして読み込みます。
+    repo_path がリポジトリのサブディレクトリの場合は、その中のファイルだけが対象になります。
+    :param repo_path:
+    :return:
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path), "ls-files", "-z", "--", "*.py"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, "stderr", None) or b""
+        message = stderr.decode("utf-8", "replace").strip() or str(e)
+        raise ManifestError(f"git ls-files failed: {message}") from e
+
+    # -z を指定すると、特殊な文字を含むパスもクォートされずにNUL区切りで出力される
+    names = result.stdout.decode("utf-8", "surrogateescape").split("\0")
+    return read_manifest(names, base_path=repo_path)
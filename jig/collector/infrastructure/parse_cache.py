@@ -0,0 +1,144 @@
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, List, Tuple
+
+from jig.collector.domain.source_code.source_code_facts import SourceCodeFacts
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.import_path_collection import ImportPathCollection
+
+# キャッシュの保存形式を変更した場合はこの値を上げて、古いエントリを無効にする
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+ENTRY_SUFFIX = ".json"
+
+
+@dataclasses.dataclass(frozen=True)
+class ParseCache:
+    """
+    ソースファイルの構文解析結果をディスクに保存するキャッシュ。
+
+    エントリはルートディレクトリとファイルのパスをキーに保存し、
+    ファイルの (mtime, size, 内容のハッシュ値) が一致する場合だけ利用する。
+    書き込みは一時ファイルからの rename で行うので、複数プロセスから同時に使っても
+    壊れたエントリが読まれることはない。
+    キャッシュ全体の容量が max_size を超えた場合は、最後に使われた日時が古いものから削除する。
+    """
+
+    cache_dir: Path
+    max_size: int = DEFAULT_MAX_SIZE
+
+    def load(self, file: SourceFile, mtime_ns: int) -> Optional[SourceCodeFacts]:
+        entry_path = self._entry_path(file)
+        try:
+            with open(str(entry_path), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        if entry.get("mtime_ns") != mtime_ns or entry.get("size") != file.size:
+            return None
+        if entry.get("content_hash") != self._content_hash(file):
+            return None
+
+        # LRUのために最終利用日時として mtime を更新する
+        try:
+            os.utime(str(entry_path))
+        except OSError:
+            pass
+
+        return SourceCodeFacts(
+            import_paths=ImportPathCollection(
+                [ImportPath.from_names(names) for names in entry["import_paths"]]
+            ),
+            class_names=entry["class_names"],
+        )
+
+    def store(self, file: SourceFile, mtime_ns: int, facts: SourceCodeFacts) -> None:
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "mtime_ns": mtime_ns,
+            "size": file.size,
+            "content_hash": self._content_hash(file),
+            "import_paths": [import_path.names for import_path in facts.import_paths],
+            "class_names": facts.class_names,
+        }
+
+        entry_path = self._entry_path(file)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(entry_path.parent), suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, str(entry_path))
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def prune(self) -> None:
+        """
+        キャッシュの容量が max_size 以下になるまで、最後に使われた日時が古いエントリから削除します。
+        :return:
+        """
+        entries: List[Tuple[int, int, str]] = []
+        total_size = 0
+        for cur_dir, dirs, files in os.walk(str(self.cache_dir)):
+            for file in files:
+                if not file.endswith(ENTRY_SUFFIX):
+                    continue
+
+                path = os.path.join(cur_dir, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+                total_size += stat.st_size
+
+        if total_size <= self.max_size:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                # 他のプロセスが先に削除した場合など
+                pass
+
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+
+    def _entry_path(self, file: SourceFile) -> Path:
+        source_file_path = file.source_file_path
+        key_source = "\0".join(
+            [
+                str(source_file_path.root_path.absolute()),
+                str(source_file_path.file_path.absolute()),
+            ]
+        )
+        key = hashlib.sha256(key_source.encode("utf-8", "surrogateescape")).hexdigest()
+
+        return self.cache_dir.joinpath(key[:2], key + ENTRY_SUFFIX)
+
+    @staticmethod
+    def _content_hash(file: SourceFile) -> str:
+        assert file.content is not None
+
+        content = file.content.encode("utf-8", "surrogateescape")
+        return hashlib.sha256(content).hexdigest()
@@ -0,0 +1,50 @@
+"""
+ファイルの読み込みのような I/O 待ちの処理をスレッドプールで先行して実行する。
+
+ネットワークファイルシステムのように1回の読み込みの待ち時間が長い場合でも、
+複数の読み込みを同時に実行しながら、読み込み済みのものから順に処理できる。
+"""
+
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 同時に実行する読み込みの数に対する、先行して読み込んでおく数の倍率
+PREFETCH_FACTOR = 2
+
+
+def prefetch(
+    items: Iterable[T], fetch: Callable[[T], R], concurrency: int
+) -> Iterator[Tuple[T, "Future[R]"]]:
+    """
+    items の各要素に対する fetch をスレッドプールで先行して実行し、items の順に (要素, Future) を返します。
+    fetch の例外は Future.result() を呼び出したときに送出されます。
+    同時に実行する fetch は concurrency 個までで、結果を受け取っていない fetch は
+    concurrency * PREFETCH_FACTOR 個までです。items は必要になった分だけ順に取り出します。
+    :param items:
+    :param fetch: スレッドプールで実行する処理
+    :param concurrency: 同時に実行する fetch の数の上限
+    :return:
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be positive: {concurrency}")
+
+    max_pending = concurrency * PREFETCH_FACTOR
+    pending: Deque[Tuple[T, "Future[R]"]] = collections.deque()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for item in items:
+                pending.append((item, executor.submit(fetch, item)))
+                if len(pending) >= max_pending:
+                    yield pending.popleft()
+
+            while pending:
+                yield pending.popleft()
+        finally:
+            # 途中で打ち切られた場合は、まだ始まっていない fetch を実行しない
+            for _, future in pending:
+                future.cancel()
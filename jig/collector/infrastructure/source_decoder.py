@@ -0,0 +1,13 @@
+import io
+import tokenize
+
+
+def decode_source(data: bytes) -> str:
+    """
+    PEP 263 のエンコーディング宣言に従ってソースコードをデコードし、改行コードを "\\n" に揃えて返します。
+    :param data:
+    :return:
+    """
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+    with io.TextIOWrapper(io.BytesIO(data), encoding=encoding) as f:
+        return f.read()
@@ -0,0 +1,140 @@
+import dataclasses
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from jig.collector.infrastructure.ignore_rules import IgnoreRules
+
+# 解析の対象にしないディレクトリ（.gitignore 形式）。
+# venv, build, dist は走査のルート直下のものだけを除外し、
+# mypkg/build/ のようなパッケージの中の同名のディレクトリは除外しない
+DEFAULT_EXCLUDES: Tuple[str, ...] = (
+    ".git/",
+    ".hg/",
+    ".svn/",
+    ".tox/",
+    ".nox/",
+    ".venv/",
+    "/venv/",
+    "node_modules/",
+    "__pycache__/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    "/build/",
+    "/dist/",
+    "*.egg-info/",
+)
+
+GITIGNORE = ".gitignore"
+
+
+@dataclasses.dataclass(frozen=True)
+class WalkedFile:
+    """
+    走査で見つかったソースファイル。
+    size, mtime_ns は走査時に取得した stat の値で、ファイルを読み込むときに再利用する。
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+@dataclasses.dataclass(frozen=True)
+class SourceFileWalker:
+    """
+    os.scandir でディレクトリを走査し、モジュールとして扱えるPythonファイルを返す。
+
+    除外対象のディレクトリや、名前に "." を含むためにパッケージとして扱えないディレクトリは
+    中に降りる前に刈り込む。
+    excludes には走査のルートを基準にした .gitignore 形式のパターンを指定する。
+    use_gitignore が True の場合は、走査したディレクトリにある .gitignore のパターンも適用する。
+    .gitignore に一致するファイルは、os.walk で走査していたときとは異なり収集されないので、
+    全てのファイルを対象にする場合は use_gitignore を False にする。
+    """
+
+    excludes: Tuple[str, ...] = DEFAULT_EXCLUDES
+    use_gitignore: bool = True
+
+    def walk(self, target_path: Path) -> Iterator[WalkedFile]:
+        """
+        target_path 以下のPythonファイルを返します。
+        同じディレクトリの中のファイルはサブディレクトリより先に、名前の順に返します。
+        :param target_path:
+        :return:
+        """
+        rules = IgnoreRules.build(list(self.excludes))
+
+        # (ディレクトリのパス, ルートからの相対パス, 適用する除外パターン)
+        stack: List[Tuple[str, str, IgnoreRules]] = [(str(target_path), "", rules)]
+        while stack:
+            dir_path, relative_dir, rules = stack.pop()
+
+            if self.use_gitignore:
+                rules = rules.extend_by_file(
+                    Path(dir_path, GITIGNORE), base_dir=relative_dir
+                )
+
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            sub_dirs = []
+            for entry in entries:
+                relative_path = _join(relative_dir, entry.name)
+
+                if _is_dir(entry):
+                    # 名前に "." を含むディレクトリ以下のファイルはモジュールとして扱えない
+                    if "." in entry.name:
+                        continue
+                    if rules.is_ignored(relative_path, is_dir=True):
+                        continue
+
+                    sub_dirs.append((entry.path, relative_path, rules))
+                    continue
+
+                if not _is_module_file_name(entry.name):
+                    continue
+                if rules.is_ignored(relative_path, is_dir=False):
+                    continue
+
+                walked_file = _walked_file(entry)
+                if walked_file is None:
+                    continue
+
+                yield walked_file
+
+            # スタックから取り出す順序が名前の順になるように逆順で積む
+            stack.extend(reversed(sub_dirs))
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    # os.walk と同様に、シンボリックリンクのディレクトリはたどらない
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
+
+
+def _is_module_file_name(name: str) -> bool:
+    # 拡張子を除いた名前に "." を含むファイルはモジュールとして扱えない
+    return name.endswith(".py") and "." not in name[:-3]
+
+
+def _walked_file(entry: os.DirEntry) -> Optional[WalkedFile]:
+    try:
+        if not entry.is_file():
+            return None
+        stat = entry.stat()
+    except OSError:
+        return None
+
+    return WalkedFile(
+        path=Path(entry.path), size=stat.st_size, mtime_ns=stat.st_mtime_ns
+    )
+
+
+def _join(relative_dir: str, name: str) -> str:
+    return relative_dir + "/" + name if relative_dir else name
@@ -1,26 +1,62 @@
+import collections
 import os
 import subprocess
 import textwrap
-from typing import List
+from typing import List, Dict, Counter, Tuple, Iterable
 
 from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.visualizer.module_dependency.domain.value.penwidth import PenWidth
 
 
 class ModuleDependencyVisualizer:
     def __init__(self, dependencies: List[ModuleDependency]):
         self.dependencies = dependencies
+        # 深さごとのエッジの出現数。update() で差分だけを反映するために保持する
+        self._edge_counts: Dict[int, Counter[Tuple[str, str]]] = {}
 
-    def dot_text(self, depth: int) -> str:
-        result = []
-        for dep in self.dependencies:
-            path1 = str(dep.src.path_in_depth(depth))
-            path2 = str(dep.dest.path_in_depth(depth))
+    def update(
+        self, added: List[ModuleDependency], removed: List[ModuleDependency]
+    ) -> List[int]:
+        """
+        依存関係の追加・削除を反映し、出力するエッジが変化した深さのリストを返します。
+        :param added: 追加された依存関係
+        :param removed: 削除された依存関係
+        :return:
+        """
+        counts = self._count_dependencies(self.dependencies)
+        counts.update(self._count_dependencies(added))
+        counts.subtract(self._count_dependencies(removed))
+        self.dependencies = [
+            ModuleDependency.from_str(src, dest, count=count)
+            for (src, dest), count in counts.items()
+            if count > 0
+        ]
 
-            # 自己参照は依存関係分析的には意味ないので除く
-            if path1 == path2:
-                continue
+        changed_depths = []
+        for depth, edge_counts in self._edge_counts.items():
+            before = self._edge_penwidths(edge_counts)
+            edge_counts.update(self._count_edges_in_depth(added, depth))
+            edge_counts.subtract(self._count_edges_in_depth(removed, depth))
+            edge_counts += collections.Counter()  # 出現数が0以下のエッジを取り除く
+
+            if self._edge_penwidths(edge_counts) != before:
+                changed_depths.append(depth)
+
+        return changed_depths
 
-            result.append(f'"{path1}" -> "{path2}";')
+    def dot_text(self, depth: int) -> str:
+        edge_counts = self._edge_counts.get(depth)
+        if edge_counts is None:
+            edge_counts = self._count_edges_in_depth(self.dependencies, depth)
+            self._edge_counts[depth] = edge_counts
+
+        result = []
+        for (path1, path2), penwidth in self._edge_penwidths(edge_counts).items():
+            if penwidth == PenWidth.to_size(PenWidth.Normal):
+                result.append(f'"{path1}" -> "{path2}";')
+            else:
+                # 依存関係の数が多いエッジほど太く描く
+                result.append(f'"{path1}" -> "{path2}" [penwidth={penwidth}];')
 
         # 設定テキスト
         setting_text = """
@@ -53,6 +89,44 @@ class ModuleDependencyVisualizer:
 
         return "\n".join(graph_text)
 
+    @staticmethod
+    def _count_dependencies(
+        dependencies: Iterable[ModuleDependency],
+    ) -> Counter[Tuple[str, str]]:
+        counter: Counter[Tuple[str, str]] = collections.Counter()
+        for dep in dependencies:
+            counter[(str(dep.src), str(dep.dest))] += dep.count
+
+        return counter
+
+    @staticmethod
+    def _count_edges_in_depth(
+        dependencies: Iterable[ModuleDependency], depth: int
+    ) -> Counter[Tuple[str, str]]:
+        """
+        指定した深さのエッジごとに、まとめられる依存関係の数(count)の合計を返します。
+        """
+        counter: Counter[Tuple[str, str]] = collections.Counter()
+        for dep in dependencies:
+            path1 = str(dep.src.path_in_depth(depth))
+            path2 = str(dep.dest.path_in_depth(depth))
+
+            # 自己参照は依存関係分析的には意味ないので除く
+            if path1 == path2:
+                continue
+
+            counter[(path1, path2)] += dep.count
+
+        return counter
+
+    @staticmethod
+    def _edge_penwidths(
+        edge_counts: Counter[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], str]:
+        return {
+            edge: PenWidth.size_for_weight(count) for edge, count in edge_counts.items()
+        }
+
     def render_dot_text(self, depth: int, output_dir: str) -> None:
         os.makedirs(output_dir, exist_ok=True)
 
@@ -0,0 +1,81 @@
+import dataclasses
+from typing import Dict, Iterable, List, Tuple
+
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.collector.domain.values.module_path import ModulePath
+from jig.visualizer.module_dependency.domain.model.master_graph import MasterGraph
+from jig.visualizer.module_dependency.domain.value.module_edge import (
+    ModuleEdge,
+    ModuleEdgeCollection,
+)
+from jig.visualizer.module_dependency.domain.value.module_node import ModuleNode
+
+
+@dataclasses.dataclass
+class MasterGraphBuilder:
+    """
+    解析結果の依存関係から、文字列のタプルを経由せずに MasterGraph を作る。
+
+    同じモジュール間の依存関係は1本のエッジにまとめ、依存関係の数(count)の合計をエッジの weight にする。
+    ノードはモジュールごとに1つだけ作って全てのエッジで共有する。
+    """
+
+    _nodes: Dict[ModulePath, ModuleNode] = dataclasses.field(default_factory=dict)
+    # (src, dest) -> weight。追加した順序を保つ
+    _weights: Dict[Tuple[ModulePath, ModulePath], int] = dataclasses.field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def build_from_import_dependencies(
+        cls, collection: ImportDependencyCollection
+    ) -> MasterGraph:
+        """
+        インポートの依存情報から、重複のないエッジの MasterGraph を作ります。
+        :param collection:
+        :return:
+        """
+        builder = cls()
+        builder.add_dependencies(collection.build_module_dependencies())
+
+        return builder.build()
+
+    def add_dependencies(self, dependencies: Iterable[ModuleDependency]) -> None:
+        for dependency in dependencies:
+            self.add_dependency(dependency)
+
+    def add_dependency(self, dependency: ModuleDependency) -> None:
+        key = (dependency.src, dependency.dest)
+        self._weights[key] = self._weights.get(key, 0) + dependency.count
+
+    def to_edge(self, dependency: ModuleDependency) -> ModuleEdge:
+        """
+        依存関係を、依存関係の数を weight に持つエッジに変換します。ノードは作成済みのものを再利用します。
+        :param dependency:
+        :return:
+        """
+        return ModuleEdge(
+            tail=self._node(dependency.src),
+            head=self._node(dependency.dest),
+            weight=dependency.count,
+        )
+
+    def to_edges(self, dependencies: Iterable[ModuleDependency]) -> List[ModuleEdge]:
+        return [self.to_edge(dependency) for dependency in dependencies]
+
+    def build(self) -> MasterGraph:
+        edges = [
+            ModuleEdge(tail=self._node(src), head=self._node(dest), weight=weight)
+            for (src, dest), weight in self._weights.items()
+        ]
+
+        return MasterGraph(edges=ModuleEdgeCollection(edges))
+
+    def _node(self, module_path: ModulePath) -> ModuleNode:
+        node = self._nodes.get(module_path)
+        if node is None:
+            node = ModuleNode.from_str(str(module_path))
+            self._nodes[module_path] = node
+
+        return node
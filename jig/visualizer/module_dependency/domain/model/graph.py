@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Set, List, Dict, Optional, Union
+from typing import Set, List, Dict, Iterator, Optional, Tuple, Union
 
 from jig.visualizer.module_dependency.domain.model.graph_style import GraphStyle
 from jig.visualizer.module_dependency.domain.model.hide_filter import HideFilter
@@ -62,6 +62,151 @@ class Graph:
             else:
                 self.add_edge(ModuleEdge.from_str(tail=tail, head=head))
 
+    def apply_master_graph_changes(
+        self, added_edges: List[ModuleEdge], removed_edges: List[ModuleEdge]
+    ) -> None:
+        """
+        MasterGraphのエッジを追加・削除し、変化したエッジだけを現在のグラフに反映する。
+        グラフの表示状態（dig, remove, focus などの操作結果）はそのまま維持する。
+        :param added_edges: MasterGraphに追加するエッジ
+        :param removed_edges: MasterGraphから削除するエッジ
+        :return:
+        """
+        # エッジごとに has_module で全てのエッジを調べないよう、モジュールのパスの集合を1回だけ作る
+        module_paths = self.master_graph.list_module_paths()
+        new_module_nodes = set()
+        for edge in added_edges:
+            for node in [edge.tail, edge.head]:
+                if node.path not in module_paths:
+                    new_module_nodes.add(node)
+
+        self.master_graph.remove_edges(removed_edges)
+        self.master_graph.add_edges(added_edges)
+
+        # 新しく登場したモジュールは、表示中のノードに含まれなければノードとして追加する
+        # (利用者がremoveしたノードは復活させない)
+        for node in sorted(new_module_nodes):
+            self._add_new_module_node(node)
+
+        current_nodes = self.list_all_nodes()
+        visible_nodes = self._index_nodes_by_path(current_nodes)
+
+        # 残っているMasterGraphのエッジに対応する表示上のエッジ。
+        # 削除するエッジごとに全てのエッジを調べないよう、1回だけ作る
+        remaining_visible_edges: Set[ModuleEdge] = set()
+        if removed_edges:
+            remaining_visible_edges = {
+                visible_edge
+                for _, visible_edge in self._iter_visible_edges(visible_nodes)
+            }
+
+        for edge in removed_edges:
+            visible_edge = self._find_visible_edge(edge, visible_nodes)
+            if not visible_edge or visible_edge not in self.edges:
+                continue
+
+            # 同じ表示上のエッジに対応するMasterGraphのエッジが残っていれば削除しない
+            if visible_edge in remaining_visible_edges:
+                continue
+
+            self.edges.remove(visible_edge)
+
+        for edge in added_edges:
+            visible_edge = self._find_visible_edge(edge, visible_nodes)
+            if visible_edge:
+                self.add_edge(visible_edge)
+
+        # MasterGraphに存在しなくなったモジュールのノードを取り除く
+        module_paths = self.master_graph.list_module_paths()
+        for node in current_nodes:
+            if node.path not in module_paths:
+                self.remove_node(node)
+
+    def _add_new_module_node(self, node: ModuleNode) -> None:
+        visible_nodes = self._index_nodes_by_path(self.list_all_nodes())
+        if self._find_visible_node(node, visible_nodes):
+            return
+
+        # dig済みのクラスタの配下であれば、そのクラスタの1つ下の階層のノードとして追加する
+        for depth in range(node.path_level - 1, 0, -1):
+            cluster = self.find_cluster(node.path_in_depth(depth))
+            if cluster:
+                new_node = node.limit_path_level(depth + 1)
+                cluster.add(new_node)
+                self.add_node(new_node)
+                return
+
+        self.add_node(ModuleNode(node.path_in_depth(1)))
+
+    @staticmethod
+    def _index_nodes_by_path(
+        current_nodes: List[ModuleNode],
+    ) -> Dict[ModulePath, ModuleNode]:
+        """表示中のノードを、パスから引けるようにする"""
+        return {n.path: n for n in current_nodes}
+
+    @staticmethod
+    def _find_visible_node(
+        node: ModuleNode, visible_nodes: Dict[ModulePath, ModuleNode]
+    ) -> Optional[ModuleNode]:
+        """
+        MasterGraphのノードを含む、表示中のノードのうち最も深い階層のものを返す。
+        表示中の全てのノードを調べる代わりに、ノードのパスを深い階層から順に辿って探す
+        """
+        for depth in range(node.path_level, 0, -1):
+            visible_node = visible_nodes.get(node.path_in_depth(depth))
+            if visible_node:
+                return visible_node
+
+        return None
+
+    @classmethod
+    def _find_visible_edge(
+        cls, edge: ModuleEdge, visible_nodes: Dict[ModulePath, ModuleNode]
+    ) -> Optional[ModuleEdge]:
+        """MasterGraphのエッジを、表示中のノード間のエッジに変換する"""
+        tail = cls._find_visible_node(edge.tail, visible_nodes)
+        head = cls._find_visible_node(edge.head, visible_nodes)
+        if not tail or not head or tail == head:
+            return None
+
+        return ModuleEdge(tail=tail, head=head)
+
+    def edge_weights(self) -> Dict[ModuleEdge, int]:
+        """
+        表示中のエッジごとに、そのエッジにまとめられるMasterGraphのエッジの weight の合計を返す
+        """
+        weights: Dict[ModuleEdge, int] = {}
+        visible_nodes = self._index_nodes_by_path(self.list_all_nodes())
+        for edge, visible_edge in self._iter_visible_edges(visible_nodes):
+            if visible_edge in self.edges:
+                weights[visible_edge] = weights.get(visible_edge, 0) + edge.weight
+
+        return weights
+
+    def _iter_visible_edges(
+        self, visible_nodes: Dict[ModulePath, ModuleNode]
+    ) -> Iterator[Tuple[ModuleEdge, ModuleEdge]]:
+        """
+        MasterGraphのエッジと、そのエッジを変換した表示中のノード間のエッジの組を返す。
+        表示中のノード間のエッジに変換できないエッジは含まない。
+        同じノードを表示中のノードに変換する処理は、ノードごとに1回だけ実行する
+        """
+        found_nodes: Dict[ModuleNode, Optional[ModuleNode]] = {}
+
+        def find_visible_node(node: ModuleNode) -> Optional[ModuleNode]:
+            if node not in found_nodes:
+                found_nodes[node] = self._find_visible_node(node, visible_nodes)
+            return found_nodes[node]
+
+        for edge in self.master_graph.edges:
+            tail = find_visible_node(edge.tail)
+            head = find_visible_node(edge.head)
+            if not tail or not head or tail == head:
+                continue
+
+            yield edge, ModuleEdge(tail=tail, head=head)
+
     def to_dict(self) -> dict:
         nodes = sorted([n.name for n in self.nodes])
         edges = sorted([(e.tail.name, e.head.name) for e in self.edges])
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional, List, Tuple, Iterator
+from typing import Optional, List, Set, Tuple, Iterator
 
 from jig.visualizer.module_dependency.domain.value.module_edge import (
     ModuleEdge,
@@ -22,6 +22,14 @@ class MasterGraph:
     def from_tuple_list(cls, edges: List[Tuple[str, str]]) -> "MasterGraph":
         return cls(ModuleEdgeCollection.from_tuple_list(edges))
 
+    def add_edges(self, edges: List[ModuleEdge]) -> None:
+        for edge in edges:
+            self.edges.add(edge)
+
+    def remove_edges(self, edges: List[ModuleEdge]) -> None:
+        for edge in edges:
+            self.edges.remove(edge)
+
     def has_module(self, path: ModulePath) -> bool:
         for edge in self.edges:
             if any([node.path.belongs_to(path) for node in [edge.tail, edge.head]]):
@@ -29,6 +37,21 @@ class MasterGraph:
 
         return False
 
+    def list_module_paths(self) -> Set[ModulePath]:
+        """
+        エッジのノードのモジュールと、その親のパッケージのパスを全て返す。
+        path in list_module_paths() は has_module(path) と同じ結果になるので、
+        多くのパスを判定する場合は、この集合を1回だけ作って判定する。
+        :return:
+        """
+        paths = set()
+        for edge in self.edges:
+            for node in [edge.tail, edge.head]:
+                for depth in range(1, node.path_level + 1):
+                    paths.add(node.path_in_depth(depth))
+
+        return paths
+
     def find_adjacent_graph(
         self, node: ModuleNode
     ) -> Optional[ModuleNodeAdjacentGraph]:
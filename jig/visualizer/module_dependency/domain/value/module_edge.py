@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
 
 from jig.visualizer.module_dependency.domain.value.edge_style import EdgeStyle
 from .module_node import ModuleNode
@@ -7,19 +7,32 @@ from .module_node import ModuleNode
 
 @dataclasses.dataclass(frozen=True)
 class ModuleEdge:
+    """
+    weight: このエッジにまとめた依存関係（インポート）の数
+    """
+
     tail: ModuleNode
     head: ModuleNode
     style: EdgeStyle = dataclasses.field(default_factory=EdgeStyle, compare=False)
+    weight: int = dataclasses.field(default=1, compare=False)
 
     @classmethod
-    def from_str(cls, tail: str, head: str) -> "ModuleEdge":
-        return cls(tail=ModuleNode.from_str(tail), head=ModuleNode.from_str(head))
+    def from_str(cls, tail: str, head: str, weight: int = 1) -> "ModuleEdge":
+        return cls(
+            tail=ModuleNode.from_str(tail),
+            head=ModuleNode.from_str(head),
+            weight=weight,
+        )
 
     @classmethod
     def build(
-        cls, tail: ModuleNode, head: ModuleNode, style: Optional[EdgeStyle] = None
+        cls,
+        tail: ModuleNode,
+        head: ModuleNode,
+        style: Optional[EdgeStyle] = None,
+        weight: int = 1,
     ) -> "ModuleEdge":
-        return cls(tail=tail, head=head, style=style or EdgeStyle())
+        return cls(tail=tail, head=head, style=style or EdgeStyle(), weight=weight)
 
     def belongs_to(self, other: "ModuleEdge") -> bool:
         return self.tail.belongs_to(other.tail) and self.head.belongs_to(other.head)
@@ -35,7 +48,7 @@ class ModuleEdge:
 
         new_tail = self.tail.limit_path_level(max_path_level)
         new_head = self.head.limit_path_level(max_path_level)
-        return ModuleEdge(tail=new_tail, head=new_head)
+        return ModuleEdge(tail=new_tail, head=new_head, weight=self.weight)
 
     def __lt__(self, other: "ModuleEdge"):
         if self.tail == other.tail:
@@ -44,33 +57,80 @@ class ModuleEdge:
         return self.tail < other.tail
 
     def build_reverse(self) -> "ModuleEdge":
-        return self.build(tail=self.head, head=self.tail, style=self.style)
-
-    def to_invisible(self) -> "ModuleEdge":
         return self.build(
-            tail=self.tail, head=self.head, style=EdgeStyle(invisible=True)
+            tail=self.head, head=self.tail, style=self.style, weight=self.weight
         )
 
+    def to_invisible(self) -> "ModuleEdge":
+        return self.with_style(EdgeStyle(invisible=True))
+
     def with_style(self, style: EdgeStyle) -> "ModuleEdge":
-        return self.build(tail=self.tail, head=self.head, style=style)
+        return self.build(
+            tail=self.tail, head=self.head, style=style, weight=self.weight
+        )
 
     def reset_style(self) -> "ModuleEdge":
-        return self.build(tail=self.tail, head=self.head)
+        return self.build(tail=self.tail, head=self.head, weight=self.weight)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, init=False)
 class ModuleEdgeCollection:
-    _edges: List[ModuleEdge] = dataclasses.field(default_factory=list)
+    """
+    同じエッジ（tail と head が同じエッジ）を1本にまとめて保持する、エッジの集合。
+    エッジ自身をキーにした辞書で保持するので、追加・削除・検索はエッジの数によらず定数時間で済む。
+    辞書は挿入順を保つので、エッジは最初に追加した順に並ぶ。
+    """
+
+    # エッジ -> weight を合計したエッジ
+    _edges: Dict[ModuleEdge, ModuleEdge]
+
+    def __init__(self, edges: Iterable[ModuleEdge] = ()):
+        object.__setattr__(self, "_edges", {})
+        for edge in edges:
+            self.add(edge)
 
     @classmethod
     def from_tuple_list(cls, edges: List[Tuple[str, str]]) -> "ModuleEdgeCollection":
         return cls([ModuleEdge.from_str(tail=e[0], head=e[1]) for e in edges])
 
     def find_parent_edge(self, edge: ModuleEdge) -> Optional[ModuleEdge]:
-        for e in self._edges:
+        for e in self._edges.values():
             if edge.belongs_to(e):
                 return e
         return None
 
+    def add(self, edge: ModuleEdge) -> None:
+        """
+        エッジを追加します。同じエッジがすでにある場合は、そのエッジの weight に加えます。
+        :param edge:
+        :return:
+        """
+        current = self._edges.get(edge)
+        if current is None:
+            self._edges[edge] = edge
+            return
+
+        self._edges[edge] = dataclasses.replace(
+            current, weight=current.weight + edge.weight
+        )
+
+    def remove(self, edge: ModuleEdge) -> None:
+        """
+        エッジを取り除きます。同じエッジの weight が取り除くエッジの weight より大きい場合は、
+        weight を減らしてエッジを残します。
+        :param edge:
+        :return:
+        """
+        current = self._edges.get(edge)
+        if current is None:
+            return
+
+        if current.weight > edge.weight:
+            self._edges[edge] = dataclasses.replace(
+                current, weight=current.weight - edge.weight
+            )
+        else:
+            del self._edges[edge]
+
     def __iter__(self):
-        return iter(self._edges)
+        return iter(self._edges.values())
@@ -1,4 +1,8 @@
 import enum
+import math
+
+# 依存関係の数に応じて太くする場合の、線の太さの上限
+MAX_WEIGHTED_PENWIDTH = 5.0
 
 
 class Color(enum.Enum):
@@ -28,3 +32,14 @@ class PenWidth(enum.Enum):
             PenWidth.Bold: "3.0",
             PenWidth.Thin: "0.5",
         }.get(penwidth, "1.0")
+
+    @classmethod
+    def size_for_weight(cls, weight: int) -> str:
+        """
+        依存関係の数に応じた線の太さを返します。1本の場合は Normal と同じ太さになります。
+        数が2倍になるごとに1ずつ太くし、MAX_WEIGHTED_PENWIDTH を上限とします。
+        :param weight: エッジにまとめられた依存関係の数
+        :return:
+        """
+        size = 1.0 + math.log2(max(weight, 1))
+        return f"{min(size, MAX_WEIGHTED_PENWIDTH):.1f}"
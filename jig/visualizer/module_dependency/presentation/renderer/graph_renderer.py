@@ -3,6 +3,7 @@ import dataclasses
 from graphviz import Digraph
 
 from jig.visualizer.module_dependency.domain.model.graph import Graph
+from jig.visualizer.module_dependency.domain.value.penwidth import PenWidth
 from .cluster_renderer import ClusterRenderer
 
 
@@ -25,6 +26,7 @@ class GraphRenderer:
                 node_options["shape"] = "rect"
             d.node(name=node.path.name, **node_options)
 
+        edge_weights = self.graph.edge_weights()
         for edge in sorted(self.graph.edges):
             module_edge_style = self.graph.graph_style.find_edge_style(
                 edge.tail.path, edge.head.path
@@ -33,7 +35,13 @@ class GraphRenderer:
 
             edge_style = self.graph.hide_filter.filter_edge_style(edge, edge_style)
 
-            d.edge(edge.tail.name, edge.head.name, **edge_style.to_dict())
+            edge_options = edge_style.to_dict()
+            # 太さが指定されていないエッジは、まとめられた依存関係の数が多いほど太く描く
+            if edge_style.penwidth == PenWidth.Normal:
+                edge_options["penwidth"] = PenWidth.size_for_weight(
+                    edge_weights.get(edge, 1)
+                )
+            d.edge(edge.tail.name, edge.head.name, **edge_options)
 
         for cluster in self.graph.clusters.values():
             cluster_renderer = ClusterRenderer(cluster)
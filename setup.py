@@ -30,7 +30,12 @@ setuptools.setup(
     url="https://github.com/levii/jig-py",
     packages=packages,
     namespaces=namespaces,
-    entry_points={"console_scripts": ["jig-py = jig.cli.main:main"]},
+    entry_points={
+        "console_scripts": [
+            "jig-py = jig.cli.main:main",
+            "jig-py-tools = jig.cli.main:tools",
+        ]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
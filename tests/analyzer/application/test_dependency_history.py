@@ -0,0 +1,138 @@
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from jig.analyzer.application.dependency_history import DependencyHistory
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+GIT_CONFIG = ["-c", "user.name=jig", "-c", "user.email=jig@example.com"]
+
+
+def git(repo_path: Path, *args: str) -> None:
+    command = ["git", "-C", str(repo_path)] + GIT_CONFIG + list(args)
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+def commit(repo_path: Path, message: str) -> None:
+    git(repo_path, "add", "-A", ".")
+    git(repo_path, "commit", "-q", "--allow-empty", "-m", message)
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def edges(dependencies: List[ModuleDependency]):
+    return sorted((str(d.src), str(d.dest)) for d in dependencies)
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    git(tmp_path, "init", "-q")
+
+    write_file(tmp_path / "main.py", "import foo\nimport bar.Baz\n")
+    write_file(tmp_path / "foo.py", "import os\n")
+    commit(tmp_path, "initial")
+
+    # モジュールの追加によって、既存のモジュールの依存先が解決されるようになる
+    write_file(tmp_path / "bar.py", "")
+    commit(tmp_path, "add bar")
+
+    write_file(tmp_path / "foo.py", "import bar\n")
+    commit(tmp_path, "foo imports bar")
+
+    # 構文エラーのファイルは存在しないものとして扱う
+    write_file(tmp_path / "foo.py", "import bar\nimport (\n")
+    commit(tmp_path, "break foo")
+
+    write_file(tmp_path / "foo.py", "import bar\n")
+    (tmp_path / "bar.py").rename(tmp_path / "baz.py")
+    commit(tmp_path, "fix foo and move bar")
+
+    return tmp_path
+
+
+class TestDependencyHistory:
+    def test_iter_changes(self, repo_path: Path):
+        history = DependencyHistory(repo_path=repo_path)
+        changes = [c.changes for c in history.iter_changes("HEAD")]
+
+        assert [(edges(c.added), edges(c.removed)) for c in changes] == [
+            ([("main", "foo")], []),
+            ([("main", "bar")], []),
+            ([("foo", "bar")], []),
+            ([], [("foo", "bar"), ("main", "foo")]),
+            ([("main", "foo")], [("main", "bar")]),
+        ]
+
+    def test_iter_changes_in_range(self, repo_path: Path):
+        history = DependencyHistory(repo_path=repo_path)
+        changes = list(history.iter_changes("HEAD~3..HEAD~2"))
+
+        # 範囲の最初のコミットは、その時点の全ての依存関係を追加として扱う
+        assert len(changes) == 1
+        assert edges(changes[0].changes.added) == [
+            ("foo", "bar"),
+            ("main", "bar"),
+            ("main", "foo"),
+        ]
+
+    def test_iter_changes_with_deeply_nested_file(self, repo_path: Path):
+        # 構文解析で RecursionError が発生するファイルも、存在しないものとして扱う
+        write_file(
+            repo_path / "nested.py", "import foo\nx = 1" + " + 1" * 100000 + "\n"
+        )
+        commit(repo_path, "add nested")
+        write_file(repo_path / "nested.py", "import foo\n")
+        commit(repo_path, "fix nested")
+
+        history = DependencyHistory(repo_path=repo_path)
+        changes = [c.changes for c in history.iter_changes("HEAD~2..HEAD")]
+
+        assert [(edges(c.added), edges(c.removed)) for c in changes] == [
+            ([("main", "foo")], []),
+            ([("nested", "foo")], []),
+        ]
+
+    def test_parse_each_blob_once(self, repo_path: Path, monkeypatch):
+        parsed = []
+        parse_blob = DependencyHistory._parse_blob
+
+        def spy(self, data, filename):
+            parsed.append(data)
+            return parse_blob(self, data, filename)
+
+        monkeypatch.setattr(DependencyHistory, "_parse_blob", spy)
+
+        history = DependencyHistory(repo_path=repo_path)
+        list(history.iter_changes("HEAD"))
+
+        # main.py, foo.py(3種類), bar.py（baz.py への移動では再解析しない）
+        assert sorted(parsed) == sorted(
+            [
+                b"import foo\nimport bar.Baz\n",
+                b"import os\n",
+                b"import bar\n",
+                b"import bar\nimport (\n",
+                b"",
+            ]
+        )
+
+    def test_root(self, repo_path: Path):
+        write_file(repo_path / "src" / "pkg" / "__init__.py", "from . import sub\n")
+        write_file(repo_path / "src" / "pkg" / "sub.py", "")
+        commit(repo_path, "add src")
+
+        history = DependencyHistory(repo_path=repo_path, root="src")
+        changes = list(history.iter_changes("HEAD~1..HEAD"))
+
+        assert edges(changes[0].changes.added) == [("pkg", "pkg.sub")]
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+from typing import List
+
+from jig.analyzer.application.dependency_watcher import DependencyWatcher
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.collector.application import SourceCodeCollector
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 同じ時刻内の書き換えでも変更を検出できるように mtime を進める
+    mtime_ns = path.stat().st_mtime_ns + 10**9 if path.exists() else None
+    path.write_text(content)
+    if mtime_ns:
+        os.utime(str(path), ns=(mtime_ns, mtime_ns))
+
+
+def edges(dependencies: List[ModuleDependency]):
+    return sorted((str(d.src), str(d.dest)) for d in dependencies)
+
+
+class TestDependencyWatcher:
+    def test_poll(self, tmp_path: Path):
+        write_file(tmp_path / "main.py", "import foo\nimport bar.Baz\n")
+        write_file(tmp_path / "foo.py", "import os\n")
+
+        watcher = DependencyWatcher.start(
+            collector=SourceCodeCollector(root_path=tmp_path), target_path=tmp_path
+        )
+        assert edges(watcher.module_dependencies) == [("main", "foo")]
+        assert watcher.poll().is_empty
+
+        # モジュールの追加によって、既存のモジュールの依存先が解決されるようになる
+        write_file(tmp_path / "bar.py", "")
+        changes = watcher.poll()
+        assert edges(changes.added) == [("main", "bar")]
+        assert edges(changes.removed) == []
+
+        write_file(tmp_path / "foo.py", "import bar\n")
+        changes = watcher.poll()
+        assert edges(changes.added) == [("foo", "bar")]
+        assert edges(changes.removed) == []
+
+        (tmp_path / "bar.py").unlink()
+        changes = watcher.poll()
+        assert edges(changes.added) == []
+        assert edges(changes.removed) == [("foo", "bar"), ("main", "bar")]
+        assert edges(watcher.module_dependencies) == [("main", "foo")]
+
+    def test_poll_ignores_syntax_error(self, tmp_path: Path):
+        write_file(tmp_path / "main.py", "import foo\n")
+        write_file(tmp_path / "foo.py", "")
+
+        watcher = DependencyWatcher.start(
+            collector=SourceCodeCollector(root_path=tmp_path), target_path=tmp_path
+        )
+
+        write_file(tmp_path / "main.py", "import foo\nimport (\n")
+        assert watcher.poll().is_empty
+        assert edges(watcher.module_dependencies) == [("main", "foo")]
+
+    def test_poll_ignores_deeply_nested_file(self, tmp_path: Path):
+        write_file(tmp_path / "main.py", "import foo\n")
+        write_file(tmp_path / "foo.py", "")
+
+        watcher = DependencyWatcher.start(
+            collector=SourceCodeCollector(root_path=tmp_path), target_path=tmp_path
+        )
+
+        # 構文解析で RecursionError が発生するファイルも、前回の解析結果のまま扱う
+        write_file(tmp_path / "main.py", "import foo\nx = 1" + " + 1" * 100000 + "\n")
+        assert watcher.poll().is_empty
+        assert edges(watcher.module_dependencies) == [("main", "foo")]
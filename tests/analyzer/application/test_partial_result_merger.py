@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from jig.analyzer.application.partial_result_merger import merge_partial_results
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.infrastructure.partial_result import (
+    PartialResult,
+    PartialResultError,
+)
+from jig.collector.application import SourceCodeCollector
+from jig.collector.domain.values.shard import Shard
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def edges(collection: ImportDependencyCollection):
+    return sorted(
+        (str(d.src), str(d.dest)) for d in collection.build_module_dependencies()
+    )
+
+
+def collect(root: Path, shard: Shard) -> PartialResult:
+    collector = SourceCodeCollector(root_path=root, shard=shard)
+    return PartialResult(
+        shard=shard,
+        dependencies=[
+            source_code.build_import_dependency()
+            for source_code in collector.iter_collect(root)
+        ],
+    )
+
+
+class TestMergePartialResults:
+    def test_merge(self, tmp_path: Path):
+        for i in range(10):
+            write_file(tmp_path / "pkg" / f"mod{i}.py", f"from pkg import mod{i + 1}\n")
+        write_file(tmp_path / "main.py", "import pkg.mod0\nimport os\n")
+
+        expected = ImportDependencyCollection.build_from_source_codes(
+            SourceCodeCollector(root_path=tmp_path).iter_collect(tmp_path)
+        )
+
+        results = [collect(tmp_path, Shard(index=i, count=3)) for i in range(1, 4)]
+        assert all(result.dependencies for result in results)
+
+        # シャードをまたぐ依存関係も、まとめた後に解決される
+        assert edges(merge_partial_results(results)) == edges(expected)
+        assert ("pkg.mod8", "pkg.mod9") in edges(expected)
+
+    def test_merge_without_shard(self, tmp_path: Path):
+        write_file(tmp_path / "main.py", "import foo\n")
+        write_file(tmp_path / "foo.py", "")
+
+        result = PartialResult(
+            shard=None,
+            dependencies=[
+                source_code.build_import_dependency()
+                for source_code in SourceCodeCollector(root_path=tmp_path).collect(
+                    tmp_path
+                )
+            ],
+        )
+
+        assert edges(merge_partial_results([result])) == [("main", "foo")]
+
+    @pytest.mark.parametrize(
+        "shards",
+        [
+            [],
+            ["1/2"],
+            ["1/2", "1/2", "2/2"],
+            ["1/2", "2/3", "3/3"],
+        ],
+    )
+    def test_merge_invalid_shards(self, shards):
+        results = [
+            PartialResult(shard=Shard.from_str(shard), dependencies=[])
+            for shard in shards
+        ]
+
+        with pytest.raises(PartialResultError):
+            merge_partial_results(results)
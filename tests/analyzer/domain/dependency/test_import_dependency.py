@@ -1,10 +1,14 @@
+from pathlib import Path
 from typing import List
 
 from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
 from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.collector.domain.source_code.source_code import SourceCode
 from jig.collector.domain.source_code.source_code_import_dependency import (
     SourceCodeImportDependency,
 )
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
 from jig.collector.domain.values.import_path import ImportPath
 from jig.collector.domain.values.module_path import ModulePath
 
@@ -52,6 +56,43 @@ class TestImportDependencyCollection:
             import_path=ImportPath.from_str("bar.XXX")
         ) == ModulePath.from_str("bar")
 
+    def test_detect_longest_module_path(self):
+        collection = ImportDependencyCollection.build(
+            dependencies=[
+                build_dep(src_module_path="a", import_paths=[]),
+                build_dep(src_module_path="a.b", import_paths=[]),
+                build_dep(src_module_path="x.y.z", import_paths=[]),
+            ]
+        )
+
+        def detect(path: str):
+            module_path = collection.detect_module_path(ImportPath.from_str(path))
+            return module_path and str(module_path)
+
+        # from a.b import c （c は a.b の属性）
+        assert detect("a.b.c") == "a.b"
+        # import a.b.c.d （a.b.c のファイルがない）
+        assert detect("a.b.c.d") == "a.b"
+        assert detect("x.y.z.Foo.method") == "x.y.z"
+        assert detect("x.y.Foo") is None
+
+        collection.remove(ModulePath.from_str("a.b"))
+        assert detect("a.b.c.d") == "a"
+
+    def test_external_module(self):
+        collection = ImportDependencyCollection.build(
+            dependencies=[
+                build_dep(src_module_path="main", import_paths=["ext.Foo", "os"]),
+            ]
+        )
+        collection.add_external_module(ModulePath.from_str("ext"))
+
+        # 範囲外のモジュールはインポート先としてだけ解決される
+        assert collection.get_by_module_path(ModulePath.from_str("ext")) is None
+        assert collection.build_module_dependencies() == [
+            ModuleDependency.from_str("main", "ext")
+        ]
+
     def test_build_module_dependencies(self):
         collection = ImportDependencyCollection.build(
             dependencies=[
@@ -70,3 +111,83 @@ class TestImportDependencyCollection:
             ModuleDependency.from_str("main", "bar"),
             ModuleDependency.from_str("foo", "bar"),
         ]
+
+    def test_build_module_dependencies_with_count(self):
+        collection = ImportDependencyCollection.build(
+            dependencies=[
+                build_dep(
+                    src_module_path="main",
+                    import_paths=["foo.A", "foo.B", "foo.C", "bar", "foo"],
+                ),
+                build_dep(src_module_path="foo", import_paths=[]),
+                build_dep(src_module_path="bar", import_paths=[]),
+            ]
+        )
+
+        # 同じモジュールへの依存関係は1つにまとめ、その数を count に持つ
+        dependencies = collection.build_module_dependencies()
+        assert dependencies == [
+            ModuleDependency.from_str("main", "foo", count=4),
+            ModuleDependency.from_str("main", "bar"),
+        ]
+        assert [d.count for d in dependencies] == [4, 1]
+
+    def test_put_and_remove(self):
+        collection = ImportDependencyCollection.build(
+            dependencies=[
+                build_dep(src_module_path="main", import_paths=["foo", "bar.Baz"]),
+                build_dep(src_module_path="foo", import_paths=[]),
+            ]
+        )
+        assert collection.build_module_dependencies_of(ModulePath.from_str("main")) == [
+            ModuleDependency.from_str("main", "foo"),
+        ]
+
+        collection.put(build_dep(src_module_path="bar", import_paths=["foo"]))
+        assert collection.build_module_dependencies_of(ModulePath.from_str("main")) == [
+            ModuleDependency.from_str("main", "foo"),
+            ModuleDependency.from_str("main", "bar"),
+        ]
+
+        collection.remove(ModulePath.from_str("foo"))
+        assert collection.get_by_module_path(ModulePath.from_str("foo")) is None
+        assert collection.build_module_dependencies() == [
+            ModuleDependency.from_str("main", "bar"),
+        ]
+
+    def test_list_importing_module_paths(self):
+        collection = ImportDependencyCollection.build(
+            dependencies=[
+                build_dep(src_module_path="main", import_paths=["foo.bar.Baz"]),
+                build_dep(src_module_path="foo", import_paths=["os"]),
+                build_dep(src_module_path="foobar", import_paths=["foo"]),
+            ]
+        )
+
+        assert collection.list_importing_module_paths(
+            [ModulePath.from_str("foo.bar")]
+        ) == [ModulePath.from_str("main")]
+        assert collection.list_importing_module_paths([ModulePath.from_str("foo")]) == [
+            ModulePath.from_str("main"),
+            ModulePath.from_str("foobar"),
+        ]
+
+    def test_build_from_source_codes(self):
+        def source_codes():
+            for module_path, content in [("main", "import foo"), ("foo", "")]:
+                yield SourceCode.build(
+                    file=SourceFile(
+                        source_file_path=SourceFilePath(
+                            root_path=Path("/root"),
+                            file_path=Path(f"/root/{module_path}.py"),
+                        ),
+                        size=len(content),
+                        content=content,
+                    )
+                )
+
+        collection = ImportDependencyCollection.build_from_source_codes(source_codes())
+
+        assert collection.build_module_dependencies() == [
+            ModuleDependency.from_str("main", "foo"),
+        ]
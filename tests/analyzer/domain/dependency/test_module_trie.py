@@ -0,0 +1,48 @@
+from jig.analyzer.domain.dependency.module_trie import ModuleTrie
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.module_path import ModulePath
+
+
+def mod(path: str) -> ModulePath:
+    return ModulePath.from_str(path)
+
+
+def resolve(trie: ModuleTrie, path: str):
+    module_path = trie.resolve(ImportPath.from_str(path))
+    return module_path and str(module_path)
+
+
+class TestModuleTrie:
+    def test_resolve(self):
+        trie = ModuleTrie()
+        for module in ["a", "a.b", "a.b.c.d", "x.y"]:
+            trie.add(mod(module))
+
+        assert resolve(trie, "a") == "a"
+        assert resolve(trie, "a.b.Foo") == "a.b"
+        # 途中のモジュールがなくても、一致する最も長いモジュールに解決する
+        assert resolve(trie, "a.b.c") == "a.b"
+        assert resolve(trie, "a.b.c.d.e.f") == "a.b.c.d"
+        assert resolve(trie, "a.z.z") == "a"
+        assert resolve(trie, "x.y.z") == "x.y"
+        assert resolve(trie, "x") is None
+        assert resolve(trie, "os.path") is None
+
+    def test_remove(self):
+        trie = ModuleTrie()
+        trie.add(mod("a"))
+        trie.add(mod("a.b.c"))
+        trie.add(mod("a.b.c"))
+
+        # 登録した回数だけ取り除くまで残る
+        trie.remove(mod("a.b.c"))
+        assert mod("a.b.c") in trie
+        trie.remove(mod("a.b.c"))
+        assert mod("a.b.c") not in trie
+        assert resolve(trie, "a.b.c.d") == "a"
+
+        trie.remove(mod("a"))
+        trie.remove(mod("unknown"))
+        assert mod("a") not in trie
+        assert resolve(trie, "a.b.c.d") is None
+        assert trie._root.children == {}
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pytest
+
+from jig.analyzer.infrastructure.partial_result import (
+    PartialResultError,
+    load_partial_result,
+    save_partial_result,
+)
+from jig.collector.domain.source_code.source_code_import_dependency import (
+    SourceCodeImportDependency,
+)
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.module_path import ModulePath
+from jig.collector.domain.values.shard import Shard
+
+
+def dependency(module: str, *import_paths: str) -> SourceCodeImportDependency:
+    return SourceCodeImportDependency.build(
+        source_module_path=ModulePath.from_str(module),
+        import_paths=[ImportPath.from_str(p) for p in import_paths],
+    )
+
+
+class TestPartialResult:
+    def test_save_and_load(self, tmp_path: Path):
+        dependencies = [
+            dependency("main", "foo", "bar.Baz"),
+            dependency("foo.sub", "os"),
+            dependency("empty"),
+        ]
+
+        save_partial_result(
+            tmp_path / "partial.json", dependencies, shard=Shard(index=2, count=3)
+        )
+        result = load_partial_result(tmp_path / "partial.json")
+
+        assert result.shard == Shard(index=2, count=3)
+        assert result.dependencies == dependencies
+
+    def test_save_without_shard(self, tmp_path: Path):
+        save_partial_result(tmp_path / "partial.json", [dependency("main")])
+
+        assert load_partial_result(tmp_path / "partial.json").shard is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "",
+            "[]",
+            '{"version": 0, "shard": null, "dependencies": []}',
+            '{"version": 1, "shard": "5/4", "dependencies": []}',
+            '{"version": 1, "shard": null, "dependencies": [{"module": "a"}]}',
+        ],
+    )
+    def test_load_invalid_file(self, tmp_path: Path, content: str):
+        (tmp_path / "partial.json").write_text(content)
+
+        with pytest.raises(PartialResultError):
+            load_partial_result(tmp_path / "partial.json")
+
+    def test_load_missing_file(self, tmp_path: Path):
+        with pytest.raises(PartialResultError):
+            load_partial_result(tmp_path / "missing.json")
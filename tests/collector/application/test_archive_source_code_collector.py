@@ -0,0 +1,154 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from jig.collector.application import SourceCodeCollector
+from jig.collector.application.archive_source_code_collector import (
+    ArchiveSourceCodeCollector,
+)
+from jig.collector.domain.collect_error.collect_error import CollectPhase
+from jig.collector.domain.collect_error.collect_error_report import (
+    CollectErrorReport,
+)
+
+FILES = {
+    "main.py": "import foo\nfrom bar import baz\n",
+    "foo/__init__.py": "from . import sub\n",
+    "foo/sub.py": "class Sub:\n    name = '\xe9'\n",
+    "bar/__init__.py": "from .baz import *\n",
+    "bar/baz.py": "from foo.sub import Sub\r\n",
+    "invalid.dir/skip.py": "import os\n",
+    "README.md": "",
+}
+
+
+def encode(name: str, content: str) -> bytes:
+    return content.encode("utf-8")
+
+
+def write_zip(path: Path, prefix: str) -> Path:
+    with zipfile.ZipFile(str(path), "w") as zip_file:
+        if prefix:
+            zip_file.writestr(prefix, b"")
+        for name, content in FILES.items():
+            zip_file.writestr(prefix + name, encode(name, content))
+    return path
+
+
+def write_tar(path: Path, prefix: str) -> Path:
+    with tarfile.open(str(path), "w:gz") as tar_file:
+        for name, content in FILES.items():
+            data = encode(name, content)
+            info = tarfile.TarInfo(prefix + name)
+            info.size = len(data)
+            tar_file.addfile(info, io.BytesIO(data))
+    return path
+
+
+def write_tree(root: Path) -> Path:
+    for name, content in FILES.items():
+        path = root.joinpath(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(encode(name, content))
+    return root
+
+
+def summarize(collection):
+    return sorted(
+        (
+            str(code.module_path),
+            code.file.size,
+            str(code.file.source_file_path.relative_path_from_root),
+            code.file.content,
+            [str(p) for p in code.import_paths],
+            [c.name for c in code.class_defs],
+        )
+        for code in collection
+    )
+
+
+@pytest.fixture
+def expected(tmp_path: Path):
+    root = write_tree(tmp_path / "tree")
+    return summarize(SourceCodeCollector(root_path=root).collect(root))
+
+
+class TestArchiveSourceCodeCollector:
+    @pytest.mark.parametrize(
+        "filename, writer, prefix",
+        [
+            ("snapshot.zip", write_zip, "jig-py-e6871f1/"),
+            ("jig_py-0.1.1-py3-none-any.whl", write_zip, ""),
+            ("jig-py-0.1.1.tar.gz", write_tar, "jig-py-0.1.1/"),
+            ("flat.tar.gz", write_tar, "./"),
+        ],
+    )
+    def test_collect(self, tmp_path: Path, expected, filename, writer, prefix):
+        archive_dir = tmp_path / "archive"
+        archive_dir.mkdir()
+        archive_path = writer(archive_dir / filename, prefix)
+
+        collection = ArchiveSourceCodeCollector(archive_path=archive_path).collect()
+
+        assert summarize(collection) == expected
+        # アーカイブを展開したファイルを書き出していない
+        assert list(archive_dir.iterdir()) == [archive_path]
+
+    def test_collect_target(self, tmp_path: Path):
+        archive_path = write_zip(tmp_path / "snapshot.zip", "jig-py-e6871f1/")
+
+        collection = ArchiveSourceCodeCollector(archive_path=archive_path).collect(
+            target="foo"
+        )
+
+        assert [str(code.module_path) for code in collection] == ["foo", "foo.sub"]
+
+    def test_collect_with_root(self, tmp_path: Path):
+        archive_path = write_zip(tmp_path / "snapshot.zip", "src/")
+
+        collection = ArchiveSourceCodeCollector(
+            archive_path=archive_path, root="src", lean=True
+        ).collect(target="bar/")
+
+        assert [str(code.module_path) for code in collection] == ["bar", "bar.baz"]
+        assert all(code.file.content is None for code in collection)
+
+    def test_decode_with_encoding_declaration(self, tmp_path: Path):
+        archive_path = tmp_path / "snapshot.zip"
+        with zipfile.ZipFile(str(archive_path), "w") as zip_file:
+            zip_file.writestr(
+                "latin.py",
+                "# -*- coding: latin-1 -*-\nname = '\xe9'\n".encode("latin-1"),
+            )
+
+        [code] = ArchiveSourceCodeCollector(archive_path=archive_path).collect()
+
+        assert code.file.content == "# -*- coding: latin-1 -*-\nname = '\xe9'\n"
+
+    def test_collect_with_errors(self, tmp_path: Path):
+        archive_path = tmp_path / "snapshot.zip"
+        with zipfile.ZipFile(str(archive_path), "w") as zip_file:
+            zip_file.writestr("binary.py", b"\xff\xfe\n")
+            zip_file.writestr("broken.py", b"import (\n")
+            zip_file.writestr("main.py", b"import os\n")
+
+        errors = CollectErrorReport()
+        collection = ArchiveSourceCodeCollector(archive_path=archive_path).collect(
+            errors=errors
+        )
+
+        assert [str(code.module_path) for code in collection] == ["main"]
+        assert [(e.path, e.phase) for e in errors] == [
+            ("binary.py", CollectPhase.DECODE),
+            ("broken.py", CollectPhase.PARSE),
+        ]
+
+    def test_unsupported_archive(self, tmp_path: Path):
+        archive_path = tmp_path / "archive.rar"
+        archive_path.write_bytes(b"")
+
+        with pytest.raises(ValueError):
+            ArchiveSourceCodeCollector(archive_path=archive_path).collect()
@@ -0,0 +1,106 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from jig.collector.application import SourceCodeCollector
+from jig.collector.application.git_revision_source_code_collector import (
+    GitRevisionSourceCodeCollector,
+)
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+GIT_CONFIG = ["-c", "user.name=jig", "-c", "user.email=jig@example.com"]
+
+
+def git(repo_path: Path, *args: str) -> None:
+    command = ["git", "-C", str(repo_path)] + GIT_CONFIG + list(args)
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def summarize(collection):
+    return [
+        (
+            str(code.module_path),
+            code.file.size,
+            str(code.file.source_file_path.relative_path_from_root),
+            code.file.content,
+            [str(p) for p in code.import_paths],
+            [c.name for c in code.class_defs],
+        )
+        for code in collection
+    ]
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    git(repo_path, "init", "-q")
+
+    write_file(repo_path / "src" / "main.py", "import foo\nfrom bar import baz\n")
+    write_file(repo_path / "src" / "foo" / "__init__.py", "from . import sub\n")
+    write_file(repo_path / "src" / "foo" / "sub.py", "class Sub:\n    pass\n")
+    write_file(repo_path / "src" / "bar" / "__init__.py", "from .baz import *\n")
+    write_file(repo_path / "src" / "bar" / "baz.py", "from foo.sub import Sub\n")
+    write_file(repo_path / "src" / "invalid.dir" / "skip.py", "import os\n")
+    write_file(repo_path / "README.md", "")
+    git(repo_path, "add", ".")
+    git(repo_path, "commit", "-q", "-m", "initial")
+    git(repo_path, "tag", "v1")
+
+    return repo_path
+
+
+class TestGitRevisionSourceCodeCollector:
+    def test_collect(self, repo_path: Path):
+        src_path = repo_path / "src"
+        expected = SourceCodeCollector(root_path=src_path).collect(src_path)
+
+        # 作業ツリーを変更しても、リビジョンの内容が収集される
+        write_file(src_path / "main.py", "import os\n")
+        write_file(src_path / "new.py", "import os\n")
+        git(repo_path, "add", ".")
+        git(repo_path, "commit", "-q", "-m", "second")
+
+        collection = GitRevisionSourceCodeCollector(
+            repo_path=src_path, revision="v1"
+        ).collect()
+
+        assert summarize(collection) == sorted(
+            summarize(expected), key=lambda code: code[2]
+        )
+
+    def test_collect_with_root_and_target(self, repo_path: Path):
+        collection = GitRevisionSourceCodeCollector(
+            repo_path=repo_path, revision="HEAD", root="src", lean=True
+        ).collect(target="foo")
+
+        assert [str(code.module_path) for code in collection] == ["foo", "foo.sub"]
+        assert all(code.file.content is None for code in collection)
+
+    def test_spawns_single_cat_file_process(self, repo_path: Path, monkeypatch):
+        popen = subprocess.Popen
+        commands = []
+
+        def recording_popen(args, *a, **kw):
+            commands.append(args)
+            return popen(args, *a, **kw)
+
+        monkeypatch.setattr(subprocess, "Popen", recording_popen)
+
+        collection = GitRevisionSourceCodeCollector(
+            repo_path=repo_path, revision="HEAD", root="src"
+        ).collect()
+
+        assert len(collection) == 5
+        assert sum("cat-file" in command for command in commands) == 1
@@ -0,0 +1,476 @@
+import dataclasses
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from jig.collector.application import SourceCodeCollector
+from jig.collector.domain.ast import ImportExtractor, JigSourceCode, NodeExtractor
+from jig.collector.domain.collect_error.collect_error import CollectPhase
+from jig.collector.domain.collect_error.collect_error_report import (
+    CollectErrorReport,
+)
+from jig.collector.domain.source_file.lazy_source_file import LazySourceFile
+from jig.collector.domain.values.module_scope import ModuleScope
+from jig.collector.domain.values.shard import Shard
+from jig.collector.infrastructure.parse_cache import ParseCache
+from jig.collector.infrastructure.source_file_walker import DEFAULT_EXCLUDES
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@dataclasses.dataclass
+class DecoratorNodeExtractor(NodeExtractor):
+    """関数とクラスのデコレータの名前を抽出する"""
+
+    name = "decorators"
+    node_types = ("FunctionDef", "ClassDef")
+
+    decorators: List[str] = dataclasses.field(default_factory=list)
+
+    def visit(self, node, ancestors) -> None:
+        for decorator in node.decorator_list:
+            if type(decorator).__name__ == "Name":
+                self.decorators.append(decorator.id)
+
+    def result(self) -> List[str]:
+        return self.decorators
+
+
+@pytest.fixture
+def project_root(tmp_path: Path) -> Path:
+    write_file(tmp_path / "main.py", "import foo\nfrom bar import baz\n")
+    write_file(tmp_path / "foo" / "__init__.py", "from . import sub\n")
+    write_file(tmp_path / "foo" / "sub.py", "class Sub:\n    pass\n")
+    write_file(tmp_path / "bar" / "__init__.py", "from .baz import *\n")
+    write_file(tmp_path / "bar" / "baz.py", "from foo.sub import Sub\n")
+    write_file(tmp_path / "invalid.dir" / "skip.py", "import os\n")
+    write_file(tmp_path / "README.md", "")
+
+    return tmp_path
+
+
+@pytest.fixture
+def slow_filesystem(monkeypatch):
+    """
+    ネットワークファイルシステムを模して、ファイルの読み込みを遅くする。
+    同時に実行された読み込みの数の最大値を返す。
+    """
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+    read_bytes = Path.read_bytes
+
+    def slow_read_bytes(self):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        try:
+            time.sleep(0.02)
+            return read_bytes(self)
+        finally:
+            with lock:
+                in_flight["current"] -= 1
+
+    monkeypatch.setattr(Path, "read_bytes", slow_read_bytes)
+
+    return in_flight
+
+
+def summarize(collection):
+    return [
+        (
+            str(code.module_path),
+            code.file.size,
+            code.file.content,
+            [str(p) for p in code.import_paths],
+            [c.name for c in code.class_defs],
+        )
+        for code in collection
+    ]
+
+
+class TestSourceCodeCollector:
+    def test_collect(self, project_root: Path):
+        collection = SourceCodeCollector(root_path=project_root).collect(project_root)
+
+        assert sorted(str(code.module_path) for code in collection) == [
+            "bar",
+            "bar.baz",
+            "foo",
+            "foo.sub",
+            "main",
+        ]
+
+    def test_collect_with_workers(self, project_root: Path):
+        collector = SourceCodeCollector(root_path=project_root)
+
+        serial = collector.collect(project_root)
+        parallel = collector.collect(project_root, workers=2)
+
+        assert summarize(parallel) == summarize(serial)
+        for code in parallel:
+            for class_def in code.class_defs:
+                assert class_def._ast is None
+
+    def test_collect_with_workers_loads_content_lazily(self, project_root: Path):
+        collector = SourceCodeCollector(root_path=project_root)
+
+        # ワーカープロセスからはソースコード本文を受け取らず、アクセスしたときに読み込む
+        parallel = collector.collect(project_root, workers=2)
+        file = parallel.get_by_relative_path("main.py").file
+        assert isinstance(file, LazySourceFile)
+        assert not file.is_loaded
+        assert file.content == "import foo\nfrom bar import baz\n"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    @pytest.mark.parametrize("lean", [False, True])
+    def test_collect_with_extractors(
+        self, project_root: Path, workers: int, lean: bool
+    ):
+        write_file(
+            project_root / "foo" / "decorated.py",
+            "@dataclass\nclass Foo:\n    @property\n    def bar(self):\n        pass\n",
+        )
+        write_file(
+            project_root / "foo" / "copy.py",
+            (project_root / "foo" / "decorated.py").read_text(),
+        )
+
+        collector = SourceCodeCollector(
+            root_path=project_root,
+            lean=lean,
+            extractor=ImportExtractor.TOKEN,
+            deduplicate=True,
+            extractors=(DecoratorNodeExtractor,),
+        )
+        collection = collector.collect(project_root, workers=workers)
+
+        extras = {str(code.module_path): code.extras for code in collection}
+        assert extras["foo.decorated"] == {"decorators": ["dataclass", "property"]}
+        assert extras["foo.copy"] == {"decorators": ["dataclass", "property"]}
+        assert extras["main"] == {"decorators": []}
+
+    def test_collect_with_extractors_and_parse_cache(
+        self, project_root: Path, tmp_path_factory
+    ):
+        # 追加の抽出結果は保存できないので、キャッシュを利用せずに毎回構文解析する
+        collector = SourceCodeCollector(
+            root_path=project_root,
+            parse_cache=ParseCache(cache_dir=tmp_path_factory.mktemp("cache")),
+            extractors=(DecoratorNodeExtractor,),
+        )
+        collector.collect(project_root)
+        collection = collector.collect(project_root)
+
+        assert all(code.extras == {"decorators": []} for code in collection)
+
+    def test_collect_with_invalid_workers(self, project_root: Path):
+        with pytest.raises(ValueError):
+            SourceCodeCollector(root_path=project_root).collect(project_root, workers=0)
+
+    def test_collect_with_parse_cache(
+        self, project_root: Path, tmp_path_factory, monkeypatch
+    ):
+        collector = SourceCodeCollector(
+            root_path=project_root,
+            parse_cache=ParseCache(cache_dir=tmp_path_factory.mktemp("cache")),
+        )
+        first = collector.collect(project_root)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged files must not be parsed")
+
+        monkeypatch.setattr(JigSourceCode, "build", fail)
+
+        assert summarize(collector.collect(project_root)) == summarize(first)
+        assert summarize(collector.collect(project_root, workers=2)) == summarize(first)
+
+        monkeypatch.undo()
+        (project_root / "main.py").write_text("import bar\n")
+        codes = collector.collect(project_root)
+        main_py = codes.get_by_relative_path("main.py")
+        assert [str(p) for p in main_py.import_paths] == ["bar"]
+
+    def test_iter_collect(self, project_root: Path):
+        collector = SourceCodeCollector(root_path=project_root)
+
+        source_codes = collector.iter_collect(project_root)
+        first = next(source_codes)
+        rest = list(source_codes)
+
+        assert summarize([first] + rest) == summarize(collector.collect(project_root))
+        assert summarize(collector.iter_collect(project_root, workers=2)) == summarize(
+            collector.collect(project_root)
+        )
+
+    def test_collect_lean(self, project_root: Path):
+        collection = SourceCodeCollector(root_path=project_root).collect(project_root)
+        lean_collection = SourceCodeCollector(
+            root_path=project_root, lean=True
+        ).collect(project_root)
+
+        def summarize_lean(collection):
+            return [
+                (str(code.module_path), [str(p) for p in code.import_paths])
+                for code in collection
+            ]
+
+        assert summarize_lean(lean_collection) == summarize_lean(collection)
+        for code in lean_collection:
+            assert code.file.content is None
+            assert code.file.size > 0 or code.file.filename == "__init__.py"
+
+        sub_py = lean_collection.get_by_relative_path("foo/sub.py")
+        assert [(c.name, c.lineno, c._ast) for c in sub_py.class_defs] == [
+            ("Sub", 1, None)
+        ]
+
+        parallel = SourceCodeCollector(root_path=project_root, lean=True).collect(
+            project_root, workers=2
+        )
+        assert summarize_lean(parallel) == summarize_lean(collection)
+        assert all(code.file.content is None for code in parallel)
+
+    def test_collect_with_token_extractor(self, project_root: Path):
+        collection = SourceCodeCollector(root_path=project_root).collect(project_root)
+        collector = SourceCodeCollector(
+            root_path=project_root, extractor=ImportExtractor.TOKEN
+        )
+
+        assert summarize(collector.collect(project_root)) == summarize(collection)
+        assert summarize(collector.collect(project_root, workers=2)) == summarize(
+            collection
+        )
+
+    def test_collect_with_excludes(self, project_root: Path):
+        write_file(project_root / "venv" / "lib" / "site.py", "import os\n")
+        write_file(project_root / ".gitignore", "generated/\n")
+        write_file(project_root / "generated" / "gen.py", "import os\n")
+
+        collector = SourceCodeCollector(
+            root_path=project_root, excludes=DEFAULT_EXCLUDES + ("/bar/",)
+        )
+
+        assert sorted(str(c.module_path) for c in collector.collect(project_root)) == [
+            "foo",
+            "foo.sub",
+            "main",
+        ]
+
+    def test_collect_files(self, project_root: Path):
+        collector = SourceCodeCollector(root_path=project_root)
+        target_paths = [
+            project_root / "main.py",
+            project_root / "foo" / "sub.py",
+            project_root / "invalid.dir" / "skip.py",
+        ]
+
+        collection = collector.collect_files(target_paths)
+        parallel = collector.collect_files(target_paths, workers=2)
+
+        assert [str(code.module_path) for code in collection] == ["main", "foo.sub"]
+        assert summarize(parallel) == summarize(collection)
+
+    def test_collect_with_errors(self, project_root: Path):
+        write_file(project_root / "foo" / "broken.py", "import (\n")
+        (project_root / "bar" / "binary.py").write_bytes(b"import os\n\xff\xfe\n")
+
+        collector = SourceCodeCollector(root_path=project_root)
+        collection, errors = collector.collect_with_errors(project_root)
+
+        assert sorted(str(code.module_path) for code in collection) == [
+            "bar",
+            "bar.baz",
+            "foo",
+            "foo.sub",
+            "main",
+        ]
+        assert [(e.path, e.phase) for e in errors] == [
+            (str(project_root / "bar" / "binary.py"), CollectPhase.DECODE),
+            (str(project_root / "foo" / "broken.py"), CollectPhase.PARSE),
+        ]
+        assert all(e.message for e in errors)
+
+        # 並列に処理した場合も同じ結果になる
+        parallel_errors = CollectErrorReport()
+        parallel = collector.collect(project_root, workers=2, errors=parallel_errors)
+        assert summarize(parallel) == summarize(collection)
+        assert list(parallel_errors) == list(errors)
+
+        # errors を指定しない場合は例外を送出する
+        with pytest.raises(UnicodeDecodeError):
+            collector.collect(project_root)
+
+    def test_collect_with_errors_by_token_extractor(self, project_root: Path):
+        # import文の構文エラーは、ASTで抽出する場合と同じく記録する
+        write_file(project_root / "foo" / "broken.py", "from import os\n")
+        # import文以外の構文エラーは検出せずに、import文を抽出する
+        write_file(project_root / "foo" / "partial.py", "x = 1 +\nimport os\n")
+
+        collector = SourceCodeCollector(
+            root_path=project_root, extractor=ImportExtractor.TOKEN
+        )
+        collection, errors = collector.collect_with_errors(project_root)
+
+        module_paths = [str(code.module_path) for code in collection]
+        assert "foo.broken" not in module_paths
+        assert "foo.partial" in module_paths
+        assert [(e.path, e.phase) for e in errors] == [
+            (str(project_root / "foo" / "broken.py"), CollectPhase.PARSE),
+        ]
+
+    def test_collect_files_with_errors(self, project_root: Path):
+        collector = SourceCodeCollector(root_path=project_root)
+        errors = CollectErrorReport()
+
+        collection = collector.collect_files(
+            [project_root / "missing.py", project_root / "main.py"], errors=errors
+        )
+
+        assert [str(code.module_path) for code in collection] == ["main"]
+        assert [(e.path, e.phase) for e in errors] == [
+            (str(project_root / "missing.py"), CollectPhase.READ)
+        ]
+        assert errors.errors[0].message.startswith("FileNotFoundError: ")
+
+    def test_collect_deduplicates_parsing(self, project_root: Path, monkeypatch):
+        write_file(project_root / "vendor_a" / "lib.py", "from . import util\n")
+        write_file(project_root / "vendor_b" / "lib.py", "from . import util\n")
+
+        parsed_sources = []
+        build = JigSourceCode.build
+
+        def spy(cls, source, filename, *args, **kwargs):
+            parsed_sources.append(source)
+            return build(source, filename, *args, **kwargs)
+
+        monkeypatch.setattr(JigSourceCode, "build", classmethod(spy))
+
+        collection = SourceCodeCollector(
+            root_path=project_root, deduplicate=True
+        ).collect(project_root)
+
+        assert parsed_sources.count("from . import util\n") == 1
+        assert len(parsed_sources) == len(collection) - 1
+        assert summarize(
+            code for code in collection if code.module_path.names[0] == "vendor_a"
+        ) == [("vendor_a.lib", 19, "from . import util\n", ["vendor_a.util"], [])]
+        assert summarize(
+            code for code in collection if code.module_path.names[0] == "vendor_b"
+        ) == [("vendor_b.lib", 19, "from . import util\n", ["vendor_b.util"], [])]
+
+        # デフォルトでは重複を除かずに全てのファイルを構文解析する
+        parsed_sources.clear()
+        SourceCodeCollector(root_path=project_root).collect(project_root)
+        assert len(parsed_sources) == len(collection)
+
+    def test_collect_with_read_concurrency(self, project_root: Path, slow_filesystem):
+        for i in range(10):
+            write_file(project_root / "many" / f"mod{i}.py", f"import foo.sub{i}\n")
+
+        serial = SourceCodeCollector(root_path=project_root).collect(project_root)
+        assert slow_filesystem["max"] == 1
+
+        collector = SourceCodeCollector(root_path=project_root, read_concurrency=4)
+        concurrent = collector.collect(project_root)
+        files = collector.collect_files(
+            [project_root / "main.py", project_root / "many" / "mod1.py"]
+        )
+
+        assert summarize(concurrent) == summarize(serial)
+        assert [str(code.module_path) for code in files] == ["main", "many.mod1"]
+        assert 1 < slow_filesystem["max"] <= 4
+
+    def test_collect_with_read_concurrency_and_errors(self, project_root: Path):
+        collector = SourceCodeCollector(root_path=project_root, read_concurrency=4)
+        errors = CollectErrorReport()
+
+        collection = collector.collect_files(
+            [project_root / "missing.py", project_root / "main.py"], errors=errors
+        )
+
+        assert [str(code.module_path) for code in collection] == ["main"]
+        assert [(e.path, e.phase) for e in errors] == [
+            (str(project_root / "missing.py"), CollectPhase.READ)
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_collect_with_shard(self, project_root: Path, workers: int):
+        def collect(shard):
+            collector = SourceCodeCollector(root_path=project_root, shard=shard)
+            return [
+                str(code.module_path)
+                for code in collector.collect(project_root, workers=workers)
+            ]
+
+        all_modules = collect(None)
+        sharded = [collect(Shard(index=i, count=3)) for i in range(1, 4)]
+
+        # 全てのファイルがいずれか1つのシャードで収集される
+        assert sorted(sum(sharded, [])) == sorted(all_modules)
+        assert all(len(modules) < len(all_modules) for modules in sharded)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_collect_with_scope(self, project_root: Path, workers: int, monkeypatch):
+        opened = []
+        read_bytes = Path.read_bytes
+
+        def spy(self):
+            opened.append(self.name if self.name != "__init__.py" else self.parent.name)
+            return read_bytes(self)
+
+        if workers == 1:
+            monkeypatch.setattr(Path, "read_bytes", spy)
+
+        collector = SourceCodeCollector(
+            root_path=project_root,
+            scope=ModuleScope.build(includes=["foo", "main"], excludes=["foo.sub"]),
+        )
+        # 範囲を指定しても、コレクターは値としてハッシュできる
+        assert hash(collector) == hash(dataclasses.replace(collector))
+        external_modules = []
+        collection = collector.collect(
+            project_root, workers=workers, external_modules=external_modules
+        )
+
+        assert [str(code.module_path) for code in collection] == ["main", "foo"]
+        assert sorted(str(p) for p in external_modules) == ["bar", "bar.baz", "foo.sub"]
+
+        # 範囲外のファイルは読み込まない
+        if workers == 1:
+            assert opened == ["main.py", "foo"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_collect_lazy(self, project_root: Path, workers: int, monkeypatch):
+        opened = []
+        read_bytes = Path.read_bytes
+
+        def spy(self):
+            opened.append(self.name)
+            return read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", spy)
+
+        collection = SourceCodeCollector(root_path=project_root, lazy=True).collect(
+            project_root, workers=workers
+        )
+
+        # モジュールの一覧と、パスでの検索ではファイルを読み込まない
+        assert [str(code.module_path) for code in collection] == [
+            "main",
+            "bar",
+            "bar.baz",
+            "foo",
+            "foo.sub",
+        ]
+        assert collection.get_by_relative_path("foo/sub.py") is not None
+        assert opened == []
+
+        monkeypatch.undo()
+        eager = SourceCodeCollector(root_path=project_root).collect(project_root)
+        assert summarize(collection) == summarize(eager)
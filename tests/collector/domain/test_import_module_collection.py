@@ -1,7 +1,10 @@
 from pathlib import Path
 
 from jig.collector.domain.values.import_path import ImportPath
-from jig.collector.domain.values.import_path_collection import ImportPathCollection
+from jig.collector.domain.values.import_path_collection import (
+    ImportPathCollection,
+    ImportPathCollectionBuilder,
+)
 from jig.collector.domain.source_file.source_file_path import SourceFilePath
 from .helper import parse_import_from, parse_import
 
@@ -113,3 +116,35 @@ class TestImportModuleCollectionBuildByImportAST:
 
         import_modules = ImportPathCollection.build_by_import_ast(import_ast)
         assert import_modules == mod_collections("os", "datetime.datetime")
+
+
+class TestImportPathCollectionBuilder:
+    def test_build(self):
+        builder = ImportPathCollectionBuilder()
+        builder.extend(mod_collections("os", "sys"))
+        builder.add(ImportPath.from_str("os"))
+
+        assert len(builder) == 3
+        assert ImportPath.from_str("sys") in builder
+        assert builder.build() == mod_collections("os", "sys", "os")
+
+    def test_build_with_deduplicate(self):
+        builder = ImportPathCollectionBuilder(deduplicate=True)
+        builder.extend(mod_collections("sys", "os", "sys", "os.path", "os"))
+
+        collection = builder.build()
+
+        # 最初に追加した順序を保つ
+        assert collection == mod_collections("sys", "os", "os.path")
+        assert ImportPath.from_str("os.path") in collection
+        assert ImportPath.from_str("os.environ") not in collection
+
+    def test_build_is_independent_of_later_additions(self):
+        builder = ImportPathCollectionBuilder()
+        builder.add(ImportPath.from_str("os"))
+        collection = builder.build()
+
+        builder.add(ImportPath.from_str("sys"))
+
+        assert collection == mod_collections("os")
+        assert ImportPath.from_str("sys") not in collection
@@ -1,3 +1,4 @@
+from jig.collector.domain.values.module_path import ModulePath
 from jig.collector.domain.values.import_path import ImportPath
 
 
@@ -43,3 +44,13 @@ class TestImportPath:
         assert path("aaa.bbb.ccc").path_in_depth(2) == path("aaa.bbb")
         assert path("aaa.bbb.ccc").path_in_depth(3) == path("aaa.bbb.ccc")
         assert path("aaa.bbb.ccc").path_in_depth(4) == path("aaa.bbb.ccc")
+
+    def test_interned(self):
+        p = path("aaa.bbb")
+
+        assert path("aaa").join("bbb") is p
+        assert ImportPath.from_names(["aaa", "bbb"]) is p
+        assert ImportPath(names=["aaa", "bbb"]) == p
+
+        # 名前が同じでも ModulePath とは区別する
+        assert ModulePath.from_str("aaa.bbb") != p
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from jig.collector.domain.source_code.lazy_source_code import LazySourceCode
+from jig.collector.domain.source_code.source_code import SourceCode
+from jig.collector.domain.source_code.source_code_collection import SourceCodeCollection
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+
+
+def build_lazy_source_code(path: str, content: str, loaded: list) -> LazySourceCode:
+    source_file_path = SourceFilePath(
+        root_path=Path("/root"), file_path=Path("/root", path)
+    )
+
+    def load() -> SourceCode:
+        loaded.append(path)
+        return SourceCode.build(
+            SourceFile(
+                source_file_path=source_file_path, size=len(content), content=content
+            )
+        )
+
+    return LazySourceCode(source_file_path, load=load)
+
+
+class TestLazySourceCode:
+    def test_module_path_without_loading(self):
+        loaded: list = []
+        source_code = build_lazy_source_code("foo/bar.py", "import os\n", loaded)
+
+        assert str(source_code.module_path) == "foo.bar"
+        assert source_code.source_file_path.file_path == Path("/root/foo/bar.py")
+        assert not source_code.is_loaded
+        assert loaded == []
+
+    def test_load_on_first_access(self):
+        loaded: list = []
+        content = "from . import util\nclass Bar:\n    pass\n"
+        source_code = build_lazy_source_code("foo/bar.py", content, loaded)
+
+        assert [str(p) for p in source_code.import_paths] == ["foo.util"]
+        assert [c.name for c in source_code.class_defs] == ["Bar"]
+        assert source_code.file.content == content
+        assert (
+            str(source_code.build_import_dependency().source_module_path) == "foo.bar"
+        )
+
+        # 読み込みは1回だけ
+        assert source_code.is_loaded
+        assert loaded == ["foo/bar.py"]
+
+    def test_load_error(self):
+        loaded: list = []
+        source_code = build_lazy_source_code("foo/bar.py", "import\n", loaded)
+
+        with pytest.raises(SyntaxError):
+            source_code.import_paths
+
+        assert not source_code.is_loaded
+
+    def test_unknown_attribute(self):
+        source_code = build_lazy_source_code("foo/bar.py", "", [])
+
+        with pytest.raises(AttributeError):
+            source_code.unknown
+
+    def test_get_by_relative_path(self):
+        loaded: list = []
+        collection = SourceCodeCollection(
+            [
+                build_lazy_source_code("main.py", "import foo\n", loaded),
+                build_lazy_source_code("foo/__init__.py", "", loaded),
+            ]
+        )
+
+        foo = collection.get_by_relative_path("foo/__init__.py")
+
+        assert foo is not None
+        assert str(foo.module_path) == "foo"
+        assert loaded == []
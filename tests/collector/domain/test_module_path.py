@@ -1,3 +1,6 @@
+import gc
+import pickle
+
 import pytest
 
 from jig.collector.domain.values.module_path import ModulePath
@@ -51,3 +54,45 @@ class TestModulePath:
 
         with pytest.raises(ValueError, match="least one element"):
             mod("aaa").parent()
+
+    def test_names_are_immutable(self):
+        p = ModulePath(names=["aaa", "bbb"])
+
+        assert p.names == ("aaa", "bbb")
+        with pytest.raises(ValueError):
+            ModulePath(names=["aaa.bbb"])
+        with pytest.raises(ValueError):
+            mod("aaa").join("bbb.ccc")
+
+    def test_interned(self):
+        p = mod("aaa.bbb.ccc")
+
+        # 文字列やパスの操作から得られる同じパスは同じオブジェクト
+        assert mod("aaa.bbb.ccc") is p
+        assert mod("aaa.bbb").join("ccc") is p
+        assert p.join("ddd").parent() is p
+        assert mod("aaa.bbb.ccc.ddd").path_in_depth(3) is p
+        assert ModulePath.build(["aaa", "bbb", "ccc"]) is p
+
+        # 直接生成したパスとも等しく、同じハッシュ値を持つ
+        q = ModulePath(names=["aaa", "bbb", "ccc"])
+        assert q == p
+        assert {p: 1}[q] == 1
+
+    def test_interned_path_is_released(self):
+        p = mod("unused.module.path")
+        assert "unused.module.path" in ModulePath._interned
+
+        # どこからも参照されなくなったパスは共有をやめて解放する
+        del p
+        gc.collect()
+        assert "unused.module.path" not in ModulePath._interned
+
+    def test_pickle(self):
+        p = mod("aaa.bbb")
+
+        restored = pickle.loads(pickle.dumps(p))
+
+        assert restored == p
+        assert str(restored) == "aaa.bbb"
+        assert hash(restored) == hash(p)
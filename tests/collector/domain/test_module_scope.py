@@ -0,0 +1,69 @@
+import pytest
+
+from jig.collector.domain.values.module_path import ModulePath
+from jig.collector.domain.values.module_scope import ModuleScope
+
+
+def contains(scope: ModuleScope, path: str) -> bool:
+    return scope.contains(ModulePath.from_str(path))
+
+
+class TestModuleScope:
+    def test_empty(self):
+        scope = ModuleScope.build()
+
+        assert contains(scope, "jig")
+        assert contains(scope, "jig.collector")
+
+    def test_includes(self):
+        scope = ModuleScope.build(includes=["jig.collector", "tests"])
+
+        assert contains(scope, "jig.collector")
+        assert contains(scope, "jig.collector.domain.ast")
+        assert contains(scope, "tests.collector")
+        assert not contains(scope, "jig")
+        assert not contains(scope, "jig.analyzer")
+        assert not contains(scope, "jig.collectors")
+
+    def test_excludes(self):
+        scope = ModuleScope.build(excludes=["jig.visualizer"])
+
+        assert contains(scope, "jig")
+        assert contains(scope, "jig.collector")
+        assert not contains(scope, "jig.visualizer")
+        assert not contains(scope, "jig.visualizer.application")
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("jig", False),
+            ("jig.collector", True),
+            ("jig.collector.domain", False),
+            ("jig.collector.domain.ast", False),
+            ("jig.collector.domain.values", True),
+            ("jig.collector.domain.values.shard", True),
+        ],
+    )
+    def test_longest_prefix(self, path: str, expected: bool):
+        scope = ModuleScope.build(
+            includes=["jig.collector", "jig.collector.domain.values"],
+            excludes=["jig.collector.domain"],
+        )
+
+        assert contains(scope, path) is expected
+
+    def test_exclude_overrides_same_include(self):
+        scope = ModuleScope.build(includes=["jig"], excludes=["jig"])
+
+        assert not contains(scope, "jig")
+
+    def test_value_equality(self):
+        scope = ModuleScope.build(includes=["jig", "tests"], excludes=["jig.cli"])
+        same = ModuleScope.build(includes=["tests", "jig", "jig"], excludes=["jig.cli"])
+        other = ModuleScope.build(includes=["jig"], excludes=["jig.cli"])
+
+        # 指定の順序や重複によらず、同じ範囲は等しくハッシュ値も一致する
+        assert scope == same
+        assert hash(scope) == hash(same)
+        assert scope != other
+        assert len({scope, same, other}) == 2
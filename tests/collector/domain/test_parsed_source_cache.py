@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from jig.collector.domain.ast import JigSourceCode
+from jig.collector.domain.source_code.parsed_source_cache import ParsedSourceCache
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+
+
+def build_file(path: str, content: str) -> SourceFile:
+    return SourceFile(
+        source_file_path=SourceFilePath(
+            root_path=Path("/root"), file_path=Path("/root", path)
+        ),
+        size=len(content),
+        content=content,
+    )
+
+
+@pytest.fixture
+def parsed_sources(monkeypatch):
+    sources = []
+    build = JigSourceCode.build
+
+    def spy(cls, source, filename, *args, **kwargs):
+        sources.append(source)
+        return build(source, filename, *args, **kwargs)
+
+    monkeypatch.setattr(JigSourceCode, "build", classmethod(spy))
+
+    return sources
+
+
+class TestParsedSourceCache:
+    def test_build(self, parsed_sources):
+        cache = ParsedSourceCache()
+        content = "from . import util\nimport os\n"
+
+        a = cache.build(build_file("vendor_a/lib.py", content))
+        b = cache.build(build_file("vendor_b/lib.py", content))
+        c = cache.build(build_file("main.py", "import os\n"))
+
+        # 内容が同じファイルは1回だけ構文解析する
+        assert parsed_sources == [content, "import os\n"]
+
+        # 相対インポートはファイルごとに解決する
+        assert sorted(str(p) for p in a.import_paths) == ["os", "vendor_a.util"]
+        assert sorted(str(p) for p in b.import_paths) == ["os", "vendor_b.util"]
+        assert [str(p) for p in c.import_paths] == ["os"]
+
+    def test_build_keeps_no_ast(self):
+        cache = ParsedSourceCache()
+        content = "class Main:\n    pass\n"
+
+        a = cache.build(build_file("a.py", content))
+        b = cache.build(build_file("b.py", content))
+
+        # 最初に構文解析したファイルの結果だけがASTを参照し、保持している結果はASTを参照しない
+        assert a.class_defs[0]._ast is not None
+        assert [class_def.name for class_def in b.class_defs] == ["Main"]
+        assert b.class_defs[0]._ast is None
+        assert all(
+            class_def._ast is None
+            for parsed in cache._parsed.values()
+            for class_def in parsed.class_defs
+        )
+
+    def test_build_discarded_content(self):
+        file = build_file("main.py", "").without_content()
+
+        with pytest.raises(ValueError):
+            ParsedSourceCache().build(file)
@@ -0,0 +1,28 @@
+import pytest
+
+from jig.collector.domain.values.shard import Shard
+
+
+class TestShard:
+    def test_from_str(self):
+        assert Shard.from_str("2/4") == Shard(index=2, count=4)
+        assert str(Shard(index=2, count=4)) == "2/4"
+
+    @pytest.mark.parametrize("value", ["", "1", "1/", "a/4", "0/4", "5/4", "1/0"])
+    def test_from_invalid_str(self, value: str):
+        with pytest.raises(ValueError):
+            Shard.from_str(value)
+
+    def test_contains(self):
+        paths = [f"pkg{i}/mod{j}.py" for i in range(10) for j in range(10)]
+        shards = [Shard(index=index, count=4) for index in range(1, 5)]
+
+        # 全てのファイルがいずれか1つのシャードに含まれる
+        for path in paths:
+            assert sum(shard.contains(path) for shard in shards) == 1
+
+        # どのシャードにもファイルが割り当てられる
+        for shard in shards:
+            assert any(shard.contains(path) for path in paths)
+
+        assert all(Shard(index=1, count=1).contains(path) for path in paths)
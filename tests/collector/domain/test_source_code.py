@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from jig.collector.domain.source_code.source_code_import_dependency import (
     SourceCodeImportDependency,
 )
@@ -61,3 +63,104 @@ class TestSourceCode:
                 [ImportPath.from_str("os.path"), ImportPath.from_str("os.environ")]
             ),
         )
+
+    def test_without_ast_and_content(self):
+        code = SourceCode.build(
+            file=SourceFile(
+                source_file_path=SourceFilePath(
+                    root_path=Path("/root"), file_path=Path("/root/main.py")
+                ),
+                size=100,
+                content="from os import path\n\nclass Foo:\n    pass\n",
+            )
+        )
+        lean_code = code.without_ast_and_content()
+
+        assert lean_code.file.content is None
+        assert lean_code.import_paths == code.import_paths
+        assert [(c.name, c.lineno) for c in lean_code.class_defs] == [("Foo", 3)]
+        assert lean_code.class_defs[0]._ast is None
+
+        with pytest.raises(ValueError):
+            SourceCode.build(file=lean_code.file)
+
+
+def build_source_code(path: str) -> SourceCode:
+    return SourceCode.build(
+        file=SourceFile(
+            source_file_path=SourceFilePath(
+                root_path=Path("/root"), file_path=Path("/root", path)
+            ),
+            size=0,
+            content="",
+        )
+    )
+
+
+class TestSourceCodeCollection:
+    @pytest.fixture
+    def collection(self) -> SourceCodeCollection:
+        return SourceCodeCollection(
+            [
+                build_source_code(path)
+                for path in [
+                    "main.py",
+                    "jig/__init__.py",
+                    "jig/collector/__init__.py",
+                    "jig/collector/application.py",
+                    "jig/collector.py",
+                    "jig/analyzer/graph.py",
+                    "jiggy.py",
+                ]
+            ]
+        )
+
+    def test_get_by_relative_path(self, collection: SourceCodeCollection):
+        main_py = collection.get_by_relative_path("main.py")
+        assert main_py is not None
+        assert str(main_py.module_path) == "main"
+        assert collection.get_by_relative_path("unknown.py") is None
+
+        found = collection.get_by_relative_paths(
+            ["jig/analyzer/graph.py", "unknown.py", "main.py"]
+        )
+        assert [code and str(code.module_path) for code in found] == [
+            "jig.analyzer.graph",
+            None,
+            "main",
+        ]
+
+    def test_get_by_module_path(self, collection: SourceCodeCollection):
+        # 同じモジュールパスのファイルが複数ある場合は最初のもの
+        collector = collection.get_by_module_path(ModulePath.from_str("jig.collector"))
+        assert collector is not None
+        assert str(collector.source_file_path.relative_path_from_root) == (
+            "jig/collector/__init__.py"
+        )
+
+        found = collection.get_by_module_paths(
+            [ModulePath.from_str("jiggy"), ModulePath.from_str("jig.unknown")]
+        )
+        assert [code and str(code.module_path) for code in found] == ["jiggy", None]
+
+    def test_filter_by_package(self, collection: SourceCodeCollection):
+        def relative_paths(package: str):
+            return [
+                str(code.source_file_path.relative_path_from_root)
+                for code in collection.filter_by_package(ModulePath.from_str(package))
+            ]
+
+        assert relative_paths("jig.collector") == [
+            "jig/collector/__init__.py",
+            "jig/collector/application.py",
+            "jig/collector.py",
+        ]
+        assert relative_paths("jig") == [
+            "jig/__init__.py",
+            "jig/collector/__init__.py",
+            "jig/collector/application.py",
+            "jig/collector.py",
+            "jig/analyzer/graph.py",
+        ]
+        assert relative_paths("jig.analyzer") == ["jig/analyzer/graph.py"]
+        assert relative_paths("unknown") == []
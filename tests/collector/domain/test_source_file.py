@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from jig.collector.domain.source_file.lazy_source_file import LazySourceFile
 from jig.collector.domain.source_file.source_file import SourceFile
 from jig.collector.domain.source_file.source_file_path import SourceFilePath
 
@@ -17,3 +18,30 @@ class TestSourceFile:
 
         assert "this is content" not in repr(source_file)
         assert "this is content" not in str(source_file)
+
+
+class TestLazySourceFile:
+    def test_load_content_on_first_access(self):
+        loaded: list = []
+
+        def load_content() -> str:
+            loaded.append(True)
+            return "import os\n"
+
+        source_file = LazySourceFile(
+            source_file_path=SourceFilePath(
+                root_path=Path("/root"), file_path=Path("/root/foo.py")
+            ),
+            size=10,
+            load_content=load_content,
+        )
+
+        assert str(source_file.module_path) == "foo"
+        assert source_file.size == 10
+        assert not source_file.is_loaded
+        assert loaded == []
+
+        assert source_file.content == "import os\n"
+        assert source_file.content == "import os\n"
+        assert source_file.is_loaded
+        assert loaded == [True]
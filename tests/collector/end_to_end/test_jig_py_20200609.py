@@ -1,11 +1,10 @@
 import os
 import urllib.request
-import zipfile
-import io
 from pathlib import Path
-from typing import Optional
 
-from jig.collector.application import SourceCodeCollector
+from jig.collector.application.archive_source_code_collector import (
+    ArchiveSourceCodeCollector,
+)
 from jig.collector.domain.values.import_path import ImportPath
 from jig.collector.domain.values.import_path_collection import ImportPathCollection
 from jig.collector.domain.values.module_path import ModulePath
@@ -18,42 +17,24 @@ class TestJigPy20200609:
     ZIP_URL = "https://github.com/levii/jig-py/archive/e6871f13cf555b4bf1cf21b3398081b86699a8d2.zip"
 
     @classmethod
-    def download_and_setup(cls) -> Optional[str]:
-        detect_path = cls.get_code_path()
-        if detect_path:
-            return detect_path
-
-        content = urllib.request.urlopen(cls.ZIP_URL).read()
-        f = io.BytesIO()
-        f.write(content)
-        f.seek(0)
-
-        with zipfile.ZipFile(f) as zip_f:
-            zip_f.extractall(path=cls.DOWNLOAD_PATH)
-
-        return cls.get_code_path()
-
-    @classmethod
-    def get_code_path(cls) -> Optional[str]:
-        if not os.path.exists(cls.DOWNLOAD_PATH):
-            return None
-
-        directories = os.listdir(path=cls.DOWNLOAD_PATH)
-        if len(directories) == 1:
-            return os.path.join(cls.DOWNLOAD_PATH, directories[0])
-
-        return None
+    def get_archive_path(cls) -> Path:
+        return Path(cls.DOWNLOAD_PATH, "jig-py.zip")
 
     @classmethod
     def setup_class(cls):
-        cls.download_and_setup()
-        assert cls.get_code_path() is not None
+        # アーカイブは展開せずにそのまま読み込むので、zipファイルだけを保存しておく
+        archive_path = cls.get_archive_path()
+        if archive_path.exists():
+            return
+
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        content = urllib.request.urlopen(cls.ZIP_URL).read()
+        archive_path.write_bytes(content)
 
     def test_collector(self):
-        os.chdir(self.get_code_path())
-        source_code_collection = SourceCodeCollector(
-            root_path=Path(self.get_code_path())
-        ).collect(Path("jig"))
+        source_code_collection = ArchiveSourceCodeCollector(
+            archive_path=self.get_archive_path()
+        ).collect(target="jig")
         assert len(source_code_collection) == 10
         filenames = sorted(
             [
@@ -0,0 +1,97 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from jig.collector.infrastructure.git_repository import (
+    GitCatFile,
+    GitError,
+    list_blobs,
+    list_commits,
+    show_prefix,
+)
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+GIT_CONFIG = ["-c", "user.name=jig", "-c", "user.email=jig@example.com"]
+
+
+def git(repo_path: Path, *args: str) -> None:
+    command = ["git", "-C", str(repo_path)] + GIT_CONFIG + list(args)
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    git(tmp_path, "init", "-q")
+    tmp_path.joinpath("pkg").mkdir()
+    tmp_path.joinpath("pkg", "a b.py").write_text("import os\n")
+    tmp_path.joinpath("main.py").write_text("import pkg\n")
+    tmp_path.joinpath("link.py").symlink_to("main.py")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+
+    return tmp_path
+
+
+class TestListBlobs:
+    def test_list_blobs(self, repo_path: Path):
+        blobs = list_blobs(repo_path, "HEAD")
+
+        # シンボリックリンクは含まない
+        assert [(b.path, b.size) for b in blobs] == [
+            ("main.py", 11),
+            ("pkg/a b.py", 10),
+        ]
+
+    def test_list_blobs_in_path(self, repo_path: Path):
+        blobs = list_blobs(repo_path / "pkg", "HEAD", path="pkg")
+
+        assert [b.path for b in blobs] == ["pkg/a b.py"]
+
+    def test_unknown_revision(self, repo_path: Path):
+        with pytest.raises(GitError):
+            list_blobs(repo_path, "unknown")
+
+
+class TestListCommits:
+    def test_list_commits(self, repo_path: Path):
+        repo_path.joinpath("main.py").write_text("import os\n")
+        git(repo_path, "commit", "-q", "-a", "-m", "second")
+        repo_path.joinpath("main.py").write_text("")
+        git(repo_path, "commit", "-q", "-a", "-m", "third")
+
+        commits = list_commits(repo_path, "HEAD")
+        assert len(commits) == 3
+
+        # 古い順に並ぶ
+        assert list_commits(repo_path, "HEAD~2..HEAD") == commits[1:]
+        assert list_commits(repo_path, "HEAD..HEAD") == []
+
+
+class TestShowPrefix:
+    def test_show_prefix(self, repo_path: Path):
+        assert show_prefix(repo_path) == ""
+        assert show_prefix(repo_path / "pkg") == "pkg"
+
+
+class TestGitCatFile:
+    def test_read(self, repo_path: Path):
+        blobs = list_blobs(repo_path, "HEAD")
+
+        with GitCatFile(repo_path) as cat_file:
+            contents = [cat_file.read(blob.oid) for blob in blobs]
+
+        assert contents == [b"import pkg\n", b"import os\n"]
+
+    def test_read_missing_object(self, repo_path: Path):
+        with GitCatFile(repo_path) as cat_file:
+            with pytest.raises(GitError):
+                cat_file.read("0" * 40)
+
+            # プロセスは引き続き利用できる
+            assert cat_file.read("HEAD:main.py") == b"import pkg\n"
@@ -0,0 +1,69 @@
+import pytest
+
+from jig.collector.infrastructure.ignore_rules import IgnorePattern, IgnoreRules
+
+
+class TestIgnorePattern:
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "/"])
+    def test_parse_empty(self, line):
+        assert IgnorePattern.parse(line) is None
+
+    @pytest.mark.parametrize(
+        "line, path, is_dir, expected",
+        [
+            ("foo", "foo", False, True),
+            ("foo", "a/b/foo", True, True),
+            ("foo", "foobar", False, False),
+            ("*.py", "a/b.py", False, True),
+            ("*.py", "a/b.pyc", False, False),
+            ("/foo", "foo", True, True),
+            ("/foo", "a/foo", True, False),
+            ("a/foo", "a/foo", False, True),
+            ("a/foo", "b/a/foo", False, False),
+            ("build/", "build", True, True),
+            ("build/", "build", False, False),
+            ("a/*/c", "a/b/c", False, True),
+            ("a/*/c", "a/b/x/c", False, False),
+            ("a/**/c", "a/c", False, True),
+            ("a/**/c", "a/b/x/c", False, True),
+            ("**/c", "a/b/c", False, True),
+            ("a/**", "a/b/c", False, True),
+            ("file?.py", "file1.py", False, True),
+            ("file?.py", "file10.py", False, False),
+            ("file[0-9].py", "file1.py", False, True),
+            ("file[!0-9].py", "file1.py", False, False),
+            ("\\#file", "#file", False, True),
+        ],
+    )
+    def test_match(self, line, path, is_dir, expected):
+        pattern = IgnorePattern.parse(line)
+        assert pattern is not None
+        assert pattern.match(path, is_dir=is_dir) is expected
+
+
+class TestIgnoreRules:
+    def test_last_match_wins(self):
+        rules = IgnoreRules.build(["*.py", "!keep.py", "keep.py"])
+
+        assert rules.is_ignored("a/keep.py", is_dir=False)
+
+    def test_negation(self):
+        rules = IgnoreRules.build(["*.py", "!keep.py"])
+
+        assert rules.is_ignored("a/other.py", is_dir=False)
+        assert not rules.is_ignored("a/keep.py", is_dir=False)
+
+    def test_base_dir(self):
+        rules = IgnoreRules.build(["/root_only.py"]).extend(
+            ["/generated.py", "!/root_only.py"], base_dir="pkg"
+        )
+
+        assert rules.is_ignored("root_only.py", is_dir=False)
+        assert rules.is_ignored("pkg/generated.py", is_dir=False)
+        assert not rules.is_ignored("generated.py", is_dir=False)
+        assert not rules.is_ignored("pkg/root_only.py", is_dir=False)
+        assert not rules.is_ignored("pkgx/generated.py", is_dir=False)
+
+    def test_extend_by_missing_file(self, tmp_path):
+        rules = IgnoreRules()
+        assert rules.extend_by_file(tmp_path / ".gitignore") is rules
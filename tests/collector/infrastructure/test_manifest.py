@@ -0,0 +1,79 @@
+import io
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from jig.collector.infrastructure.manifest import (
+    ManifestError,
+    git_ls_files,
+    load_manifest,
+    read_manifest,
+)
+
+
+def write_file(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestReadManifest:
+    def test_read_manifest(self, tmp_path: Path):
+        lines = [
+            "# generated by CI\n",
+            "main.py\n",
+            "\n",
+            "  pkg/a.py  \n",
+            "README.md\n",
+            "/abs/b.py\n",
+        ]
+
+        assert read_manifest(lines, base_path=tmp_path) == [
+            tmp_path / "main.py",
+            tmp_path / "pkg" / "a.py",
+            Path("/abs/b.py"),
+        ]
+
+
+class TestLoadManifest:
+    def test_load_file(self, tmp_path: Path):
+        write_file(tmp_path / "manifest.txt", "main.py\npkg/a.py\n")
+
+        paths = load_manifest(str(tmp_path / "manifest.txt"), base_path=tmp_path)
+
+        assert paths == [tmp_path / "main.py", tmp_path / "pkg" / "a.py"]
+
+    def test_load_stdin(self, tmp_path: Path):
+        paths = load_manifest("-", base_path=tmp_path, stdin=io.StringIO("a.py\n"))
+
+        assert paths == [tmp_path / "a.py"]
+
+    def test_load_missing_file(self, tmp_path: Path):
+        with pytest.raises(ManifestError):
+            load_manifest(str(tmp_path / "missing.txt"), base_path=tmp_path)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestGitLsFiles:
+    def test_git_ls_files(self, tmp_path: Path):
+        write_file(tmp_path / "main.py")
+        write_file(tmp_path / "pkg" / "a b.py")
+        write_file(tmp_path / "pkg" / "data.json")
+        write_file(tmp_path / "untracked.py")
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "add", "main.py", "pkg"], check=True
+        )
+
+        assert sorted(git_ls_files(tmp_path)) == [
+            tmp_path / "main.py",
+            tmp_path / "pkg" / "a b.py",
+        ]
+        assert load_manifest("git", base_path=tmp_path / "pkg") == [
+            tmp_path / "pkg" / "a b.py"
+        ]
+
+    def test_not_a_repository(self, tmp_path: Path):
+        with pytest.raises(ManifestError):
+            git_ls_files(tmp_path)
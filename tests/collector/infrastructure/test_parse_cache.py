@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+
+from jig.collector.domain.source_code.source_code_facts import SourceCodeFacts
+from jig.collector.domain.source_file.source_file import SourceFile
+from jig.collector.domain.source_file.source_file_path import SourceFilePath
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.import_path_collection import ImportPathCollection
+from jig.collector.infrastructure.parse_cache import ParseCache
+
+
+def build_file(content: str, file_path: str = "/root/main.py") -> SourceFile:
+    return SourceFile(
+        source_file_path=SourceFilePath(
+            root_path=Path("/root"), file_path=Path(file_path)
+        ),
+        size=len(content),
+        content=content,
+    )
+
+
+FACTS = SourceCodeFacts(
+    import_paths=ImportPathCollection([ImportPath.from_str("os.path")]),
+    class_names=["Foo"],
+)
+
+
+class TestParseCache:
+    def test_store_and_load(self, tmp_path: Path):
+        cache = ParseCache(cache_dir=tmp_path)
+        file = build_file("from os import path")
+
+        assert cache.load(file, mtime_ns=1) is None
+
+        cache.store(file, mtime_ns=1, facts=FACTS)
+        assert cache.load(file, mtime_ns=1) == FACTS
+
+    def test_invalidated_by_stat_and_content(self, tmp_path: Path):
+        cache = ParseCache(cache_dir=tmp_path)
+        file = build_file("from os import path")
+        cache.store(file, mtime_ns=1, facts=FACTS)
+
+        assert cache.load(file, mtime_ns=2) is None
+        assert cache.load(build_file("from os import sep!"), mtime_ns=1) is None
+        assert cache.load(build_file("from os import walk"), mtime_ns=1) is None
+        assert cache.load(build_file("from os import path", "/root/x.py"), 1) is None
+
+    def test_prune_removes_least_recently_used(self, tmp_path: Path):
+        cache = ParseCache(cache_dir=tmp_path)
+        files = [build_file("", f"/root/file{i}.py") for i in range(3)]
+        for i, file in enumerate(files):
+            cache.store(file, mtime_ns=0, facts=FACTS)
+            entry_path = cache._entry_path(file)
+            os.utime(str(entry_path), ns=(i * 10**9, i * 10**9))
+        entry_size = cache._entry_path(files[0]).stat().st_size
+
+        # file0 を利用して最終利用日時を更新する
+        assert cache.load(files[0], mtime_ns=0) == FACTS
+
+        ParseCache(cache_dir=tmp_path, max_size=entry_size * 2).prune()
+
+        assert cache.load(files[0], mtime_ns=0) == FACTS
+        assert cache.load(files[1], mtime_ns=0) is None
+        assert cache.load(files[2], mtime_ns=0) == FACTS
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from jig.collector.infrastructure.prefetch import PREFETCH_FACTOR, prefetch
+
+
+class InFlightCounter:
+    """同時に実行されている処理の数の最大値を記録する"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.max = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.max = max(self.max, self.current)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        with self._lock:
+            self.current -= 1
+
+
+class TestPrefetch:
+    def test_prefetch(self):
+        counter = InFlightCounter()
+
+        def fetch(item: int) -> int:
+            with counter:
+                time.sleep(0.01)
+                return item * 2
+
+        results = [
+            (item, future.result())
+            for item, future in prefetch(range(20), fetch=fetch, concurrency=4)
+        ]
+
+        # 入力の順に返す
+        assert results == [(i, i * 2) for i in range(20)]
+        assert 1 < counter.max <= 4
+
+    def test_prefetch_bounds_pending_items(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        iterator = prefetch(items(), fetch=lambda i: i, concurrency=2)
+        next(iterator)
+
+        # 必要になった分だけ items から取り出す
+        assert len(consumed) == 2 * PREFETCH_FACTOR
+        iterator.close()
+
+    def test_prefetch_error(self):
+        def fetch(item: int) -> int:
+            if item == 1:
+                raise OSError("cannot read")
+            return item
+
+        results = []
+        for item, future in prefetch(range(3), fetch=fetch, concurrency=2):
+            try:
+                results.append(future.result())
+            except OSError:
+                results.append(None)
+
+        # 例外は Future.result() で送出され、残りの要素の処理は続く
+        assert results == [0, None, 2]
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            list(prefetch([1], fetch=lambda i: i, concurrency=0))
@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+from jig.collector.infrastructure.source_file_walker import SourceFileWalker
+
+
+def write_file(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def walk(walker: SourceFileWalker, root: Path):
+    return [
+        walked_file.path.relative_to(root).as_posix()
+        for walked_file in walker.walk(root)
+    ]
+
+
+class TestSourceFileWalker:
+    def test_walk(self, tmp_path: Path):
+        write_file(tmp_path / "main.py")
+        write_file(tmp_path / "README.md")
+        write_file(tmp_path / "setup.cfg.py")
+        write_file(tmp_path / "pkg" / "__init__.py")
+        write_file(tmp_path / "pkg" / "b.py")
+        write_file(tmp_path / "pkg" / "a.py")
+        write_file(tmp_path / "pkg" / "sub" / "c.py")
+        write_file(tmp_path / "pkg" / "__pycache__" / "a.py")
+        write_file(tmp_path / "invalid.dir" / "skip.py")
+        write_file(tmp_path / ".git" / "hooks" / "hook.py")
+        write_file(tmp_path / "venv" / "lib" / "site.py")
+        write_file(tmp_path / "node_modules" / "x" / "y.py")
+        write_file(tmp_path / "build" / "lib" / "pkg.py")
+
+        assert walk(SourceFileWalker(), tmp_path) == [
+            "main.py",
+            "pkg/__init__.py",
+            "pkg/a.py",
+            "pkg/b.py",
+            "pkg/sub/c.py",
+        ]
+
+    def test_walk_nested_build_package(self, tmp_path: Path):
+        # ルート直下以外の build, dist, venv はパッケージとして走査する
+        write_file(tmp_path / "build" / "lib" / "pkg.py")
+        write_file(tmp_path / "mypkg" / "__init__.py")
+        write_file(tmp_path / "mypkg" / "build" / "__init__.py")
+        write_file(tmp_path / "mypkg" / "build" / "steps.py")
+        write_file(tmp_path / "mypkg" / "dist" / "release.py")
+        write_file(tmp_path / "mypkg" / "venv" / "env.py")
+
+        assert walk(SourceFileWalker(), tmp_path) == [
+            "mypkg/__init__.py",
+            "mypkg/build/__init__.py",
+            "mypkg/build/steps.py",
+            "mypkg/dist/release.py",
+            "mypkg/venv/env.py",
+        ]
+
+    def test_walk_reuses_stat(self, tmp_path: Path):
+        write_file(tmp_path / "main.py", "import os\n")
+
+        [walked_file] = list(SourceFileWalker().walk(tmp_path))
+        stat = os.stat(str(tmp_path / "main.py"))
+
+        assert walked_file.size == stat.st_size
+        assert walked_file.mtime_ns == stat.st_mtime_ns
+
+    def test_walk_with_excludes(self, tmp_path: Path):
+        write_file(tmp_path / "main.py")
+        write_file(tmp_path / "tests" / "test_main.py")
+        write_file(tmp_path / "pkg" / "tests" / "test_pkg.py")
+        write_file(tmp_path / "pkg" / "gen_pb2.py")
+        write_file(tmp_path / "venv" / "site.py")
+
+        walker = SourceFileWalker(excludes=("/tests/", "*_pb2.py"))
+
+        assert walk(walker, tmp_path) == [
+            "main.py",
+            "pkg/tests/test_pkg.py",
+            "venv/site.py",
+        ]
+
+    def test_walk_with_gitignore(self, tmp_path: Path):
+        write_file(tmp_path / ".gitignore", "generated/\n*_gen.py\n!keep_gen.py\n")
+        write_file(tmp_path / "main.py")
+        write_file(tmp_path / "main_gen.py")
+        write_file(tmp_path / "keep_gen.py")
+        write_file(tmp_path / "generated" / "a.py")
+        write_file(tmp_path / "pkg" / ".gitignore", "/local.py\n")
+        write_file(tmp_path / "pkg" / "local.py")
+        write_file(tmp_path / "pkg" / "sub" / "local.py")
+
+        assert walk(SourceFileWalker(), tmp_path) == [
+            "keep_gen.py",
+            "main.py",
+            "pkg/sub/local.py",
+        ]
+        assert "generated/a.py" in walk(SourceFileWalker(use_gitignore=False), tmp_path)
+
+    def test_walk_does_not_follow_directory_symlinks(self, tmp_path: Path):
+        write_file(tmp_path / "pkg" / "a.py")
+        os.symlink(str(tmp_path / "pkg"), str(tmp_path / "link"))
+
+        assert walk(SourceFileWalker(), tmp_path) == ["pkg/a.py"]
@@ -0,0 +1,188 @@
+import argparse
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from jig.collector.domain.ast import JigAST
+from jig.collector.domain.ast import import_scanner
+
+
+def summarize_ast(source: str):
+    ast = JigAST.parse(source)
+    return (
+        [
+            ([(a.name, a.asname) for a in node.names], node.lineno)
+            for node in ast.imports()
+        ],
+        [
+            (
+                node.module,
+                [(a.name, a.asname) for a in node.names],
+                node.level,
+                node.lineno,
+            )
+            for node in ast.import_froms()
+        ],
+        [(node.name, node.lineno) for node in ast.class_defs()],
+    )
+
+
+def summarize_scan(source: str):
+    jig_source_code = import_scanner.scan(source)
+    assert jig_source_code is not None
+    return (
+        [
+            ([(a.name, a.asname) for a in node.names], node.lineno)
+            for node in jig_source_code.imports
+        ],
+        [
+            (
+                node.module,
+                [(a.name, a.asname) for a in node.names],
+                node.level,
+                node.lineno,
+            )
+            for node in jig_source_code.import_froms
+        ],
+        [(node.name, node.lineno) for node in jig_source_code.class_defs],
+    )
+
+
+SOURCES = [
+    "import os\n",
+    "import os.path, sys as system\n",
+    "from typing import Optional, List as L\n",
+    "from typing import *\n",
+    "from . import foo\n",
+    "from ...foo.bar import baz\n",
+    "from .... import foo\n",
+    "from typing import (\n    Optional,\n    List,  # comment\n)\n",
+    "from typing import (Optional as O, List)\n",
+    "from typing \\\n    import Optional\n",
+    "import os; import sys\n",
+    "x = 1; from os import path\n",
+    "if True: import os\n",
+    "def f():\n    import os\n\n    class Local:\n        import sys\n",
+    "try:\n    import ujson as json\nexcept ImportError:\n    import json\n",
+    "class A:\n    class B:\n        pass\n\n    def f(self):\n        class C:\n"
+    "            pass\n",
+    "class A(\n    object,\n):\n    from os import path\n\n\nclass B: pass\n",
+    '"""\nimport os\n"""\ntext = "from os import path"\n# import sys\n',
+    "value = dict(\n    import_=1,\n)\nfrom_ = 1\n",
+    "@decorator\nclass A:\n    pass\n",
+    "async def f():\n    import os\n",
+    "x = 1\n",
+    "import os\n\n\ndef f():\n    return (\n        1,\n    )\n",
+    "x = \"import os\" 'class A' \"\"\"\nclass B:\n\"\"\" '''\nfrom a import b\n'''\n",
+    "s = \"\\\"import os\"\nt = '\\'class A'\nimport sys\n",
+    'x = f"{y!r} import {z}"\nb = rb"from a import b"\n',
+    "subclass = issubclass\nmetaclass = 1\nreimport = 1\nx.import_ = 1\n",
+    "x = 1; from os import path; import sys\n",
+    "from . import (a as b,)\nfrom a import b as c, d\n",
+    "raise ValueError() from None\n",
+    'def f() -> "A":\n    """\n    import os\n    """\n\n\nclass A:\n    pass\n',
+    "x = ['a', 'b',\n     'c']\ny = ''\nimport os\n",
+    "import os\r\nclass A:\r\n    class B:\r\n        pass\r\n",
+    "class A:\n\tclass B:\n\t\tpass\n",
+    "class A:\n    class B:\n        pass\nx = 1\n\nclass C:\n    class D:\n        pass\n",
+    "class A:\n    pass\nif True:\n    class B:\n        pass\n",
+    "class A:\n    x = 1 + \\\n2\n\n    class B:\n        pass\n",
+    "class A:\n    x = (\n        1,\n    )\n    class B:\n        pass\n",
+    "@decorator\ndef f():\n    pass\n\n\nclass A:\n    pass\n",
+    "@decorator(\n    1,\n)\n# comment\n@other\nclass A:\n    @property\n    def f(self):\n"
+    "        pass\n",
+    "class A:\n    @decorator\n    class B:\n        pass\n",
+]
+
+# import文とクラス定義の行以外に構文エラーがあるソースコードと、抽出する import文のモジュール名
+INVALID_SOURCES = [
+    ("x = 1 +\nimport os\n", ["os"]),
+    ("import os\nx = 1 +\n", ["os"]),
+    ("import os\nif True:\nx = 1\n", ["os"]),
+    ("import os\nprint 'hello'\n", ["os"]),
+    ("import os\n  import sys\n", ["os", "sys"]),
+    ("import os\nreturn os\n", ["os"]),
+    ("x = (\n", []),
+]
+
+# import文の構文エラーや閉じていない文字列リテラルなど、確実に解析できないソースコード
+UNSUPPORTED_SOURCES = [
+    "from os import (path\n",
+    "from import os\n",
+    "import os +\n",
+    "from os import path, \\\n    sep if True else sep\n",
+    'x = """\nimport os\n',
+    "x = 'abc\nimport os\n",
+]
+
+JIG_SOURCE_FILES = sorted(Path(__file__).parents[3].joinpath("jig").glob("**/*.py"))
+
+# 実行中のPythonの標準ライブラリのうち、大きなモジュールとパッケージ
+STDLIB_PATH = Path(argparse.__file__).parent
+STDLIB_SOURCE_FILES = [
+    STDLIB_PATH / "typing.py",
+    STDLIB_PATH / "argparse.py",
+    STDLIB_PATH / "_pydecimal.py",
+    *sorted(STDLIB_PATH.joinpath("email").glob("*.py")),
+    *sorted(STDLIB_PATH.joinpath("asyncio").glob("*.py")),
+]
+
+
+class TestImportScanner:
+    @pytest.mark.parametrize("source", SOURCES)
+    def test_same_as_ast(self, source: str):
+        assert summarize_scan(source) == summarize_ast(source)
+
+    @pytest.mark.parametrize(
+        "path", JIG_SOURCE_FILES, ids=[p.name for p in JIG_SOURCE_FILES]
+    )
+    def test_same_as_ast_for_jig_sources(self, path: Path):
+        source = path.read_text()
+        assert summarize_scan(source) == summarize_ast(source)
+
+    @pytest.mark.parametrize(
+        "path",
+        STDLIB_SOURCE_FILES,
+        ids=[str(p.relative_to(STDLIB_PATH)) for p in STDLIB_SOURCE_FILES],
+    )
+    def test_same_as_ast_for_stdlib_sources(self, path: Path):
+        source = path.read_text(encoding="utf-8")
+        assert summarize_scan(source) == summarize_ast(source)
+
+    @pytest.mark.parametrize("source, module_names", INVALID_SOURCES)
+    def test_invalid_source(self, source: str, module_names: List[str]):
+        # import文とクラス定義の行以外は解析しないので、構文エラーを検出せずに抽出する
+        jig_source_code = import_scanner.scan(source)
+
+        assert jig_source_code is not None
+        assert [a.name for i in jig_source_code.imports for a in i.names] == (
+            module_names
+        )
+
+    @pytest.mark.parametrize("source", UNSUPPORTED_SOURCES)
+    def test_unsupported_source(self, source: str):
+        assert import_scanner.scan(source) is None
+
+        # ASTで解析する場合と同じ例外を送出する
+        with pytest.raises(SyntaxError) as expected:
+            JigAST.parse(source, filename="sample.py")
+        with pytest.raises(SyntaxError) as actual:
+            import_scanner.build_jig_source_code(source, filename="sample.py")
+        assert (actual.value.msg, actual.value.lineno) == (
+            expected.value.msg,
+            expected.value.lineno,
+        )
+
+    def test_build_jig_source_code_falls_back_to_ast(self):
+        # インデントされたクラスの定義が続いているかどうかは、途中の行を解析しないと分からない
+        source = (
+            "def f():\n    class A:\n        pass\n\n    if True:\n"
+            "        class B:\n            pass\n"
+        )
+        assert import_scanner.scan(source) is None
+
+        jig_source_code = import_scanner.build_jig_source_code(
+            source, filename="sample.py"
+        )
+        assert [c.name for c in jig_source_code.class_defs] == ["A", "B"]
@@ -1,4 +1,21 @@
-from jig.collector.domain.ast import Import, ImportFrom, JigAST
+import dataclasses
+from typing import List
+
+import pytest
+
+from jig.collector.domain.ast import (
+    Import,
+    ImportFrom,
+    JigAST,
+    JigSourceCode,
+    NodeExtractor,
+)
+from jig.collector.domain.ast.parser_backend import (
+    StdlibAstParserBackend,
+    TypedAstParserBackend,
+)
+
+BACKENDS = [TypedAstParserBackend(), StdlibAstParserBackend()]
 
 
 class TestJigASTImport:
@@ -60,3 +77,128 @@ from typing import *
         assert nodes[0].module == "typing"
         assert nodes[0].names[0].name == "*"
         assert nodes[0].level == 0
+
+
+@dataclasses.dataclass
+class DecoratorExtractor(NodeExtractor):
+    name = "decorators"
+    node_types = ("FunctionDef", "ClassDef")
+
+    decorators: List[str] = dataclasses.field(default_factory=list)
+
+    def visit(self, node, ancestors):
+        for decorator in node.decorator_list:
+            if type(decorator).__name__ == "Name":
+                self.decorators.append(f"{node.name}:{decorator.id}")
+
+    def result(self):
+        return self.decorators
+
+
+@dataclasses.dataclass
+class DunderAllExtractor(NodeExtractor):
+    name = "__all__"
+    node_types = ("Assign",)
+
+    names: List[str] = dataclasses.field(default_factory=list)
+
+    def visit(self, node, ancestors):
+        # モジュール直下の代入だけを対象にする
+        if len(ancestors) != 1:
+            return
+        if not any(getattr(t, "id", None) == "__all__" for t in node.targets):
+            return
+
+        # typed_ast では Str.s、標準ライブラリの ast では Constant.value
+        self.names.extend(
+            getattr(e, "value", getattr(e, "s", None)) for e in node.value.elts
+        )
+
+    def result(self):
+        return self.names
+
+
+class TestJigASTExtract:
+    SOURCE = """
+import os
+from typing import List
+
+__all__ = ["Outer", "f"]
+
+
+@dataclass
+class Outer:
+    from os import path
+
+    class Inner:
+        pass
+
+    @staticmethod
+    def method():
+        class InMethod:
+            pass
+
+
+def f():
+    __all__ = ["ignored"]
+
+    class Local:
+        pass
+"""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_class_defs(self, backend):
+        class_defs = JigAST.parse(self.SOURCE, backend=backend).class_defs()
+
+        # クラス定義の中で定義されたクラスは含まない
+        assert [c.name for c in class_defs] == ["Outer", "Local"]
+        # デコレータ付きのクラスはデコレータの行
+        assert [c.lineno for c in class_defs] == [8, 24]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_build_with_extractors(self, backend):
+        jig_source_code = JigSourceCode.build(
+            self.SOURCE,
+            filename="sample.py",
+            extractors=[DecoratorExtractor(), DunderAllExtractor()],
+            backend=backend,
+        )
+
+        assert [i.names[0].name for i in jig_source_code.imports] == ["os"]
+        assert [i.module for i in jig_source_code.import_froms] == ["typing", "os"]
+        assert [c.name for c in jig_source_code.class_defs] == ["Outer", "Local"]
+        assert jig_source_code.extras == {
+            "decorators": ["Outer:dataclass", "method:staticmethod"],
+            "__all__": ["Outer", "f"],
+        }
+        assert jig_source_code.without_ast().extras == jig_source_code.extras
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_build_walks_tree_once(self, backend, monkeypatch):
+        ast = backend.ast_module
+        tree = backend.parse(self.SOURCE, filename="sample.py")
+        node_count = sum(1 for _ in ast.walk(tree))
+
+        visited = []
+        iter_child_nodes = ast.iter_child_nodes
+
+        def counting_iter_child_nodes(node):
+            visited.append(node)
+            return iter_child_nodes(node)
+
+        monkeypatch.setattr(ast, "iter_child_nodes", counting_iter_child_nodes)
+
+        JigSourceCode.build(
+            self.SOURCE,
+            filename="sample.py",
+            extractors=[DecoratorExtractor(), DunderAllExtractor()],
+            backend=backend,
+        )
+
+        assert len(visited) == node_count
+
+    def test_duplicated_extractor_name(self):
+        with pytest.raises(ValueError):
+            JigAST.parse(self.SOURCE).extract(
+                [DecoratorExtractor(), DecoratorExtractor()]
+            )
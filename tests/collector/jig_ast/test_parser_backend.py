@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from jig.collector.domain.ast import JigSourceCode
+from jig.collector.domain.ast.parser_backend import (
+    StdlibAstParserBackend,
+    TypedAstParserBackend,
+    build_parser_backend,
+    default_parser_backend,
+)
+
+JIG_SOURCE_FILES = sorted(Path(__file__).parents[3].joinpath("jig").glob("**/*.py"))
+
+requires_feature_version = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="feature_version requires Python 3.8"
+)
+
+
+def summarize(jig_source_code: JigSourceCode):
+    return (
+        [(i.names, i.lineno) for i in jig_source_code.imports],
+        [(i.module, i.names, i.level, i.lineno) for i in jig_source_code.import_froms],
+        [(c.name, c.lineno) for c in jig_source_code.class_defs],
+    )
+
+
+class TestBuildParserBackend:
+    def test_typed_ast(self):
+        assert build_parser_backend("typed_ast") == TypedAstParserBackend()
+
+    def test_ast(self):
+        assert build_parser_backend("ast") == StdlibAstParserBackend()
+
+    @requires_feature_version
+    def test_ast_with_feature_version(self):
+        assert build_parser_backend("ast:3.7") == StdlibAstParserBackend(
+            feature_version=(3, 7)
+        )
+
+    def test_auto(self):
+        assert build_parser_backend("auto") == default_parser_backend()
+
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason="Python 3.8 or later")
+    def test_auto_prefers_stdlib_ast(self):
+        assert default_parser_backend() == StdlibAstParserBackend()
+
+    @pytest.mark.parametrize(
+        "spec", ["unknown", "typed_ast:3.7", "ast:3", "ast:three.seven"]
+    )
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            build_parser_backend(spec)
+
+
+class TestParserBackend:
+    @pytest.mark.parametrize(
+        "path", JIG_SOURCE_FILES, ids=[p.name for p in JIG_SOURCE_FILES]
+    )
+    def test_same_result(self, path: Path):
+        source = path.read_text()
+
+        typed_ast_result = JigSourceCode.build(
+            source, filename=path.name, backend=TypedAstParserBackend()
+        )
+        stdlib_ast_result = JigSourceCode.build(
+            source, filename=path.name, backend=StdlibAstParserBackend()
+        )
+
+        assert summarize(stdlib_ast_result) == summarize(typed_ast_result)
+
+    @requires_feature_version
+    def test_feature_version(self):
+        source = "import os\nif (n := 1):\n    pass\n"
+
+        backend = StdlibAstParserBackend(feature_version=(3, 8))
+        assert JigSourceCode.build(source, filename="a.py", backend=backend).imports
+
+        with pytest.raises(SyntaxError):
+            JigSourceCode.build(
+                source,
+                filename="a.py",
+                backend=StdlibAstParserBackend(feature_version=(3, 7)),
+            )
+
+        with pytest.raises(SyntaxError):
+            JigSourceCode.build(
+                source, filename="a.py", backend=TypedAstParserBackend()
+            )
@@ -0,0 +1,74 @@
+from jig.analyzer.domain.dependency.import_dependency import ImportDependencyCollection
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.collector.domain.source_code.source_code_import_dependency import (
+    SourceCodeImportDependency,
+)
+from jig.collector.domain.values.import_path import ImportPath
+from jig.collector.domain.values.module_path import ModulePath
+from jig.visualizer.application.master_graph_builder import MasterGraphBuilder
+from jig.visualizer.module_dependency.domain.model.master_graph import MasterGraph
+
+
+def dep(src: str, dest: str) -> ModuleDependency:
+    return ModuleDependency.from_str(src, dest)
+
+
+def edge_names(master_graph: MasterGraph):
+    return [(edge.tail.name, edge.head.name) for edge in master_graph]
+
+
+class TestMasterGraphBuilder:
+    def test_build(self):
+        builder = MasterGraphBuilder()
+        builder.add_dependencies(
+            [dep("a", "b"), dep("b", "c"), dep("a", "b"), dep("c", "a")]
+        )
+
+        master_graph = builder.build()
+
+        assert edge_names(master_graph) == [("a", "b"), ("b", "c"), ("c", "a")]
+        expected = MasterGraph.from_tuple_list([("a", "b"), ("b", "c"), ("c", "a")])
+        assert master_graph.to_dict() == expected.to_dict()
+
+        # モジュールごとに1つのノードを共有する
+        edges = list(master_graph)
+        assert edges[0].head is edges[1].tail
+        assert edges[0].tail is edges[2].head
+
+    def test_build_with_weight(self):
+        builder = MasterGraphBuilder()
+        builder.add_dependencies(
+            [
+                ModuleDependency.from_str("a", "b", count=3),
+                ModuleDependency.from_str("b", "c"),
+                ModuleDependency.from_str("a", "b"),
+            ]
+        )
+
+        # 同じモジュール間の依存関係の数を weight として合計する
+        edges = list(builder.build())
+        assert [edge.weight for edge in edges] == [4, 1]
+
+    def test_build_from_import_dependencies(self):
+        collection = ImportDependencyCollection.build(
+            [
+                SourceCodeImportDependency.build(
+                    source_module_path=ModulePath.from_str("main"),
+                    import_paths=[
+                        ImportPath.from_str("foo"),
+                        ImportPath.from_str("foo.Foo"),
+                        ImportPath.from_str("foo.Bar"),
+                        ImportPath.from_str("os"),
+                    ],
+                ),
+                SourceCodeImportDependency.build(
+                    source_module_path=ModulePath.from_str("foo"),
+                    import_paths=[],
+                ),
+            ]
+        )
+
+        master_graph = MasterGraphBuilder.build_from_import_dependencies(collection)
+
+        assert edge_names(master_graph) == [("main", "foo")]
+        assert [edge.weight for edge in master_graph] == [3]
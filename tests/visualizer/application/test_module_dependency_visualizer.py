@@ -0,0 +1,36 @@
+from jig.analyzer.domain.dependency.module_dependency import ModuleDependency
+from jig.visualizer.application import ModuleDependencyVisualizer
+
+
+def dep(src: str, dest: str, count: int = 1) -> ModuleDependency:
+    return ModuleDependency.from_str(src, dest, count=count)
+
+
+class TestModuleDependencyVisualizer:
+    def test_dot_text_penwidth(self):
+        visualizer = ModuleDependencyVisualizer(
+            [dep("a.x", "b.y", count=2), dep("a.z", "b.w", count=2), dep("b", "c")]
+        )
+
+        text = visualizer.dot_text(depth=1)
+        assert '"a" -> "b" [penwidth=3.0];' in text
+        assert '"b" -> "c";' in text
+
+        text = visualizer.dot_text(depth=2)
+        assert '"a.x" -> "b.y" [penwidth=2.0];' in text
+
+    def test_update(self):
+        visualizer = ModuleDependencyVisualizer([dep("a", "b"), dep("b", "c")])
+        visualizer.dot_text(depth=1)
+
+        # エッジの太さが変わる場合も変化として扱う
+        assert visualizer.update(added=[dep("a", "b")], removed=[]) == [1]
+        assert '"a" -> "b" [penwidth=2.0];' in visualizer.dot_text(depth=1)
+
+        # 太さが上限に達していて変わらない場合は変化なし
+        assert visualizer.update(added=[dep("a", "b", count=30)], removed=[]) == [1]
+        assert visualizer.update(added=[dep("a", "b")], removed=[]) == []
+
+        assert visualizer.update(added=[], removed=[dep("a", "b", count=33)]) == [1]
+        assert '"a" -> "b"' not in visualizer.dot_text(depth=1)
+        assert visualizer.dependencies == [dep("b", "c")]
@@ -845,3 +845,71 @@ class TestGraphScenario:
                 }
             },
         }
+
+    def test_apply_master_graph_changes(self):
+        master_graph = MasterGraph.from_tuple_list(
+            [
+                ("jig.cli.main", "jig.collector.application"),
+                ("jig.collector.application", "jig.collector.domain"),
+                ("tests.collector", "jig.collector.domain"),
+            ]
+        )
+        g = Graph(master_graph=master_graph)
+        g.dig(node("jig"))
+
+        g.apply_master_graph_changes(
+            added_edges=[
+                edge("jig.analyzer.domain", "jig.collector.domain"),
+                edge("docs", "jig.cli.main"),
+            ],
+            removed_edges=[edge("tests.collector", "jig.collector.domain")],
+        )
+
+        assert g.to_dict() == {
+            "nodes": ["docs", "jig.analyzer", "jig.cli", "jig.collector"],
+            "edges": [
+                ("docs", "jig.cli"),
+                ("jig.analyzer", "jig.collector"),
+                ("jig.cli", "jig.collector"),
+            ],
+            "clusters": {
+                "jig": {
+                    "clusters": {},
+                    "nodes": ["jig.analyzer", "jig.cli", "jig.collector"],
+                }
+            },
+        }
+        assert sorted(master_graph.to_dict()["edges"]) == [
+            ("docs", "jig.cli.main"),
+            ("jig.analyzer.domain", "jig.collector.domain"),
+            ("jig.cli.main", "jig.collector.application"),
+            ("jig.collector.application", "jig.collector.domain"),
+        ]
+
+    def test_apply_master_graph_changes__remove_module(self):
+        master_graph = MasterGraph.from_tuple_list(
+            [("A.a", "B.b"), ("A.x", "B.c"), ("C", "A.a")]
+        )
+        g = Graph(master_graph=master_graph)
+
+        # A -> B のエッジは A.x -> B.c が残っているので維持される
+        g.apply_master_graph_changes(added_edges=[], removed_edges=[edge("A.a", "B.b")])
+        assert g.to_dict()["edges"] == [("A", "B"), ("C", "A")]
+
+        g.apply_master_graph_changes(
+            added_edges=[], removed_edges=[edge("A.x", "B.c"), edge("C", "A.a")]
+        )
+        assert g.to_dict() == {"nodes": [], "edges": [], "clusters": {}}
+
+    def test_apply_master_graph_changes__removed_node_is_not_restored(self):
+        master_graph = MasterGraph.from_tuple_list([("A", "B"), ("C", "B")])
+        g = Graph(master_graph=master_graph)
+        g.remove_node(node("C"))
+
+        g.apply_master_graph_changes(added_edges=[edge("C", "D")], removed_edges=[])
+
+        assert g.to_dict() == {
+            "nodes": ["A", "B", "D"],
+            "edges": [("A", "B")],
+            "clusters": {},
+        }
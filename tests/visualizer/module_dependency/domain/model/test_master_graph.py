@@ -34,6 +34,21 @@ class TestMasterGraph:
         assert master_graph.has_module(path("jig.collector.domain.source_file")) is True
         assert master_graph.has_module(path("jig.no_module")) is False
 
+    def test_list_module_paths(self):
+        master_graph = MasterGraph.from_tuple_list(
+            [("jig.cli.main", "jig.collector.application"), ("tests", "jig.cli")]
+        )
+
+        assert master_graph.list_module_paths() == {
+            path("jig"),
+            path("jig.cli"),
+            path("jig.cli.main"),
+            path("jig.collector"),
+            path("jig.collector.application"),
+            path("tests"),
+        }
+        assert path("jig.no_module") not in master_graph.list_module_paths()
+
     def test_find_node_adjacent_graph(self):
         m = MasterGraph.from_tuple_list(
             [
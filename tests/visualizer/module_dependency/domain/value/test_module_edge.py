@@ -1,7 +1,9 @@
+from jig.visualizer.module_dependency.domain.value.edge_style import EdgeStyle
 from jig.visualizer.module_dependency.domain.value.module_edge import (
     ModuleEdge,
     ModuleEdgeCollection,
 )
+from jig.visualizer.module_dependency.domain.value.penwidth import Color
 
 
 def edge(tail: str, head: str) -> ModuleEdge:
@@ -32,9 +34,43 @@ class TestModuleEdge:
         assert edge("jig.cli", "jig.cli").is_self_loop() is True
         assert edge("jig", "jig.cli").is_self_loop() is False
 
+    def test_copy_keeps_weight(self):
+        e = ModuleEdge.from_str("a.b", "x.y", weight=3)
+
+        assert e.limit_path_level(1).weight == 3
+        assert e.build_reverse().weight == 3
+        assert e.to_invisible().weight == 3
+        assert e.with_style(EdgeStyle(color=Color.Red)).weight == 3
+        assert e.reset_style().weight == 3
+
 
 class TestModuleEdgeCollection:
     def test_find_parent_edge(self):
         c = ModuleEdgeCollection([edge("a.b", "x.y")])
 
         assert c.find_parent_edge(edge("a.b", "x.y.z")) == edge("a.b", "x.y")
+
+    def test_add_merges_weight(self):
+        c = ModuleEdgeCollection([edge("a", "b")])
+
+        c.add(ModuleEdge.from_str("a", "b", weight=2))
+        c.add(edge("b", "c"))
+
+        assert list(c) == [edge("a", "b"), edge("b", "c")]
+        assert [e.weight for e in c] == [3, 1]
+
+    def test_remove_decrements_weight(self):
+        c = ModuleEdgeCollection([ModuleEdge.from_str("a", "b", weight=3)])
+
+        c.remove(edge("a", "b"))
+        assert [e.weight for e in c] == [2]
+
+        c.remove(ModuleEdge.from_str("a", "b", weight=2))
+        assert list(c) == []
+
+    def test_init_merges_same_edges(self):
+        c = ModuleEdgeCollection([edge("b", "c"), edge("a", "b"), edge("b", "c")])
+
+        # 最初に追加した順序を保ち、同じエッジは weight を合計した1本にまとめる
+        assert list(c) == [edge("b", "c"), edge("a", "b")]
+        assert [e.weight for e in c] == [2, 1]
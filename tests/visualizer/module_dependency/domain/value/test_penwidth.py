@@ -0,0 +1,11 @@
+from jig.visualizer.module_dependency.domain.value.penwidth import PenWidth
+
+
+class TestPenWidth:
+    def test_size_for_weight(self):
+        assert PenWidth.size_for_weight(1) == PenWidth.to_size(PenWidth.Normal)
+        assert PenWidth.size_for_weight(0) == "1.0"
+        assert PenWidth.size_for_weight(2) == "2.0"
+        assert PenWidth.size_for_weight(4) == "3.0"
+        assert PenWidth.size_for_weight(16) == "5.0"
+        assert PenWidth.size_for_weight(1000) == "5.0"
@@ -125,6 +125,26 @@ class TestGraphRenderer:
 
         assert str(renderer.render()) == str(g)
 
+    def test_render__with_edge_weight(self):
+        master_graph = MasterGraph.from_tuple_list([("b", "c")])
+        master_graph.add_edges([ModuleEdge.from_str("a", "b", weight=4)])
+        graph = Graph(master_graph)
+        renderer = GraphRenderer(graph=graph)
+
+        g = Digraph()
+        default_node_style = NodeStyle().to_dict()
+        g.node("a", **default_node_style)
+        g.node("b", **default_node_style)
+        g.node("c", **default_node_style)
+
+        # まとめられた依存関係の数に応じて太く描く
+        edge_style = EdgeStyle().to_dict()
+        edge_style.update({"penwidth": PenWidth.size_for_weight(4)})
+        g.edge("a", "b", **edge_style)
+        g.edge("b", "c", **EdgeStyle().to_dict())
+
+        assert str(renderer.render()) == str(g)
+
     def test_render__reset_style(self):
         master_graph = MasterGraph.from_tuple_list([("a", "b"), ("b", "c")])
         graph = Graph(master_graph)